@@ -1,20 +1,41 @@
 """
 콘텐츠 생성 API
 """
+import asyncio
+from datetime import datetime
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 from app.services.content_generation import ContentGenerationService, SlideContent
+from app.services.content_prefetch import ContentPrefetcher, SlideChangedError, TokenBudget
+from app.api.jobs import accepted_job
 from app.core.auth import get_current_user
-from app.db.memory_store import User, project_store, slide_store
+from app.core.config import settings
+from app.core.sse import format_sse, sse_response
+from app.db.memory_store import Project, Slide, User, project_store, slide_store
+from app.infrastructure.jobs import JobContext, job_manager
+from app.infrastructure.llm_provider import llm_registry
+from app.infrastructure.single_flight import SingleFlight
 
 
 router = APIRouter(prefix="/content", tags=["content"])
 
+# 슬라이드별 생성 가드 - 같은 슬라이드에 대한 생성이 동시에 두 번 실행되지 않도록 함
+slide_generation_flight = SingleFlight()
+
 
 class ContentGenerateRequest(BaseModel):
     slide_id: str
     regenerate: Optional[bool] = False  # 기존 내용을 다시 생성할지 여부
+    wait_if_running: Optional[bool] = True  # 생성 중이면 그 결과를 기다릴지 (False면 409)
+
+
+class ProjectContentGenerateRequest(BaseModel):
+    only_missing: Optional[bool] = True  # 콘텐츠가 비었거나 draft 상태인 슬라이드만 생성 (False면 전체 재생성)
+
+
+class FieldRegenerateRequest(BaseModel):
+    fields: Optional[List[str]] = None  # "as_is_points", "cases[2].description" 등 (생략 시 USER_NEEDED 항목)
 
 
 class ContentUpdateRequest(BaseModel):
@@ -29,6 +50,12 @@ class ContentResponse(BaseModel):
     user_needed_items: List[str]
     generation_notes: str
     status: str  # "ai_generated", "partial_user_input", "user_completed"
+    missing_fields: List[str] = []  # 응답이 잘려 생성되지 못한 필드 (다시 생성 필요)
+
+
+class FieldRegenerateResponse(ContentResponse):
+    regenerated_fields: List[str]
+    token_usage: Dict[str, int]  # 예상 토큰 수 - 이번 요청과 전체 재생성 비교, 절감량
 
 
 @router.post("/generate", response_model=ContentResponse)
@@ -47,6 +74,28 @@ async def generate_slide_content(
     if not project or project.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="접근 권한이 없습니다")
     
+    async def run_generation() -> ContentResponse:
+        try:
+            return await _generate_and_store(slide, project, use_cache=not request.regenerate)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"콘텐츠 생성 중 오류가 발생했습니다: {str(e)}")
+    
+    # 같은 슬라이드를 이미 생성 중이면 그 결과를 공유 (wait_if_running=False면 409)
+    if slide_generation_flight.in_flight(request.slide_id):
+        if not request.wait_if_running:
+            raise HTTPException(
+                status_code=409,
+                detail="이미 이 슬라이드의 콘텐츠를 생성하고 있습니다"
+            )
+        try:
+            return await slide_generation_flight.do(request.slide_id, run_generation)
+        except SlideChangedError:
+            # 함께 기다린 추측 생성이 그 사이 편집된 슬라이드라 결과를 버림
+            raise HTTPException(
+                status_code=409,
+                detail="생성 중에 슬라이드가 수정되어 결과를 저장하지 않았습니다. 다시 요청해주세요"
+            )
+    
     # 이미 내용이 있고 재생성이 아닌 경우
     if slide.content and not request.regenerate:
         raise HTTPException(
@@ -54,37 +103,211 @@ async def generate_slide_content(
             detail="이미 생성된 콘텐츠가 있습니다. regenerate=true로 설정하여 재생성하세요"
         )
     
-    try:
-        # 프로젝트 컨텍스트 구성
-        project_context = {
-            "topic": project.topic,
-            "target_audience": project.target_audience,
-            "goal": project.goal,
-            "title": project.title
-        }
-        
-        # 콘텐츠 생성
-        service = ContentGenerationService()
-        slide_content = await service.generate_slide_content(slide, project_context)
-        
-        # 슬라이드에 생성된 콘텐츠 저장
-        slide_store.update_slide(
-            request.slide_id,
-            content=slide_content.generated_content,
-            status="ai_generated"
-        )
-        
-        return ContentResponse(
-            slide_id=slide_content.slide_id,
-            template_type=slide_content.template_type,
-            content=slide_content.generated_content,
-            user_needed_items=slide_content.user_needed_items,
-            generation_notes=slide_content.generation_notes,
-            status="ai_generated"
+    return await slide_generation_flight.do(request.slide_id, run_generation)
+
+
+async def _generate_and_store(
+    slide: Slide, project: Project, expected_updated_at: Optional[datetime] = None, use_cache: bool = True
+) -> ContentResponse:
+    """슬라이드 콘텐츠 생성 후 저장 (대화형 생성과 추측 생성이 slide_generation_flight로 공유)
+    
+    expected_updated_at을 주면 저장 직전에 슬라이드가 그 뒤로 바뀌었거나 삭제됐는지 확인해
+    SlideChangedError로 결과를 버린다 (추측 생성이 사용자의 편집을 덮어쓰지 않도록).
+    """
+    
+    # 콘텐츠 생성
+    service = ContentGenerationService()
+    slide_content = await service.generate_slide_content(
+        slide, service.project_context(project), use_cache=use_cache
+    )
+    
+    if expected_updated_at is not None:
+        current = slide_store.get_slide(slide.id)
+        if current is None or current.updated_at != expected_updated_at:
+            raise SlideChangedError(slide.id)
+    
+    # 슬라이드에 생성된 콘텐츠 저장
+    slide_store.update_slide(
+        slide.id,
+        content=slide_content.generated_content,
+        status="ai_generated"
+    )
+    
+    return ContentResponse(
+        slide_id=slide_content.slide_id,
+        template_type=slide_content.template_type,
+        content=slide_content.generated_content,
+        user_needed_items=slide_content.user_needed_items,
+        generation_notes=slide_content.generation_notes,
+        status="ai_generated",
+        missing_fields=slide_content.missing_fields
+    )
+
+
+# 스토리라인으로 만든 슬라이드의 콘텐츠 추측 생성 (StorylineRequest.prefetch_content)
+content_prefetcher = ContentPrefetcher(
+    flight=slide_generation_flight,
+    generate=_generate_and_store,
+    concurrency=settings.CONTENT_PREFETCH_CONCURRENCY,
+    budget=TokenBudget(
+        limit=settings.CONTENT_PREFETCH_TOKEN_BUDGET,
+        window=settings.CONTENT_PREFETCH_BUDGET_WINDOW_SECONDS
+    ),
+    is_busy=llm_registry.upstream_busy
+)
+
+
+@router.post("/generate/stream")
+async def generate_slide_content_stream(
+    request: ContentGenerateRequest,
+    current_user: User = Depends(get_current_user)
+):
+    """슬라이드 콘텐츠 생성 (SSE) - token 이벤트로 생성 중인 텍스트를, field 이벤트로 완성된 필드를, result 이벤트로 최종 결과를 전송"""
+    
+    # 슬라이드 조회 및 권한 확인
+    slide = slide_store.get_slide(request.slide_id)
+    if not slide:
+        raise HTTPException(status_code=404, detail="슬라이드를 찾을 수 없습니다")
+    
+    project = project_store.get_project(slide.project_id)
+    if not project or project.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="접근 권한이 없습니다")
+    
+    # 진행 중인 생성의 토큰 스트림은 공유할 수 없으므로 409
+    if slide_generation_flight.in_flight(request.slide_id):
+        raise HTTPException(status_code=409, detail="이미 이 슬라이드의 콘텐츠를 생성하고 있습니다")
+    
+    if slide.content and not request.regenerate:
+        raise HTTPException(
+            status_code=400, 
+            detail="이미 생성된 콘텐츠가 있습니다. regenerate=true로 설정하여 재생성하세요"
         )
+    
+    project_context = ContentGenerationService.project_context(project)
+    # (이벤트 이름, 데이터) - None이면 생성 종료
+    events: "asyncio.Queue" = asyncio.Queue()
+    
+    async def run_generation() -> ContentResponse:
+        # 슬라이드 가드 안에서 실행 - 동시에 들어온 일반 생성 요청은 이 결과를 공유
+        try:
+            service = ContentGenerationService()
+            slide_content = None
+            async for kind, payload in service.stream_slide_content(
+                slide, project_context, use_cache=not request.regenerate
+            ):
+                if kind == "token":
+                    events.put_nowait(("token", {"text": payload}))
+                elif kind == "field":
+                    events.put_nowait(("field", payload))
+                else:
+                    slide_content = payload
+            
+            slide_store.update_slide(
+                request.slide_id,
+                content=slide_content.generated_content,
+                status="ai_generated"
+            )
+            
+            return ContentResponse(
+                slide_id=slide_content.slide_id,
+                template_type=slide_content.template_type,
+                content=slide_content.generated_content,
+                user_needed_items=slide_content.user_needed_items,
+                generation_notes=slide_content.generation_notes,
+                status="ai_generated",
+                missing_fields=slide_content.missing_fields
+            )
+        finally:
+            events.put_nowait(None)
+    
+    # 확인과 선점 사이에 await가 없어야 다른 생성 요청이 끼어들지 않음
+    runner = slide_generation_flight.submit(request.slide_id, run_generation)
+    
+    async def event_stream():
+        getter = None
+        try:
+            while True:
+                if events.empty():
+                    # 이 요청의 큐에 종료 신호가 오지 않고 작업이 끝나도 멈추지 않도록 runner도 함께 대기
+                    if runner.done():
+                        break
+                    getter = asyncio.ensure_future(events.get())
+                    await asyncio.wait({getter, runner}, return_when=asyncio.FIRST_COMPLETED)
+                    if not getter.done():
+                        getter.cancel()
+                        continue
+                    item = getter.result()
+                else:
+                    item = events.get_nowait()
+                if item is None:
+                    break
+                yield format_sse(*item)
+        finally:
+            if getter is not None:
+                getter.cancel()
         
+        try:
+            response = await asyncio.shield(runner)
+            yield format_sse("result", response.model_dump())
+        except Exception as e:
+            yield format_sse("error", {"detail": f"콘텐츠 생성 중 오류가 발생했습니다: {str(e)}"})
+    
+    return sse_response(event_stream())
+
+
+@router.post("/{slide_id}/regenerate-fields", response_model=FieldRegenerateResponse)
+async def regenerate_slide_fields(
+    slide_id: str,
+    request: FieldRegenerateRequest,
+    current_user: User = Depends(get_current_user)
+):
+    """지정한 필드만 다시 생성해 기존 콘텐츠에 병합 (나머지 필드는 그대로 유지)"""
+    
+    # 슬라이드 조회 및 권한 확인
+    slide = slide_store.get_slide(slide_id)
+    if not slide:
+        raise HTTPException(status_code=404, detail="슬라이드를 찾을 수 없습니다")
+    
+    project = project_store.get_project(slide.project_id)
+    if not project or project.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="접근 권한이 없습니다")
+    
+    if not slide.content:
+        raise HTTPException(status_code=400, detail="생성된 콘텐츠가 없습니다. 먼저 콘텐츠를 생성해주세요")
+    
+    # 전체 생성 중에 일부만 병합하면 결과가 덮어써지므로 409
+    if slide_generation_flight.in_flight(slide_id):
+        raise HTTPException(status_code=409, detail="이미 이 슬라이드의 콘텐츠를 생성하고 있습니다")
+    
+    service = ContentGenerationService()
+    try:
+        result = await service.regenerate_fields(slide, service.project_context(project), request.fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"콘텐츠 생성 중 오류가 발생했습니다: {str(e)}")
+    
+    # 생성 중에 수정된 다른 필드를 덮어쓰지 않도록 현재 콘텐츠에 재생성한 필드만 병합
+    slide = slide_store.get_slide(slide_id)
+    if not slide:
+        raise HTTPException(status_code=404, detail="슬라이드를 찾을 수 없습니다")
+    result = service.apply_regeneration(slide, result)
+    
+    slide_content = result.slide_content
+    status = "ai_generated" if slide.status == "draft" else slide.status
+    slide_store.update_slide(slide_id, content=slide_content.generated_content, status=status)
+    
+    return FieldRegenerateResponse(
+        slide_id=slide_id,
+        template_type=slide.template_type,
+        content=slide_content.generated_content,
+        user_needed_items=slide_content.user_needed_items,
+        generation_notes=slide_content.generation_notes,
+        status=status,
+        missing_fields=slide_content.missing_fields,
+        regenerated_fields=result.regenerated_fields,
+        token_usage=result.token_usage()
+    )
 
 
 @router.patch("/{slide_id}", response_model=ContentResponse)
@@ -183,9 +406,10 @@ async def get_slide_content(
 @router.post("/batch-generate/{project_id}")
 async def batch_generate_content(
     project_id: str,
+    background: bool = False,
     current_user: User = Depends(get_current_user)
 ):
-    """프로젝트의 모든 슬라이드 콘텐츠 일괄 생성"""
+    """프로젝트의 모든 슬라이드 콘텐츠 일괄 생성 (background=true면 202와 작업 ID 반환)"""
     
     # 프로젝트 권한 확인
     project = project_store.get_project(project_id)
@@ -197,55 +421,131 @@ async def batch_generate_content(
     if not slides:
         raise HTTPException(status_code=404, detail="생성할 슬라이드가 없습니다")
     
+    if background:
+        job = job_manager.submit("content_batch", current_user.id, {"project_id": project_id})
+        return accepted_job(job)
+    
     try:
-        service = ContentGenerationService()
-        project_context = {
-            "topic": project.topic,
-            "target_audience": project.target_audience,
-            "goal": project.goal,
-            "title": project.title
-        }
-        
-        results = []
-        
-        for slide in slides:
-            # 이미 콘텐츠가 있는 슬라이드는 스킵
-            if slide.content:
-                continue
-                
-            try:
-                slide_content = await service.generate_slide_content(slide, project_context)
-                
-                # 슬라이드 업데이트
-                slide_store.update_slide(
-                    slide.id,
-                    content=slide_content.generated_content,
-                    status="ai_generated"
-                )
-                
-                results.append({
-                    "slide_id": slide.id,
-                    "head_message": slide.head_message,
-                    "status": "generated"
-                })
-                
-            except Exception as e:
-                results.append({
-                    "slide_id": slide.id,
-                    "head_message": slide.head_message, 
-                    "status": "failed",
-                    "error": str(e)
-                })
-        
-        return {
-            "message": f"{len(results)}개 슬라이드 콘텐츠 생성 완료",
-            "results": results
-        }
+        return await _batch_generate(project, slides)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"일괄 생성 중 오류가 발생했습니다: {str(e)}")
 
 
+@job_manager.handler("content_batch", resumable=False)
+async def _batch_generate_job(job: JobContext) -> Dict[str, Any]:
+    """백그라운드 일괄 생성"""
+    project = project_store.get_project(job.payload["project_id"])
+    if not project:
+        raise ValueError("프로젝트를 찾을 수 없습니다")
+    return await _batch_generate(project, slide_store.get_slides_for_project(project.id))
+
+
+async def _batch_generate(project: Project, slides: List[Slide]) -> Dict[str, Any]:
+    service = ContentGenerationService()
+    project_context = service.project_context(project)
+    
+    # 이미 콘텐츠가 있는 슬라이드는 스킵
+    pending = [slide for slide in slides if not slide.content]
+    
+    if settings.CONTENT_BATCH_ENABLED:
+        # 여러 슬라이드를 한 번의 LLM 호출로 묶어 생성
+        contents = await service.generate_slides_content(pending, project_context)
+    else:
+        contents = {}
+        for slide in pending:
+            contents[slide.id] = await service.generate_slide_content(slide, project_context)
+    
+    results = []
+    
+    for slide in pending:
+        try:
+            slide_content = contents[slide.id]
+            
+            # 슬라이드 업데이트
+            slide_store.update_slide(
+                slide.id,
+                content=slide_content.generated_content,
+                status="ai_generated"
+            )
+            
+            results.append({
+                "slide_id": slide.id,
+                "head_message": slide.head_message,
+                "status": "generated",
+                "missing_fields": slide_content.missing_fields
+            })
+            
+        except Exception as e:
+            results.append({
+                "slide_id": slide.id,
+                "head_message": slide.head_message, 
+                "status": "failed",
+                "error": str(e)
+            })
+    
+    return {
+        "message": f"{len(results)}개 슬라이드 콘텐츠 생성 완료",
+        "results": results
+    }
+
+
+@router.post("/generate-project/{project_id}")
+async def generate_project_content(
+    project_id: str,
+    request: ProjectContentGenerateRequest = ProjectContentGenerateRequest(),
+    current_user: User = Depends(get_current_user)
+):
+    """프로젝트 슬라이드 콘텐츠 동시 생성 (SSE)
+    
+    슬라이드를 CONTENT_PROJECT_CONCURRENCY개씩 동시에 생성하고 끝나는 대로 slide 이벤트로 전송한다.
+    한 슬라이드가 실패해도 나머지는 계속 생성하며, 마지막에 done 이벤트로 요약을 보낸다.
+    """
+    
+    # 프로젝트 권한 확인
+    project = project_store.get_project(project_id)
+    if not project or project.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="접근 권한이 없습니다")
+    
+    slides = slide_store.get_slides_for_project(project_id)
+    if request.only_missing:
+        slides = [slide for slide in slides if not slide.content or slide.status == "draft"]
+    
+    semaphore = asyncio.Semaphore(max(1, settings.CONTENT_PROJECT_CONCURRENCY))
+    
+    async def generate(slide: Slide) -> Dict[str, Any]:
+        result = {"slide_id": slide.id, "order": slide.order, "head_message": slide.head_message}
+        try:
+            async with semaphore:
+                # 이미 생성 중인 슬라이드(추측 생성 등)는 그 결과를 공유
+                response = await slide_generation_flight.do(
+                    slide.id,
+                    lambda: _generate_and_store(slide, project, use_cache=not slide.content)
+                )
+        except Exception as e:
+            return {**result, "status": "failed", "error": f"콘텐츠 생성 중 오류가 발생했습니다: {str(e)}"}
+        return {**result, "status": "generated", **response.model_dump(exclude={"slide_id", "status"})}
+    
+    async def event_stream():
+        tasks = [asyncio.ensure_future(generate(slide)) for slide in slides]
+        generated = failed = 0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                if result["status"] == "generated":
+                    generated += 1
+                else:
+                    failed += 1
+                yield format_sse("slide", result)
+            yield format_sse("done", {"total": len(slides), "generated": generated, "failed": failed})
+        finally:
+            # 클라이언트 연결이 끊기면 남은 생성 취소
+            for task in tasks:
+                task.cancel()
+    
+    return sse_response(event_stream())
+
+
 @router.get("/templates/{template_type}/fields")
 async def get_template_fields(template_type: str):
     """템플릿별 필드 구조 조회"""
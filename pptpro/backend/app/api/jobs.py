@@ -0,0 +1,87 @@
+"""
+백그라운드 작업 API - 상태 조회(long-poll), 취소, 결과 파일 다운로드
+"""
+import os
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import FileResponse, JSONResponse
+from typing import Optional
+from app.core.auth import get_current_user
+from app.core.config import settings
+from app.db.memory_store import User
+from app.infrastructure.jobs import JobRecord, job_manager
+
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+def accepted_job(job: JobRecord) -> JSONResponse:
+    """작업을 제출한 엔드포인트의 202 응답 (Location: 상태 조회 경로)"""
+    return JSONResponse(
+        status_code=202,
+        content=job.to_dict(),
+        headers={"Location": f"/api/jobs/{job.id}"}
+    )
+
+
+@router.get("")
+async def list_jobs(
+    limit: int = Query(50, ge=1, le=200),
+    current_user: User = Depends(get_current_user)
+):
+    """내 작업 목록 (최신순)"""
+    return {"jobs": [job.to_dict() for job in job_manager.list_jobs(current_user.id, limit)]}
+
+
+@router.get("/{job_id}")
+async def get_job(
+    job_id: str,
+    wait: float = Query(0, ge=0, le=settings.JOB_LONG_POLL_MAX_SECONDS),
+    since: Optional[int] = None,
+    current_user: User = Depends(get_current_user)
+):
+    """작업 상태 조회 - wait초 동안 since 버전 이후의 변경을 기다림 (since 생략 시 현재 버전 기준)"""
+    job = _get_user_job(job_id, current_user)
+    if wait > 0:
+        job = await job_manager.wait(job_id, job.version if since is None else since, wait)
+    return job.to_dict()
+
+
+@router.post("/{job_id}/cancel")
+async def cancel_job(
+    job_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """작업 취소 (실행 중이면 취소 요청 후 곧 cancelled 상태가 됨)"""
+    _get_user_job(job_id, current_user)
+    return job_manager.cancel(job_id).to_dict()
+
+
+@router.get("/{job_id}/download")
+async def download_job_artifact(
+    job_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """작업 결과 파일 다운로드"""
+    job = _get_user_job(job_id, current_user)
+    artifact = (job.result or {}).get("artifact")
+    if job.state != "succeeded" or not artifact:
+        raise HTTPException(status_code=409, detail=f"다운로드할 결과 파일이 없습니다 (상태: {job.state})")
+
+    path = job_manager.store.artifact_path(job.id, artifact)
+    if not os.path.exists(path):
+        raise HTTPException(status_code=410, detail="결과 파일이 삭제되었습니다")
+
+    return FileResponse(
+        path,
+        media_type=job.result.get("media_type", "application/octet-stream"),
+        filename=job.result.get("filename", artifact)
+    )
+
+
+def _get_user_job(job_id: str, current_user: User) -> JobRecord:
+    job = job_manager.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+    if job.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail="접근 권한이 없습니다")
+    return job
@@ -0,0 +1,60 @@
+"""
+LLM 운영 지표 API
+"""
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from app.api.content import content_prefetcher
+from app.core.auth import get_current_user
+from app.db.memory_store import User, generation_log_store
+from app.infrastructure.llm_provider import (
+    llm_registry,
+    llm_response_cache,
+    llm_single_flight,
+    llm_telemetry,
+)
+
+
+router = APIRouter(prefix="/llm", tags=["llm"])
+
+
+@router.get("/stats")
+async def get_llm_stats(current_user: User = Depends(get_current_user)):
+    """LLM 응답 캐시 히트/미스/축출, 요청 합치기, 속도 제한/재시도/헤지 요청, 콘텐츠 추측 생성 현황 조회"""
+    return {
+        "cache": llm_response_cache.stats(),
+        "single_flight": llm_single_flight.stats(),
+        "upstream": llm_registry.upstream_stats(),
+        "telemetry": llm_telemetry.stats(),
+        "prefetch": content_prefetcher.stats(),
+    }
+
+
+@router.get("/logs")
+async def list_generation_logs(
+    limit: int = Query(100, ge=1, le=1000),
+    endpoint: Optional[str] = None,
+    template_type: Optional[str] = None,
+    model: Optional[str] = None,
+    project_id: Optional[str] = None,
+    current_user: User = Depends(get_current_user)
+):
+    """최근 LLM 호출 로그 (GenerationLog) 조회"""
+    logs = generation_log_store.list_logs(
+        limit=limit,
+        endpoint=endpoint,
+        template_type=template_type,
+        model=model,
+        project_id=project_id,
+    )
+    return {"logs": [log.to_dict() for log in logs]}
+
+
+@router.get("/usage")
+async def get_llm_usage(
+    group_by: str = "endpoint",
+    current_user: User = Depends(get_current_user)
+):
+    """그룹(endpoint, template_type, model 등)별 호출 수, 토큰, 지연 분포 집계"""
+    if group_by not in ("endpoint", "template_type", "model", "llm_provider", "kind", "cache_status"):
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 group_by입니다: {group_by}")
+    return {"group_by": group_by, "usage": generation_log_store.summarize(group_by)}
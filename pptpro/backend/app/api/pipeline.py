@@ -0,0 +1,55 @@
+"""
+일괄 생성 파이프라인 API - 스토리라인부터 PPT 파일까지 한 번의 요청으로 백그라운드 실행
+"""
+from fastapi import APIRouter, HTTPException, Depends
+from pydantic import BaseModel
+from typing import Any, Dict, Optional
+from app.api.jobs import accepted_job
+from app.services.pipeline import PipelineService
+from app.core.auth import get_current_user
+from app.db.memory_store import User
+from app.infrastructure.jobs import JobContext, job_manager
+
+
+router = APIRouter(prefix="/pipeline", tags=["pipeline"])
+
+
+class PipelineRequest(BaseModel):
+    topic: str
+    target: str
+    goal: str
+    narrative_style: Optional[str] = "consulting"
+    project_title: Optional[str] = None
+
+
+@router.post("/run", status_code=202)
+async def run_pipeline(
+    request: PipelineRequest,
+    current_user: User = Depends(get_current_user)
+):
+    """스토리라인 → 콘텐츠 → PPT 생성 작업 시작
+
+    진행 상황은 /jobs/{job_id}, 완성된 PPT는 /jobs/{job_id}/download로 받는다.
+    """
+
+    # 입력 검증
+    if not request.topic.strip():
+        raise HTTPException(status_code=400, detail="주제를 입력해주세요")
+    if not request.target.strip():
+        raise HTTPException(status_code=400, detail="타겟 청중을 입력해주세요")
+    if not request.goal.strip():
+        raise HTTPException(status_code=400, detail="목표를 입력해주세요")
+
+    job = job_manager.submit("pipeline", current_user.id, {
+        "topic": request.topic.strip(),
+        "target": request.target.strip(),
+        "goal": request.goal.strip(),
+        "narrative_style": request.narrative_style or "consulting",
+        "project_title": request.project_title
+    })
+    return accepted_job(job)
+
+
+@job_manager.handler("pipeline", resumable=False)
+async def _run_pipeline_job(job: JobContext) -> Dict[str, Any]:
+    return await PipelineService().run(job)
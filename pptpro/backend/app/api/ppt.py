@@ -1,18 +1,51 @@
 """
 PPT 생성 API
 """
-from fastapi import APIRouter, HTTPException, Depends, Response
-from fastapi.responses import StreamingResponse
+import asyncio
+import os
+import tempfile
+from collections import OrderedDict
+from fastapi import APIRouter, HTTPException, Depends, Header, Response
+from fastapi.responses import FileResponse, JSONResponse
+from starlette.background import BackgroundTask
 from pydantic import BaseModel
-from typing import Optional
-from app.services.ppt_generation import PPTGenerationService
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote
+from app.services.ppt_generation import (
+    PPTX_MEDIA_TYPE,
+    ExportManifest,
+    PPTGenerationService,
+    ppt_artifact_cache,
+    project_version,
+    render_patch_to_file,
+    render_presentation_to_file
+)
+from app.api.jobs import accepted_job
 from app.core.auth import get_current_user
-from app.db.memory_store import User, project_store, slide_store
-import datetime
+from app.core.config import settings
+from app.db.memory_store import Project, Slide, User, project_store, slide_store
+from app.infrastructure.jobs import JobContext, job_manager
+from app.infrastructure.render_pool import RenderQueueFull, render_executor, slide_render_pool
+from app.infrastructure.zip_package import COMPRESSION_PROFILES
+from app.services.slide_part_cache import slide_part_cache
 
 
 router = APIRouter(prefix="/ppt", tags=["ppt"])
 
+# (프로젝트, 압축 프로필)별 마지막으로 캐시에 넣은 파일 구성 (바뀐 슬라이드만 교체하는 재내보내기용)
+# 최근에 쓴 PPT_PATCH_MAX_EXPORTS개까지만 유지 (LRU)
+_latest_exports: "OrderedDict[Tuple[str, Optional[str]], ExportManifest]" = OrderedDict()
+_export_counters = {"rendered": 0, "patched": 0}
+
+
+def attachment_headers(filename: str) -> Dict[str, str]:
+    """다운로드 응답 헤더 - 한글 파일명은 RFC 5987 형식(filename*)으로 전달"""
+    fallback = filename.encode("ascii", "replace").decode("ascii").replace('"', "_")
+    return {
+        'Content-Disposition': f'attachment; filename="{fallback}"; filename*=UTF-8\'\'{quote(filename)}',
+        'Content-Type': PPTX_MEDIA_TYPE
+    }
+
 
 class PPTGenerateRequest(BaseModel):
     project_id: str
@@ -23,9 +56,21 @@ class PPTGenerateRequest(BaseModel):
 async def generate_ppt(
     project_id: str,
     include_empty: bool = False,
+    background: bool = False,
+    compression: Optional[str] = None,
+    if_none_match: Optional[str] = Header(default=None),
     current_user: User = Depends(get_current_user)
 ):
-    """프로젝트의 PPT 파일 생성 및 다운로드"""
+    """프로젝트의 PPT 파일 생성 및 다운로드 (background=true면 202와 작업 ID 반환, /jobs/{id}/download로 수신)
+
+    응답 ETag는 프로젝트 버전 해시(약한 ETag)이며, If-None-Match가 일치하면 다시 만들지 않고 304를 반환한다.
+    compression: zip 압축 프로필 (store, fast, default, max - 비우면 PPT_COMPRESSION_PROFILE)
+    """
+    if compression is not None and compression not in COMPRESSION_PROFILES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"압축 프로필은 {', '.join(COMPRESSION_PROFILES)} 중 하나여야 합니다"
+        )
     
     # 프로젝트 권한 확인
     project = project_store.get_project(project_id)
@@ -35,6 +80,157 @@ async def generate_ppt(
     if project.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="접근 권한이 없습니다")
     
+    slides = _get_render_slides(project_id, include_empty)
+    
+    if background:
+        job = job_manager.submit("ppt", current_user.id, {
+            "project_id": project_id,
+            "include_empty": include_empty,
+            "compression": compression
+        })
+        return accepted_job(job)
+    
+    etag = _version_etag(project, slides, compression)
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    headers = {**attachment_headers(PPTGenerationService.build_filename(project)), "ETag": etag}
+    ppt_data = _get_cached_artifact(etag)
+    if ppt_data is not None:
+        return Response(content=ppt_data, media_type=PPTX_MEDIA_TYPE, headers=headers)
+    
+    # 임시 파일에 바로 저장한 뒤 파일로 전송 (파일 내용을 메모리에 올리지 않음, 전송 후 삭제)
+    fd, path = tempfile.mkstemp(suffix=".pptx", dir=settings.PPT_SPOOL_DIR or None)
+    os.close(fd)
+    rendered = False
+    try:
+        await _render_to_file(etag, project, slides, path, compression=compression)
+        rendered = True
+    except RenderQueueFull as e:
+        return JSONResponse(
+            status_code=503,
+            content={"detail": str(e)},
+            headers={"Retry-After": str(settings.RENDER_RETRY_AFTER_SECONDS)}
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"PPT 생성 중 오류가 발생했습니다: {str(e)}")
+    finally:
+        if not rendered:
+            os.unlink(path)
+    
+    return FileResponse(
+        path,
+        media_type=PPTX_MEDIA_TYPE,
+        headers=headers,
+        background=BackgroundTask(os.unlink, path)
+    )
+
+
+@job_manager.handler("ppt", resumable=False)
+async def _generate_ppt_job(job: JobContext) -> Dict[str, Any]:
+    """백그라운드 PPT 생성 - 결과 파일은 작업 결과로 저장"""
+    project = project_store.get_project(job.payload["project_id"])
+    if not project:
+        raise ValueError("프로젝트를 찾을 수 없습니다")
+    slides = _get_render_slides(project.id, job.payload.get("include_empty", False))
+    
+    compression = job.payload.get("compression")
+    etag = _version_etag(project, slides, compression)
+    artifact = "presentation.pptx"
+    ppt_data = _get_cached_artifact(etag)
+    if ppt_data is not None:
+        await job.save_artifact(artifact, ppt_data)
+    else:
+        await _render_to_file(
+            etag, project, slides, job.artifact_path(artifact), block=True, compression=compression
+        )
+    return {
+        "project_id": project.id,
+        "filename": PPTGenerationService.build_filename(project),
+        "artifact": artifact,
+        "media_type": PPTX_MEDIA_TYPE
+    }
+
+
+def _get_cached_artifact(etag: str) -> Optional[bytes]:
+    """같은 버전으로 생성한 파일이 캐시에 있으면 그 내용"""
+    if not settings.PPT_ARTIFACT_CACHE_ENABLED:
+        return None
+    return ppt_artifact_cache.get(etag)
+
+
+async def _render_to_file(
+    etag: str, project: Project, slides: List[Slide], path: str, block: bool = False, compression: Optional[str] = None
+) -> None:
+    """PPT를 path에 생성 (렌더링 워커 풀에서 실행해 이벤트 루프를 막지 않음), 작은 파일은 캐시에도 저장
+    
+    같은 프로젝트의 이전 파일이 캐시에 있고 슬라이드 구성이 같으면 바뀐 슬라이드만 교체한다.
+    """
+    manifest = ExportManifest.build(etag, project, slides, compression)
+    size = await _patch_previous_export(manifest, project.id, slides, path, block, compression)
+    if size is None:
+        size = await render_executor.run(
+            render_presentation_to_file, project, slides, path, compression, block=block
+        )
+        _export_counters["rendered"] += 1
+    else:
+        _export_counters["patched"] += 1
+    if settings.PPT_ARTIFACT_CACHE_ENABLED and size <= settings.PPT_ARTIFACT_CACHE_ITEM_MAX_BYTES:
+        ppt_artifact_cache.set(etag, await asyncio.to_thread(_read_file, path))
+        _remember_export((project.id, compression), manifest)
+
+
+def _remember_export(key: Tuple[str, Optional[str]], manifest: ExportManifest) -> None:
+    _latest_exports[key] = manifest
+    _latest_exports.move_to_end(key)
+    while len(_latest_exports) > settings.PPT_PATCH_MAX_EXPORTS:
+        _latest_exports.popitem(last=False)
+
+
+async def _patch_previous_export(
+    manifest: ExportManifest, project_id: str, slides: List[Slide], path: str, block: bool,
+    compression: Optional[str] = None
+) -> Optional[int]:
+    """이전 파일에서 바뀐 슬라이드만 교체해 path에 저장하고 크기 반환 (교체할 수 없으면 None)"""
+    key = (project_id, compression)
+    previous = _latest_exports.get(key)
+    if not settings.PPT_PATCH_ENABLED or previous is None:
+        return None
+    previous_data = ppt_artifact_cache.get(previous.etag)
+    if previous_data is None:
+        # 파일이 캐시에서 축출됨 - 구성도 버림
+        del _latest_exports[key]
+        return None
+    _latest_exports.move_to_end(key)
+    changed_slide_ids = previous.changed_slide_ids(manifest)
+    if changed_slide_ids is None:
+        return None
+    return await render_executor.run(
+        render_patch_to_file, previous_data, slides, changed_slide_ids, path, compression, block=block
+    )
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _version_etag(project: Project, slides: List[Slide], compression: Optional[str] = None) -> str:
+    """프로젝트 버전 ETag - 같은 버전이면 내용은 같지만 zip 바이트(항목 시각, 패치 여부 등)는 다를 수 있어 약한 ETag"""
+    return f'W/"{project_version(project, slides, compression)}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더(여러 값)가 etag와 약한 비교로 일치하는지"""
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    return "*" in candidates or any(value.removeprefix("W/") == etag.removeprefix("W/") for value in candidates)
+
+
+def _get_render_slides(project_id: str, include_empty: bool) -> List[Slide]:
+    """렌더링할 슬라이드 조회 (include_empty가 아니면 콘텐츠가 있는 슬라이드만)"""
+    
     # 프로젝트의 슬라이드들 조회
     slides = slide_store.get_slides_for_project(project_id)
     if not slides:
@@ -50,29 +246,19 @@ async def generate_ppt(
                 detail="콘텐츠가 생성된 슬라이드가 없습니다. 먼저 슬라이드 콘텐츠를 생성해주세요."
             )
     
-    try:
-        # PPT 생성
-        service = PPTGenerationService()
-        ppt_buffer = service.generate_ppt(project, slides)
-        
-        # 파일명 생성 (한글 파일명 지원)
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{project.title}_{timestamp}.pptx"
-        
-        # 응답 헤더 설정
-        headers = {
-            'Content-Disposition': f'attachment; filename="{filename}"',
-            'Content-Type': 'application/vnd.openxmlformats-officedocument.presentationml.presentation'
-        }
-        
-        return StreamingResponse(
-            iter([ppt_buffer.getvalue()]), 
-            media_type='application/vnd.openxmlformats-officedocument.presentationml.presentation',
-            headers=headers
-        )
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"PPT 생성 중 오류가 발생했습니다: {str(e)}")
+    return slides
+
+
+@router.get("/render/stats")
+async def get_render_stats(current_user: User = Depends(get_current_user)):
+    """렌더링 워커 풀 현황 (실행 중, 대기열 깊이, 거절 수, 평균 대기/렌더링 시간)과 슬라이드/파일 캐시 적중률"""
+    return {
+        **render_executor.stats(),
+        "slide_cache": slide_part_cache.stats(),
+        "artifact_cache": ppt_artifact_cache.stats(),
+        "parallel": slide_render_pool.stats(),
+        "exports": {**_export_counters, "remembered": len(_latest_exports)}
+    }
 
 
 @router.get("/preview/{project_id}")
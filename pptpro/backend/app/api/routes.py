@@ -11,6 +11,9 @@ from app.api.content import router as content_router
 from app.api.ppt import router as ppt_router
 from app.api.template import router as template_router
 from app.api.slide_content import router as slide_content_router
+from app.api.llm import router as llm_router
+from app.api.pipeline import router as pipeline_router
+from app.api.jobs import router as jobs_router
 
 # 메인 API 라우터
 api_router = APIRouter()
@@ -24,6 +27,9 @@ api_router.include_router(content_router)
 api_router.include_router(ppt_router)
 api_router.include_router(template_router)
 api_router.include_router(slide_content_router)
+api_router.include_router(llm_router)
+api_router.include_router(pipeline_router)
+api_router.include_router(jobs_router)
 
 
 @api_router.get("/")
@@ -35,4 +41,4 @@ async def api_root():
 @api_router.get("/status")
 async def api_status():
     """API status endpoint"""
-    return {"status": "active", "features": ["auth", "projects", "storyline", "slides", "content", "ppt", "llm"]}
\ No newline at end of file
+    return {"status": "active", "features": ["auth", "projects", "storyline", "slides", "content", "ppt", "llm", "pipeline", "jobs"]}
\ No newline at end of file
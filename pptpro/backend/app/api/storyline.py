@@ -1,12 +1,18 @@
 """
 스토리라인 생성 API
 """
+from dataclasses import asdict
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
+from app.api.content import content_prefetcher
+from app.api.jobs import accepted_job
 from app.services.storyline import StorylineService, SlideOutline, StorylineResult
 from app.core.auth import get_current_user
-from app.db.memory_store import User, project_store, slide_store
+from app.core.config import settings
+from app.core.sse import format_sse, sse_response
+from app.db.memory_store import User, project_store, slide_store, user_store
+from app.infrastructure.jobs import JobContext, job_manager
 
 
 router = APIRouter(prefix="/storyline", tags=["storyline"])
@@ -19,6 +25,7 @@ class StorylineRequest(BaseModel):
     narrative_style: Optional[str] = "consulting"
     create_project: Optional[bool] = False
     project_title: Optional[str] = None
+    prefetch_content: Optional[bool] = False  # 생성된 슬라이드의 콘텐츠를 백그라운드에서 미리 생성
 
 
 class SlideOutlineResponse(BaseModel):
@@ -33,80 +40,151 @@ class StorylineResponse(BaseModel):
     head_messages: List[str]
     overall_narrative: str
     project_id: Optional[str] = None
+    prefetch_scheduled: int = 0  # 콘텐츠 추측 생성 대기열에 넣은 슬라이드 수
 
 
 @router.post("/generate", response_model=StorylineResponse)
 async def generate_storyline(
     request: StorylineRequest,
+    background: bool = False,
     current_user: User = Depends(get_current_user)
 ):
-    """스토리라인 생성"""
+    """스토리라인 생성 (background=true면 202와 작업 ID 반환, 결과는 /jobs/{id}의 result)"""
     
-    # 입력 검증
+    _validate_storyline_request(request)
+    
+    if background:
+        job = job_manager.submit("storyline", current_user.id, request.model_dump())
+        return accepted_job(job)
+    
+    try:
+        result = await _generate_storyline(request)
+        return _build_storyline_response(request, result, current_user)
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"스토리라인 생성 중 오류가 발생했습니다: {str(e)}")
+
+
+@job_manager.handler("storyline", resumable=False)
+async def _generate_storyline_job(job: JobContext) -> Dict[str, Any]:
+    """백그라운드 스토리라인 생성"""
+    request = StorylineRequest(**job.payload)
+    current_user = user_store.get_user_by_id(job.user_id)
+    if not current_user:
+        raise ValueError("사용자를 찾을 수 없습니다")
+    result = await _generate_storyline(request)
+    return _build_storyline_response(request, result, current_user).model_dump()
+
+
+async def _generate_storyline(request: StorylineRequest) -> StorylineResult:
+    # 스토리라인 서비스로 생성
+    service = StorylineService()
+    return await service.generate_storyline(
+        topic=request.topic.strip(),
+        target=request.target.strip(), 
+        goal=request.goal.strip(),
+        narrative_style=request.narrative_style or "consulting"
+    )
+
+
+@router.post("/generate/stream")
+async def generate_storyline_stream(
+    request: StorylineRequest,
+    current_user: User = Depends(get_current_user)
+):
+    """스토리라인 생성 (SSE) - token 이벤트로 생성 중인 텍스트를, outline_item 이벤트로 완성된 슬라이드를, result 이벤트로 최종 결과를 전송"""
+    
+    _validate_storyline_request(request)
+    
+    async def event_stream():
+        service = StorylineService()
+        try:
+            async for kind, payload in service.stream_storyline(
+                topic=request.topic.strip(),
+                target=request.target.strip(),
+                goal=request.goal.strip(),
+                narrative_style=request.narrative_style or "consulting"
+            ):
+                if kind == "token":
+                    yield format_sse("token", {"text": payload})
+                elif kind == "outline_item":
+                    yield format_sse("outline_item", asdict(payload))
+                else:
+                    response = _build_storyline_response(request, payload, current_user)
+                    yield format_sse("result", response.model_dump())
+        except Exception as e:
+            yield format_sse("error", {"detail": f"스토리라인 생성 중 오류가 발생했습니다: {str(e)}"})
+    
+    return sse_response(event_stream())
+
+
+def _validate_storyline_request(request: StorylineRequest) -> None:
+    """입력 검증"""
     if not request.topic.strip():
         raise HTTPException(status_code=400, detail="주제를 입력해주세요")
     if not request.target.strip():
         raise HTTPException(status_code=400, detail="타겟 청중을 입력해주세요")
     if not request.goal.strip():
         raise HTTPException(status_code=400, detail="목표를 입력해주세요")
+
+
+def _build_storyline_response(
+    request: StorylineRequest,
+    result: StorylineResult,
+    current_user: User
+) -> StorylineResponse:
+    """생성 결과를 응답으로 변환하고, 요청 시 프로젝트와 슬라이드 생성"""
     
-    try:
-        # 스토리라인 서비스로 생성
-        service = StorylineService()
-        result = await service.generate_storyline(
-            topic=request.topic.strip(),
-            target=request.target.strip(), 
-            goal=request.goal.strip(),
-            narrative_style=request.narrative_style or "consulting"
+    # 응답 변환
+    outline_responses = []
+    head_messages = []
+    for slide in result.outline:
+        outline_responses.append(SlideOutlineResponse(
+            order=slide.order,
+            head_message=slide.head_message,
+            purpose=slide.purpose,
+            template_suggestion=slide.template_suggestion
+        ))
+        head_messages.append(slide.head_message)
+    
+    project_id = None
+    prefetch_scheduled = 0
+    
+    # 프로젝트 생성이 요청된 경우
+    if request.create_project:
+        project_title = request.project_title or f"{request.topic} 프로젝트"
+        project = project_store.create_project(
+            user_id=current_user.id,
+            title=project_title,
+            topic=request.topic,
+            target_audience=request.target,
+            goal=request.goal
         )
+        project_id = project.id
         
-        # 응답 변환
-        outline_responses = []
-        head_messages = []
+        # 스토리라인을 기반으로 슬라이드 생성
+        storyline_data = []
         for slide in result.outline:
-            outline_responses.append(SlideOutlineResponse(
-                order=slide.order,
-                head_message=slide.head_message,
-                purpose=slide.purpose,
-                template_suggestion=slide.template_suggestion
-            ))
-            head_messages.append(slide.head_message)
-        
-        project_id = None
-        
-        # 프로젝트 생성이 요청된 경우
-        if request.create_project:
-            project_title = request.project_title or f"{request.topic} 프로젝트"
-            project = project_store.create_project(
-                user_id=current_user.id,
-                title=project_title,
-                topic=request.topic,
-                target_audience=request.target,
-                goal=request.goal
-            )
-            project_id = project.id
-            
-            # 스토리라인을 기반으로 슬라이드 생성
-            storyline_data = []
-            for slide in result.outline:
-                storyline_data.append({
-                    "order": slide.order,
-                    "head_message": slide.head_message,
-                    "purpose": slide.purpose,
-                    "template_suggestion": slide.template_suggestion
-                })
-            
-            slide_store.create_slides_from_storyline(project.id, storyline_data)
+            storyline_data.append({
+                "order": slide.order,
+                "head_message": slide.head_message,
+                "purpose": slide.purpose,
+                "template_suggestion": slide.template_suggestion
+            })
         
-        return StorylineResponse(
-            outline=outline_responses,
-            head_messages=head_messages,
-            overall_narrative=result.overall_narrative,
-            project_id=project_id
-        )
+        slides = slide_store.create_slides_from_storyline(project.id, storyline_data)
         
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"스토리라인 생성 중 오류가 발생했습니다: {str(e)}")
+        # 사용자가 슬라이드를 열기 전에 낮은 우선순위로 콘텐츠 미리 생성
+        if request.prefetch_content and settings.CONTENT_PREFETCH_ENABLED:
+            prefetch_scheduled = content_prefetcher.schedule(current_user.id, project, slides)
+    
+    return StorylineResponse(
+        outline=outline_responses,
+        head_messages=head_messages,
+        overall_narrative=result.overall_narrative,
+        project_id=project_id,
+        prefetch_scheduled=prefetch_scheduled
+    )
 
 
 @router.get("/templates")
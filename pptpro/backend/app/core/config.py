@@ -41,6 +41,119 @@ class Settings(BaseSettings):
         default="",
         description="OpenAI API key"
     )
+    OPENAI_MODEL: str = "gpt-3.5-turbo"
+    # 사용할 Provider: openai, mock, synthetic, cassette (비우면 API 키 유무로 openai/mock 선택)
+    LLM_PROVIDER: str = ""
+    
+    # LLM HTTP 커넥션 풀
+    LLM_HTTP_MAX_CONNECTIONS: int = 100
+    LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 60.0
+    LLM_HTTP_TIMEOUT_SECONDS: float = 60.0
+    LLM_HTTP_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    LLM_HTTP2: bool = True
+    
+    # LLM 응답 캐시
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_MAX_TEMPERATURE: float = 0.3  # 이 값 이하의 호출만 캐시
+    LLM_CACHE_TTL_SECONDS: int = 60 * 60 * 24
+    LLM_CACHE_MEMORY_MAX_ENTRIES: int = 1000
+    LLM_CACHE_MEMORY_MAX_BYTES: int = 32 * 1024 * 1024
+    LLM_CACHE_DISK_ENABLED: bool = True
+    LLM_CACHE_DISK_MAX_ENTRIES: int = 20000
+    LLM_CACHE_DIR: str = ".cache"
+    
+    # LLM 호출 속도 제한 (provider/model별)
+    LLM_RATE_LIMIT_ENABLED: bool = True
+    LLM_RATE_LIMIT_RPM: int = 3500  # 분당 요청 수
+    LLM_RATE_LIMIT_TPM: int = 90000  # 분당 토큰 수 (프롬프트 + 최대 응답 토큰 추정치)
+    LLM_RATE_LIMIT_QUEUE_TIMEOUT_SECONDS: float = 30.0  # 슬롯 대기 최대 시간
+    LLM_CONCURRENCY_INITIAL: int = 8
+    LLM_CONCURRENCY_MIN: int = 1
+    LLM_CONCURRENCY_MAX: int = 64
+    LLM_CONCURRENCY_LATENCY_SPIKE_RATIO: float = 2.5  # 평소 지연의 몇 배를 급증으로 볼지
+    LLM_CONCURRENCY_DECREASE_FACTOR: float = 0.5
+    
+    # LLM 호출 재시도 (오류 종류별 횟수는 app.infrastructure.llm_retry.RETRY_LIMITS)
+    LLM_RETRY_ENABLED: bool = True
+    LLM_RETRY_BASE_DELAY_SECONDS: float = 0.5
+    LLM_RETRY_MAX_DELAY_SECONDS: float = 8.0
+    
+    # 헤지 요청 (hedge=True로 호출한 짧은 요청만)
+    LLM_HEDGE_ENABLED: bool = True
+    LLM_HEDGE_PERCENTILE: float = 0.95  # 이 백분위 지연을 넘기면 같은 요청을 하나 더 보냄
+    LLM_HEDGE_MIN_SAMPLES: int = 20  # 지연 표본이 이보다 적으면 헤지하지 않음
+    LLM_HEDGE_MIN_DELAY_SECONDS: float = 0.3
+    
+    # LLM 호출 텔레메트리 (GenerationLog)
+    LLM_TELEMETRY_ENABLED: bool = True
+    LLM_TELEMETRY_QUEUE_SIZE: int = 10000  # 가득 차면 기록을 버림 (호출은 막지 않음)
+    LLM_TELEMETRY_BATCH_SIZE: int = 200
+    LLM_TELEMETRY_FLUSH_INTERVAL_SECONDS: float = 1.0
+    
+    # 녹화/재생 Provider (LLM_PROVIDER=cassette)
+    LLM_CASSETTE_DIR: str = "cassettes"  # 모델별 하위 디렉터리에 요청 해시별 JSON 저장
+    LLM_CASSETTE_MODE: str = "replay"  # record: 실제 호출 결과 저장, replay: 저장된 응답 재생
+    LLM_CASSETTE_FALLBACK_SYNTHETIC: bool = True  # 재생할 녹화가 없으면 synthetic 응답 (False면 오류)
+    LLM_CASSETTE_LATENCY_SCALE: float = 1.0  # 녹화 당시 지연에 곱할 배율 (0이면 지연 없음)
+    
+    # 합성 응답 Provider (LLM_PROVIDER=synthetic, 카세트 미스 시에도 사용)
+    LLM_SYNTHETIC_LATENCY_DISTRIBUTION: str = "lognormal"  # fixed, uniform, lognormal
+    LLM_SYNTHETIC_LATENCY_MEDIAN_MS: float = 800.0  # 첫 토큰까지 지연의 중앙값
+    LLM_SYNTHETIC_LATENCY_SPREAD: float = 0.5  # uniform: ± 비율, lognormal: sigma
+    LLM_SYNTHETIC_LATENCY_PER_TOKEN_MS: float = 15.0  # 출력 토큰당 추가 지연
+    LLM_SYNTHETIC_COMPLETION_TOKENS: int = 0  # 응답 토큰 수 고정값 (0이면 생성한 텍스트로 추정)
+    LLM_SYNTHETIC_SEED: int = 0
+    
+    # 다중 슬라이드 일괄 생성 (여러 슬라이드를 한 번의 구조화 호출로 생성)
+    CONTENT_BATCH_ENABLED: bool = True
+    CONTENT_BATCH_MAX_SLIDES: int = 6
+    CONTENT_BATCH_MAX_PROMPT_TOKENS: int = 6000
+    CONTENT_BATCH_MAX_OUTPUT_TOKENS: int = 4000  # 배치 응답 max_tokens 상한 (모델 출력 한도 이하)
+    
+    # 프로젝트 단위 슬라이드 동시 생성 (generate-project)
+    CONTENT_PROJECT_CONCURRENCY: int = 4
+    
+    # 콘텐츠 추측 생성 (스토리라인 생성 시 prefetch_content=true)
+    CONTENT_PREFETCH_ENABLED: bool = True
+    CONTENT_PREFETCH_CONCURRENCY: int = 2  # 동시에 미리 생성할 슬라이드 수 (전체)
+    CONTENT_PREFETCH_TOKEN_BUDGET: int = 30000  # 사용자별 기간 내 예상 토큰 한도
+    CONTENT_PREFETCH_BUDGET_WINDOW_SECONDS: float = 3600.0
+    
+    # 백그라운드 작업 (202 응답 + 작업 ID로 진행 상황 조회)
+    JOB_WORKERS: int = 4  # 동시에 실행할 작업 수
+    JOB_STORE_DIR: str = ".cache/jobs"  # 작업 기록(JSON)과 결과 파일 저장 위치
+    JOB_LONG_POLL_MAX_SECONDS: float = 30.0
+    JOB_RETENTION_SECONDS: float = 24 * 3600.0  # 끝난 작업의 기록과 결과 파일 보관 기간 (0이면 계속 보관)
+    JOB_CLEANUP_INTERVAL_SECONDS: float = 600.0
+    
+    # 일괄 생성 파이프라인 (스토리라인 → 콘텐츠 → PPT)
+    PIPELINE_CONTENT_CONCURRENCY: int = 4  # 동시에 생성할 슬라이드 수
+    
+    # PPT 렌더링
+    PPT_RENDER_ENGINE: str = "xml"  # xml (XML 조각 직접 생성), pptx (python-pptx 도형 API)
+    PPT_SLIDE_CACHE_ENABLED: bool = True  # 내용이 같은 슬라이드는 이전 렌더링 결과 재사용
+    PPT_SLIDE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    PPT_ARTIFACT_CACHE_ENABLED: bool = True  # 바뀐 것이 없는 프로젝트는 이전에 생성한 파일 그대로 전달
+    PPT_ARTIFACT_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+    PPT_ARTIFACT_CACHE_ITEM_MAX_BYTES: int = 16 * 1024 * 1024  # 이보다 큰 파일은 캐시하지 않음
+    PPT_PATCH_ENABLED: bool = True  # 이전 파일이 캐시에 있으면 바뀐 슬라이드만 교체해 재내보내기
+    PPT_PATCH_MAX_EXPORTS: int = 1024  # 교체 재내보내기용으로 기억하는 (프로젝트, 압축 프로필)별 마지막 파일 구성 수
+    PPT_PARALLEL_MIN_SLIDES: int = 200  # 콘텐츠 슬라이드가 이만큼 이상이면 구간별 프로세스 병렬 렌더링 (0이면 사용 안 함)
+    PPT_PARALLEL_WORKERS: int = 0  # 구간 렌더링 프로세스 수 (0이면 CPU 수)
+    PPT_PARALLEL_CHUNK_SLIDES: int = 50  # 한 구간의 최대 슬라이드 수 (조립 전까지 들고 있는 결과 XML 양 제한)
+    PPT_CHART_MAX_POINTS: int = 500  # 꺾은선/산점도 차트 한 개의 최대 점 수 (넘으면 다운샘플링)
+    PPT_CHART_MAX_CATEGORIES: int = 24  # 막대 차트 최대 항목 수 (넘으면 상위 항목 + 기타)
+    PPT_CHART_PIE_SLICES: int = 8  # 원형 차트 최대 조각 수 (넘으면 상위 항목 + 기타)
+    PPT_COMPRESSION_PROFILE: str = "default"  # zip 압축 프로필 - store, fast, default (python-pptx와 같음), max
+    PPT_COMPRESSION_THREADS: int = 4  # zip 항목 압축 스레드 수 (0이면 저장하는 스레드에서 차례로 압축)
+    PPT_SPOOL_DIR: str = ""  # 다운로드 전 PPT 파일을 저장할 임시 디렉터리 (비우면 시스템 임시 디렉터리)
+    
+    # PPT 렌더링 워커 풀
+    RENDER_EXECUTOR: str = "thread"  # thread, process (프로세스 풀은 GIL 영향 없음)
+    RENDER_WORKERS: int = 2  # 동시에 렌더링할 PPT 수
+    RENDER_QUEUE_SIZE: int = 8  # 워커가 모두 사용 중일 때 대기시킬 요청 수 (넘으면 503)
+    RENDER_RETRY_AFTER_SECONDS: int = 5
     
     # 파일 업로드
     MAX_FILE_SIZE_MB: int = 50
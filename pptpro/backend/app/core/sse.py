@@ -0,0 +1,25 @@
+"""
+Server-Sent Events 유틸리티
+"""
+import json
+from typing import Any, AsyncIterator
+
+from fastapi.responses import StreamingResponse
+
+
+def format_sse(event: str, data: Any) -> str:
+    """SSE 이벤트 한 건을 직렬화"""
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+def sse_response(events: AsyncIterator[str]) -> StreamingResponse:
+    """SSE 스트리밍 응답 (프록시 버퍼링 비활성화)"""
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
@@ -2,7 +2,8 @@
 In-memory user storage (temporary solution until SQLAlchemy issue is resolved)
 """
 import uuid
-from typing import Dict, Optional, List
+from collections import deque
+from typing import Any, Deque, Dict, Optional, List
 from datetime import datetime
 
 from app.core.auth import get_password_hash, verify_password
@@ -44,6 +45,31 @@ class Slide:
         self.updated_at = datetime.utcnow()
 
 
+class GenerationLog:
+    """LLM 호출 로그 (app.models.models.GenerationLog와 같은 필드)"""
+
+    def __init__(self, llm_provider: str, model: str, kind: str, created_at: Optional[datetime] = None, **fields: Any):
+        self.id = str(uuid.uuid4())
+        self.llm_provider = llm_provider
+        self.model = model
+        self.kind = kind  # generate, structured, stream
+        self.endpoint: Optional[str] = fields.get("endpoint")
+        self.template_type: Optional[str] = fields.get("template_type")
+        self.project_id: Optional[str] = fields.get("project_id")
+        self.slide_id: Optional[str] = fields.get("slide_id")
+        self.cache_status: str = fields.get("cache_status", "none")
+        self.tokens_used: Optional[int] = fields.get("tokens_used")
+        self.latency_ms: Optional[int] = fields.get("latency_ms")
+        self.upstream_latency_ms: Optional[int] = fields.get("upstream_latency_ms")
+        self.attempts: int = fields.get("attempts", 0)
+        self.status: str = fields.get("status", "ok")
+        self.error_kind: Optional[str] = fields.get("error_kind")
+        self.created_at = created_at or datetime.utcnow()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**self.__dict__, "created_at": self.created_at.isoformat()}
+
+
 class InMemoryUserStore:
     def __init__(self):
         self.users: Dict[str, User] = {}
@@ -174,7 +200,59 @@ class InMemoryProjectStore:
         return True
 
 
+class InMemoryGenerationLogStore:
+    """최근 LLM 호출 로그 (오래된 것부터 버림)"""
+
+    def __init__(self, max_entries: int = 50000):
+        self.logs: Deque[GenerationLog] = deque(maxlen=max_entries)
+
+    def add_logs(self, logs: List[GenerationLog]) -> None:
+        self.logs.extend(logs)
+
+    def list_logs(self, limit: int = 100, **filters: Optional[str]) -> List[GenerationLog]:
+        """최신순 조회 (filters: endpoint, template_type, model 등 필드 값 일치)"""
+        active = {k: v for k, v in filters.items() if v is not None}
+        result = []
+        for log in reversed(self.logs):
+            if all(getattr(log, k, None) == v for k, v in active.items()):
+                result.append(log)
+                if len(result) >= limit:
+                    break
+        return result
+
+    def summarize(self, group_by: str = "endpoint") -> List[Dict[str, Any]]:
+        """그룹별 호출 수, 토큰, 지연 분포, 캐시 히트율, 오류 수 집계"""
+        groups: Dict[Any, List[GenerationLog]] = {}
+        for log in self.logs:
+            groups.setdefault(getattr(log, group_by, None), []).append(log)
+
+        summary = []
+        for key, logs in groups.items():
+            latencies = sorted(log.latency_ms for log in logs if log.latency_ms is not None)
+            summary.append({
+                group_by: key,
+                "calls": len(logs),
+                "tokens_used": sum(log.tokens_used or 0 for log in logs),
+                "upstream_calls": sum(log.attempts for log in logs),
+                "cache_hits": sum(1 for log in logs if log.cache_status == "hit"),
+                "errors": sum(1 for log in logs if log.status == "error"),
+                "partial": sum(1 for log in logs if log.status == "partial"),
+                "latency_ms_total": sum(latencies),
+                "latency_ms_p50": _percentile(latencies, 0.5),
+                "latency_ms_p95": _percentile(latencies, 0.95),
+            })
+        summary.sort(key=lambda item: item["latency_ms_total"], reverse=True)
+        return summary
+
+
+def _percentile(ordered: List[int], p: float) -> Optional[int]:
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+
 # 전역 인스턴스
 user_store = InMemoryUserStore()
 project_store = InMemoryProjectStore()
-slide_store = InMemorySlideStore()
\ No newline at end of file
+slide_store = InMemorySlideStore()
+generation_log_store = InMemoryGenerationLogStore()
\ No newline at end of file
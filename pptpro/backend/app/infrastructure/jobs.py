@@ -0,0 +1,425 @@
+"""
+비동기 작업 큐 - asyncio 워커 풀, 로컬 파일에 영속화되는 작업 기록, 진행 상황 long-poll, 취소, 보관 기간 정리
+"""
+import asyncio
+import contextvars
+import json
+import logging
+import os
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+FINISHED_STATES = ("succeeded", "failed", "cancelled")
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat()
+
+
+@dataclass
+class JobRecord:
+    kind: str  # 핸들러 이름 (pipeline, storyline, content_batch, ppt 등)
+    user_id: str
+    payload: Dict[str, Any]
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    state: str = "queued"  # queued, running, succeeded, failed, cancelled
+    progress: Dict[str, Any] = field(default_factory=dict)
+    result: Optional[Dict[str, Any]] = None  # 결과 또는 결과 파일 위치 (artifact)
+    error: Optional[str] = None
+    version: int = 0  # 기록이 바뀔 때마다 증가 (long-poll 기준)
+    created_at: str = field(default_factory=_now)
+    updated_at: str = field(default_factory=_now)
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.state in FINISHED_STATES
+
+    def to_dict(self) -> Dict[str, Any]:
+        """API 응답용 (요청 payload 제외)"""
+        data = asdict(self)
+        data.pop("payload")
+        data.pop("user_id")
+        data["job_id"] = data.pop("id")
+        return data
+
+
+class JobStore:
+    """작업 기록 저장소 - 작업별 JSON 파일로 저장해 재시작 후에도 조회 가능
+
+    이벤트 루프 안에서는 파일 쓰기를 스레드에서 실행한다. 쓰기가 끝나기 전에 같은 작업이 다시
+    저장되면 마지막 기록만 쓴다 (진행 상황 갱신이 잦아도 쓰기는 작업당 하나씩만 대기).
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.jobs: Dict[str, JobRecord] = {}
+        self._unsaved: Dict[str, Optional[Dict[str, Any]]] = {}  # job_id -> 아직 쓰지 않은 기록 (None이면 삭제)
+        self._writer: Optional[asyncio.Task] = None
+
+    def _path(self, job_id: str) -> str:
+        return os.path.join(self.directory, f"{job_id}.json")
+
+    def load(self) -> List[JobRecord]:
+        """디렉터리의 작업 기록을 모두 읽음 (손상된 파일은 무시)"""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return []
+        for name in names:
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.directory, name), encoding="utf-8") as f:
+                    job = JobRecord(**json.load(f))
+            except (OSError, ValueError, TypeError):
+                continue
+            self.jobs[job.id] = job
+        return list(self.jobs.values())
+
+    def save(self, job: JobRecord) -> None:
+        self.jobs[job.id] = job
+        self._schedule(job.id, asdict(job))
+
+    def remove(self, job_id: str) -> None:
+        """작업 기록과 결과 파일 삭제"""
+        self.jobs.pop(job_id, None)
+        self._schedule(job_id, None)
+
+    async def flush(self) -> None:
+        """대기 중인 쓰기/삭제를 모두 실행"""
+        loop = asyncio.get_running_loop()
+        while self._writer is not None and not self._writer.done() and self._writer.get_loop() is loop:
+            await asyncio.shield(self._writer)
+        if self._unsaved:
+            records, self._unsaved = self._unsaved, {}
+            await asyncio.to_thread(self._write, records)
+
+    def get(self, job_id: str) -> Optional[JobRecord]:
+        return self.jobs.get(job_id)
+
+    def list_for_user(self, user_id: str, limit: int = 50) -> List[JobRecord]:
+        jobs = [job for job in self.jobs.values() if job.user_id == user_id]
+        jobs.sort(key=lambda job: job.created_at, reverse=True)
+        return jobs[:limit]
+
+    def artifact_path(self, job_id: str, name: str) -> str:
+        return os.path.join(self.directory, "artifacts", f"{job_id}_{os.path.basename(name)}")
+
+    def expired(self, retention_seconds: float) -> List[JobRecord]:
+        """끝난 지 retention_seconds가 지난 작업"""
+        cutoff = (datetime.utcnow() - timedelta(seconds=retention_seconds)).isoformat()
+        return [job for job in self.jobs.values() if job.finished and (job.finished_at or job.updated_at) < cutoff]
+
+    def _schedule(self, job_id: str, record: Optional[Dict[str, Any]]) -> None:
+        """기록 쓰기(record가 None이면 삭제) 예약 - 루프 밖에서는 바로 실행"""
+        self._unsaved[job_id] = record
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            records, self._unsaved = self._unsaved, {}
+            self._write(records)
+            return
+        # 이전 루프의 쓰기 태스크는 끝나지 못하고 남을 수 있으므로 루프도 비교
+        if self._writer is None or self._writer.done() or self._writer.get_loop() is not loop:
+            self._writer = loop.create_task(self._write_loop())
+
+    async def _write_loop(self) -> None:
+        while self._unsaved:
+            records, self._unsaved = self._unsaved, {}
+            await asyncio.to_thread(self._write, records)
+
+    def _write(self, records: Dict[str, Optional[Dict[str, Any]]]) -> None:
+        for job_id, record in records.items():
+            if record is None:
+                self._remove_files(job_id)
+                continue
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                tmp_path = f"{self._path(job_id)}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(record, f, ensure_ascii=False)
+                os.replace(tmp_path, self._path(job_id))
+            except OSError:
+                logger.warning("작업 기록 저장 실패: %s", job_id, exc_info=True)
+
+    def _remove_files(self, job_id: str) -> None:
+        artifacts_dir = os.path.join(self.directory, "artifacts")
+        try:
+            names = [name for name in os.listdir(artifacts_dir) if name.startswith(f"{job_id}_")]
+        except OSError:
+            names = []
+        for path in [self._path(job_id)] + [os.path.join(artifacts_dir, name) for name in names]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                logger.warning("작업 파일 삭제 실패: %s", path, exc_info=True)
+
+
+class JobContext:
+    """실행 중인 작업 핸들 - 핸들러가 진행 상황과 결과 파일을 기록"""
+
+    def __init__(self, manager: "JobManager", job: JobRecord):
+        self._manager = manager
+        self.job = job
+
+    @property
+    def payload(self) -> Dict[str, Any]:
+        return self.job.payload
+
+    @property
+    def user_id(self) -> str:
+        return self.job.user_id
+
+    def update_progress(self, **progress: Any) -> None:
+        self.job.progress.update(progress)
+        self._manager._touch(self.job)
+
+    def artifact_path(self, name: str) -> str:
+        """결과 파일을 직접 쓸 경로 (쓴 뒤 결과에는 os.path.basename(name)을 artifact로 기록)"""
+        path = self._manager.store.artifact_path(self.job.id, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return path
+
+    async def save_artifact(self, name: str, data: bytes) -> str:
+        """결과 파일 저장 후 결과에 넣을 artifact 이름 반환"""
+        path = self._manager.store.artifact_path(self.job.id, name)
+
+        def write() -> None:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(data)
+
+        await asyncio.to_thread(write)
+        return os.path.basename(name)
+
+
+JobHandler = Callable[[JobContext], Awaitable[Optional[Dict[str, Any]]]]
+
+
+class JobManager:
+    """작업 큐와 워커 풀
+
+    submit()으로 등록한 작업을 workers개의 워커가 순서대로 실행한다. 핸들러는 제출한
+    요청의 컨텍스트(LLM 호출 태그 등)에서 실행된다. 재시작 시 대기 중이던 작업은 다시
+    실행하고(resumable=False로 등록한 종류는 실패로 기록), 실행 중이던 작업은 중간 결과를
+    알 수 없으므로 실패로 기록한다. 끝난 지 retention_seconds가 지난 작업은 기록과 결과
+    파일을 삭제한다.
+    """
+
+    def __init__(
+        self, store: JobStore, workers: int, retention_seconds: float = 0, cleanup_interval: float = 600.0
+    ):
+        self.store = store
+        self.workers = max(1, workers)
+        self.retention_seconds = retention_seconds  # 0이면 삭제하지 않음
+        self.cleanup_interval = cleanup_interval
+        self._handlers: Dict[str, JobHandler] = {}
+        self._non_resumable: Set[str] = set()
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._worker_tasks: List[asyncio.Task] = []
+        self._cleanup_task: Optional[asyncio.Task] = None
+        self._running: Dict[str, asyncio.Task] = {}  # job_id -> 핸들러 태스크
+        self._contexts: Dict[str, contextvars.Context] = {}  # 대기 중인 작업의 제출 시점 컨텍스트
+        self._waiters: Dict[str, Set[asyncio.Future]] = {}
+        self._loaded = False
+        self.counters = {"submitted": 0, "succeeded": 0, "failed": 0, "cancelled": 0, "expired": 0}
+
+    def handler(self, kind: str, resumable: bool = True) -> Callable[[JobHandler], JobHandler]:
+        """작업 핸들러 등록 데코레이터
+
+        resumable=False - payload가 재시작 후 남지 않는 데이터(메모리 저장소의 프로젝트 등)를
+        가리켜 다시 실행할 수 없는 작업. 재시작 시 대기 중이었어도 실패로 기록한다.
+        """
+        def register(fn: JobHandler) -> JobHandler:
+            self._handlers[kind] = fn
+            if not resumable:
+                self._non_resumable.add(kind)
+            return fn
+        return register
+
+    def start(self) -> None:
+        """저장된 작업 기록을 읽고 워커 시작 (이미 시작했으면 무시)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._worker_tasks:
+            return
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        if not self._loaded:
+            self._loaded = True
+            self._recover()
+        else:
+            for job in self.store.jobs.values():
+                if job.state == "queued":
+                    self._queue.put_nowait(job.id)
+        self._worker_tasks = [loop.create_task(self._worker()) for _ in range(self.workers)]
+        if self.retention_seconds > 0:
+            self._cleanup_task = loop.create_task(self._cleanup_loop())
+
+    def submit(self, kind: str, user_id: str, payload: Dict[str, Any]) -> JobRecord:
+        if kind not in self._handlers:
+            raise ValueError(f"등록되지 않은 작업 종류입니다: {kind}")
+        self.start()
+        job = JobRecord(kind=kind, user_id=user_id, payload=payload)
+        self.store.save(job)
+        self._contexts[job.id] = contextvars.copy_context()
+        self._queue.put_nowait(job.id)
+        self.counters["submitted"] += 1
+        return job
+
+    def get(self, job_id: str) -> Optional[JobRecord]:
+        return self.store.get(job_id)
+
+    def list_jobs(self, user_id: str, limit: int = 50) -> List[JobRecord]:
+        return self.store.list_for_user(user_id, limit)
+
+    async def wait(self, job_id: str, since_version: int, timeout: float) -> Optional[JobRecord]:
+        """기록이 since_version 이후로 바뀌거나 끝날 때까지 최대 timeout초 대기 (long-poll)"""
+        job = self.store.get(job_id)
+        if job is None or job.finished or job.version > since_version or timeout <= 0:
+            return job
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(job_id, set()).add(waiter)
+        try:
+            await asyncio.wait({waiter}, timeout=timeout)
+        finally:
+            waiters = self._waiters.get(job_id)
+            if waiters is not None:
+                waiters.discard(waiter)
+                if not waiters:
+                    del self._waiters[job_id]
+        return self.store.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[JobRecord]:
+        """대기 중이면 바로 취소, 실행 중이면 핸들러 태스크 취소 (끝난 작업은 그대로)"""
+        job = self.store.get(job_id)
+        if job is None or job.finished:
+            return job
+        task = self._running.get(job_id)
+        if task is not None:
+            task.cancel()
+        else:
+            self._finish(job, "cancelled", error="작업이 취소되었습니다")
+        return job
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.counters,
+            "workers": len(self._worker_tasks),
+            "running": len(self._running),
+            "queued": self._queue.qsize() if self._queue else 0,
+        }
+
+    def cleanup(self) -> int:
+        """보관 기간이 지난 작업 삭제 후 삭제한 수 반환"""
+        if self.retention_seconds <= 0:
+            return 0
+        expired = self.store.expired(self.retention_seconds)
+        for job in expired:
+            self._contexts.pop(job.id, None)
+            self.store.remove(job.id)
+        self.counters["expired"] += len(expired)
+        return len(expired)
+
+    async def aclose(self) -> None:
+        """워커 중지 - 실행 중이던 작업은 실패로 기록"""
+        tasks = self._worker_tasks + ([self._cleanup_task] if self._cleanup_task else [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._worker_tasks = []
+        self._cleanup_task = None
+        await self.store.flush()
+
+    def _recover(self) -> None:
+        for job in self.store.load():
+            if job.state == "running":
+                self._finish(job, "failed", error="서버 재시작으로 작업이 중단되었습니다")
+            elif job.state == "queued" and job.kind in self._non_resumable:
+                self._finish(job, "failed", error="서버 재시작으로 작업을 실행할 수 없습니다. 다시 요청해주세요")
+            elif job.state == "queued":
+                self._queue.put_nowait(job.id)
+        self.cleanup()
+
+    async def _cleanup_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.cleanup_interval)
+            try:
+                self.cleanup()
+            except Exception:
+                logger.exception("작업 기록 정리 실패")
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            job = self.store.get(job_id)
+            if job is None or job.state != "queued":
+                continue
+            await self._run(job)
+
+    async def _run(self, job: JobRecord) -> None:
+        handler = self._handlers.get(job.kind)
+        if handler is None:
+            self._finish(job, "failed", error=f"등록되지 않은 작업 종류입니다: {job.kind}")
+            return
+
+        job.state = "running"
+        job.started_at = _now()
+        self._touch(job)
+
+        context = self._contexts.pop(job.id, None) or contextvars.copy_context()
+        task = asyncio.get_running_loop().create_task(handler(JobContext(self, job)), context=context)
+        self._running[job.id] = task
+        try:
+            result = await task
+        except asyncio.CancelledError:
+            if asyncio.current_task().cancelling():
+                # 서버 종료로 워커가 취소됨
+                task.cancel()
+                self._finish(job, "failed", error="서버 종료로 작업이 중단되었습니다")
+                raise
+            self._finish(job, "cancelled", error="작업이 취소되었습니다")
+        except Exception as e:
+            logger.exception("작업 실패: %s (%s)", job.id, job.kind)
+            self._finish(job, "failed", error=str(e))
+        else:
+            job.result = result
+            self._finish(job, "succeeded")
+        finally:
+            self._running.pop(job.id, None)
+
+    def _finish(self, job: JobRecord, state: str, error: Optional[str] = None) -> None:
+        job.state = state
+        job.error = error
+        job.finished_at = _now()
+        self.counters[state] += 1
+        self._contexts.pop(job.id, None)
+        self._touch(job)
+
+    def _touch(self, job: JobRecord) -> None:
+        """기록 변경 저장 후 long-poll 대기자 깨움"""
+        job.version += 1
+        job.updated_at = _now()
+        self.store.save(job)
+        for waiter in self._waiters.get(job.id, ()):
+            if not waiter.done():
+                waiter.set_result(None)
+
+
+# 전역 작업 관리자 (워커는 애플리케이션 시작 시 또는 첫 제출 시 시작)
+job_manager = JobManager(
+    JobStore(settings.JOB_STORE_DIR),
+    settings.JOB_WORKERS,
+    retention_seconds=settings.JOB_RETENTION_SECONDS,
+    cleanup_interval=settings.JOB_CLEANUP_INTERVAL_SECONDS,
+)
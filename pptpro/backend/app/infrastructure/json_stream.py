@@ -0,0 +1,311 @@
+"""
+LLM JSON 응답 파서 - 코드 블록 제거, 스트리밍 증분 파싱, 잘린 JSON 복구
+"""
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+PathSegment = Union[str, int]
+JSONPath = Tuple[PathSegment, ...]
+
+_WHITESPACE = " \t\r\n"
+
+
+class PartialJSONError(ValueError):
+    """응답 JSON이 잘려 일부만 복구된 경우 (복구된 데이터와 누락 필드 포함)"""
+
+    def __init__(self, data: Dict[str, Any], missing_fields: List[str]):
+        super().__init__(f"잘린 JSON 응답 (누락 필드: {', '.join(missing_fields) or '없음'})")
+        self.data = data
+        self.missing_fields = missing_fields
+
+
+@dataclass
+class JSONParseResult:
+    data: Dict[str, Any]
+    complete: bool  # 원문이 온전한 JSON이었는지 (False면 복구된 결과)
+    missing_fields: List[str] = field(default_factory=list)
+
+
+def strip_code_fence(text: str) -> str:
+    """Markdown 코드 블록(```json ... ```) 제거 - 닫는 펜스가 없어도 처리"""
+    text = text.strip()
+    if text.startswith("```"):
+        first_newline = text.find("\n")
+        text = text[first_newline + 1:] if first_newline != -1 else ""
+        if text.rstrip().endswith("```"):
+            text = text.rstrip()[:-3]
+    return text.strip()
+
+
+def format_path(path: JSONPath) -> str:
+    """("outline", 0, "title") -> "outline[0].title" """
+    result = ""
+    for segment in path:
+        if isinstance(segment, int):
+            result += f"[{segment}]"
+        else:
+            result += f".{segment}" if result else segment
+    return result
+
+
+_PATH_SEGMENT = re.compile(r"([^.\[\]]+)|\[(\d+)\]")
+
+
+def parse_path(text: str) -> JSONPath:
+    """"cases[2].description" -> ("cases", 2, "description") (format_path의 역변환)"""
+    path: List[PathSegment] = []
+    position = 0
+    for match in _PATH_SEGMENT.finditer(text):
+        start = match.start()
+        if start != position and not (path and text[position:start] == "." and match.group(1)):
+            raise ValueError(f"잘못된 필드 경로입니다: {text}")
+        path.append(match.group(1) if match.group(1) else int(match.group(2)))
+        position = match.end()
+    if not path or position != len(text) or not isinstance(path[0], str):
+        raise ValueError(f"잘못된 필드 경로입니다: {text}")
+    return tuple(path)
+
+
+def schema_fields(schema: Dict[str, Any], max_depth: int = 2) -> List[str]:
+    """응답 스키마 예시에서 필수 필드 경로 목록 추출 (dict만 하위로 확장)"""
+    fields: List[str] = []
+
+    def walk(node: Dict[str, Any], prefix: str, depth: int) -> None:
+        for key, value in node.items():
+            path = f"{prefix}.{key}" if prefix else key
+            if isinstance(value, dict) and value and depth < max_depth:
+                walk(value, path, depth + 1)
+            else:
+                fields.append(path)
+
+    walk(schema, "", 1)
+    return fields
+
+
+def find_missing_fields(data: Dict[str, Any], required_fields: Iterable[str]) -> List[str]:
+    """점(.)으로 구분된 필드 경로 중 data에 없는 것"""
+    missing = []
+    for path in required_fields:
+        node: Any = data
+        for key in path.split("."):
+            if not isinstance(node, dict) or key not in node:
+                missing.append(path)
+                break
+            node = node[key]
+    return missing
+
+
+def parse_llm_json(text: str, required_fields: Iterable[str] = ()) -> JSONParseResult:
+    """LLM 응답 텍스트를 파싱하고, 잘린 경우 완결된 부분까지 복구"""
+    text = strip_code_fence(text)
+    try:
+        data = json.loads(text)
+    except ValueError:
+        parser = IncrementalJSONParser()
+        parser.feed(text)
+        return parser.result(required_fields)
+
+    if not isinstance(data, dict):
+        return JSONParseResult(data={}, complete=False, missing_fields=list(required_fields))
+    return JSONParseResult(
+        data=data,
+        complete=True,
+        missing_fields=find_missing_fields(data, required_fields),
+    )
+
+
+class _Frame:
+    __slots__ = ("kind", "start", "path", "index", "pending_key", "expect_key")
+
+    def __init__(self, kind: str, start: int, path: JSONPath):
+        self.kind = kind  # "{" 또는 "["
+        self.start = start
+        self.path = path
+        self.index = 0
+        self.pending_key: Optional[str] = None
+        self.expect_key = kind == "{"
+
+
+class IncrementalJSONParser:
+    """스트리밍 JSON 증분 파서
+
+    텍스트 조각을 feed()로 넣으면, emit_depth 깊이에서 완결된 값(예: outline[0],
+    components.title)과 그보다 얕은 스칼라 값을 (경로, 값) 목록으로 반환한다.
+    루트 앞의 설명 문장이나 코드 펜스는 무시한다. finish()는 스트림이 중간에
+    끊겨도 마지막으로 완결된 값까지 잘라 괄호를 닫은 결과를 돌려주고,
+    이때 강제로 닫은 배열/객체 경로는 truncated_fields에 남는다.
+    """
+
+    def __init__(self, emit_depth: int = 2):
+        self.emit_depth = emit_depth
+        self._buf = ""
+        self._pos = 0
+        self._stack: List[_Frame] = []
+        self._root_start: Optional[int] = None
+        self._root_end: Optional[int] = None
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._scalar_start: Optional[int] = None
+        # 복구 시 자를 위치와 그 시점에 닫아야 할 괄호
+        self._safe_end = 0
+        self._safe_closers = ""
+        self._safe_open_paths: List[JSONPath] = []
+        self.truncated_fields: List[str] = []
+
+    @property
+    def done(self) -> bool:
+        return self._root_end is not None
+
+    def feed(self, chunk: str) -> List[Tuple[JSONPath, Any]]:
+        """텍스트 조각을 추가하고 새로 완결된 (경로, 값) 목록 반환"""
+        self._buf += chunk
+        events: List[Tuple[JSONPath, Any]] = []
+        buf = self._buf
+        i = self._pos
+        n = len(buf)
+
+        while i < n and not self.done:
+            c = buf[i]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                    self._on_string_end(i + 1, events)
+                i += 1
+                continue
+
+            if self._scalar_start is not None:
+                if c not in _WHITESPACE and c not in ",}]":
+                    i += 1
+                    continue
+                self._complete_value(self._scalar_start, i, events, validate=True)
+                self._scalar_start = None
+
+            if not self._stack:
+                # 루트 시작 전 텍스트는 무시
+                if c in "{[":
+                    self._root_start = i
+                    self._open(c, i)
+                i += 1
+                continue
+
+            frame = self._stack[-1]
+            if c in _WHITESPACE or c == ":":
+                pass
+            elif c == '"':
+                self._in_string = True
+                self._string_start = i
+            elif c in "{[":
+                self._open(c, i)
+            elif c in "}]":
+                self._close(i, events)
+            elif c == ",":
+                if frame.kind == "{":
+                    frame.expect_key = True
+            else:
+                self._scalar_start = i
+            i += 1
+
+        self._pos = i
+        return events
+
+    def finish(self) -> Tuple[Any, bool]:
+        """(결과, 온전한 JSON 여부) - 잘린 경우 마지막 완결 지점까지 복구"""
+        if self._root_start is None:
+            return {}, False
+        if self._root_end is not None:
+            try:
+                return json.loads(self._buf[self._root_start:self._root_end]), True
+            except ValueError:
+                pass
+        if self._safe_end <= self._root_start:
+            return {}, False
+        try:
+            salvaged = self._buf[self._root_start:self._safe_end] + self._safe_closers
+            data = json.loads(salvaged)
+            self.truncated_fields = [
+                format_path(path) for path in self._safe_open_paths
+                if 0 < len(path) <= self.emit_depth
+            ]
+            return data, False
+        except ValueError:
+            return {}, False
+
+    def result(self, required_fields: Iterable[str] = ()) -> JSONParseResult:
+        """finish() 결과에 누락 필드 정보를 더해 반환"""
+        data, complete = self.finish()
+        if not isinstance(data, dict):
+            data, complete = {}, False
+        missing = find_missing_fields(data, required_fields)
+        if not complete:
+            # 복구 과정에서 강제로 닫힌 배열/객체도 다시 요청해야 할 필드로 보고
+            # (더 구체적인 누락 경로가 이미 있으면 상위 경로는 생략)
+            for path in self.truncated_fields:
+                if path in missing or any(m.startswith(path + ".") for m in missing):
+                    continue
+                missing.append(path)
+        return JSONParseResult(data=data, complete=complete, missing_fields=missing)
+
+    def _mark_safe(self, end: int) -> None:
+        self._safe_end = end
+        self._safe_closers = "".join(
+            "}" if frame.kind == "{" else "]" for frame in reversed(self._stack)
+        )
+        self._safe_open_paths = [frame.path for frame in self._stack]
+
+    def _open(self, kind: str, i: int) -> None:
+        path: JSONPath = ()
+        if self._stack:
+            parent = self._stack[-1]
+            path = parent.path + (parent.pending_key if parent.kind == "{" else parent.index,)
+        self._stack.append(_Frame(kind, i, path))
+        self._mark_safe(i + 1)
+
+    def _close(self, i: int, events: List[Tuple[JSONPath, Any]]) -> None:
+        frame = self._stack.pop()
+        if not self._stack:
+            self._root_end = i + 1
+            return
+        self._complete_value(frame.start, i + 1, events, validate=False)
+
+    def _on_string_end(self, end: int, events: List[Tuple[JSONPath, Any]]) -> None:
+        frame = self._stack[-1]
+        if frame.kind == "{" and frame.expect_key:
+            try:
+                frame.pending_key = json.loads(self._buf[self._string_start:end])
+            except ValueError:
+                frame.pending_key = self._buf[self._string_start + 1:end - 1]
+            frame.expect_key = False
+            return
+        self._complete_value(self._string_start, end, events, validate=True)
+
+    def _complete_value(
+        self, start: int, end: int, events: List[Tuple[JSONPath, Any]], validate: bool
+    ) -> None:
+        parent = self._stack[-1]
+        if parent.kind == "{":
+            segment: PathSegment = parent.pending_key
+        else:
+            segment = parent.index
+            parent.index += 1
+        path = parent.path + (segment,)
+
+        depth = len(path)
+        should_emit = depth == self.emit_depth or (depth < self.emit_depth and validate)
+        value: Any = None
+        if validate or should_emit:
+            try:
+                value = json.loads(self._buf[start:end])
+            except ValueError:
+                return
+
+        self._mark_safe(end)
+        if should_emit:
+            events.append((path, value))
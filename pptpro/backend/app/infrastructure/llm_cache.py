@@ -0,0 +1,210 @@
+"""
+LLM 응답 캐시 - 요청 내용 해시 기반 (메모리 LRU + SQLite 디스크 계층)
+"""
+import asyncio
+import copy
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+def normalize_prompt(prompt: str) -> str:
+    """공백 차이만 있는 프롬프트가 같은 키를 갖도록 정규화"""
+    return re.sub(r"\s+", " ", prompt).strip()
+
+
+def build_request_key(kind: str, prompt: str, model: str, params: Dict[str, Any]) -> str:
+    """요청 내용(프롬프트, 모델, 파라미터)으로부터 캐시 키 생성"""
+    payload = {
+        "kind": kind,
+        "prompt": normalize_prompt(prompt),
+        "model": model,
+        "params": params,
+    }
+    encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """2계층 LLM 응답 캐시
+
+    1차: 프로세스 메모리 LRU (TTL + 엔트리 수/바이트 기준 축출)
+    2차: SQLite 파일 (재시작 후에도 유지)
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str],
+        ttl_seconds: float,
+        memory_max_entries: int,
+        memory_max_bytes: int,
+        disk_max_entries: int,
+    ):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.memory_max_entries = memory_max_entries
+        self.memory_max_bytes = memory_max_bytes
+        self.disk_max_entries = disk_max_entries
+
+        # key -> (expires_at, size_bytes, value)
+        self._memory: "OrderedDict[str, Tuple[float, int, Any]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+
+        self.counters = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "disk_errors": 0,
+        }
+
+    async def get(self, key: str) -> Optional[Any]:
+        """캐시 조회 (메모리 → 디스크 순)"""
+        value = self._memory_get(key)
+        if value is not None:
+            self.counters["memory_hits"] += 1
+            return value
+
+        if self.db_path:
+            entry = await asyncio.to_thread(self._disk_get, key)
+            if entry is not None:
+                expires_at, value = entry
+                self.counters["disk_hits"] += 1
+                # 디스크 히트는 메모리로 승격
+                self._memory_set(key, copy.deepcopy(value), expires_at)
+                return value
+
+        self.counters["misses"] += 1
+        return None
+
+    async def set(self, key: str, value: Any) -> None:
+        """캐시 저장 (두 계층 모두)"""
+        expires_at = time.time() + self.ttl_seconds
+        self.counters["writes"] += 1
+        self._memory_set(key, copy.deepcopy(value), expires_at)
+        if self.db_path:
+            await asyncio.to_thread(self._disk_set, key, value, expires_at)
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 사이징을 위한 카운터"""
+        lookups = self.counters["memory_hits"] + self.counters["disk_hits"] + self.counters["misses"]
+        hits = self.counters["memory_hits"] + self.counters["disk_hits"]
+        return {
+            **self.counters,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+            "memory_max_bytes": self.memory_max_bytes,
+            "disk_enabled": bool(self.db_path),
+        }
+
+    async def aclose(self) -> None:
+        """SQLite 커넥션 정리"""
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # 메모리 계층
+
+    def _memory_get(self, key: str) -> Optional[Any]:
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        expires_at, _, value = entry
+        if expires_at < time.time():
+            self._memory_remove(key)
+            self.counters["expirations"] += 1
+            return None
+        self._memory.move_to_end(key)
+        # 호출자가 결과를 수정해도 캐시 원본이 바뀌지 않도록 복사본 반환
+        return copy.deepcopy(value)
+
+    def _memory_set(self, key: str, value: Any, expires_at: float) -> None:
+        size = len(json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"))
+        if size > self.memory_max_bytes:
+            return
+        self._memory_remove(key)
+        self._memory[key] = (expires_at, size, value)
+        self._memory_bytes += size
+
+        while self._memory and (
+            len(self._memory) > self.memory_max_entries
+            or self._memory_bytes > self.memory_max_bytes
+        ):
+            oldest_key = next(iter(self._memory))
+            self._memory_remove(oldest_key)
+            self.counters["evictions"] += 1
+
+    def _memory_remove(self, key: str) -> None:
+        entry = self._memory.pop(key, None)
+        if entry is not None:
+            self._memory_bytes -= entry[1]
+
+    # 디스크 계층 (스레드에서 실행)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_llm_cache_created ON llm_cache (created_at)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def _disk_get(self, key: str) -> Optional[Tuple[float, Any]]:
+        try:
+            with self._db_lock:
+                row = self._connect().execute(
+                    "SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                if row[1] < time.time():
+                    self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    self._conn.commit()
+                    self.counters["expirations"] += 1
+                    return None
+            return row[1], json.loads(row[0])
+        except (sqlite3.Error, ValueError):
+            self.counters["disk_errors"] += 1
+            return None
+
+    def _disk_set(self, key: str, value: Any, expires_at: float) -> None:
+        try:
+            encoded = json.dumps(value, ensure_ascii=False, default=str)
+            with self._db_lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, value, expires_at, created_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, encoded, expires_at, time.time()),
+                )
+                # 만료 항목 및 초과분(오래된 순) 정리
+                conn.execute("DELETE FROM llm_cache WHERE expires_at < ?", (time.time(),))
+                conn.execute(
+                    "DELETE FROM llm_cache WHERE key IN ("
+                    "SELECT key FROM llm_cache ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                    (self.disk_max_entries,),
+                )
+                conn.commit()
+        except (sqlite3.Error, TypeError, ValueError):
+            self.counters["disk_errors"] += 1
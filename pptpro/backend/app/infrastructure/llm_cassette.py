@@ -0,0 +1,452 @@
+"""
+LLM 녹화/재생 Provider - 네트워크 없는 부하 테스트용
+
+- record: 실제 Provider 응답을 요청 해시별 파일로 저장
+- replay: 저장된 응답을 녹화 당시 지연으로 재생 (없으면 synthetic 응답 또는 오류)
+- synthetic: 스키마에 맞는 JSON을 결정적으로 생성하고, 설정한 지연 분포로 응답
+"""
+import asyncio
+import json
+import math
+import os
+import random
+import re
+import time
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from app.infrastructure.llm_cache import build_request_key
+from app.infrastructure.llm_provider import (
+    GENERATE_DEFAULTS,
+    STRUCTURED_DEFAULTS,
+    LLMProvider,
+    LLMResponse,
+    build_structured_prompt,
+)
+from app.infrastructure.llm_retry import LLMProviderError
+from app.infrastructure.llm_telemetry import note_upstream_attempt, note_upstream_response
+from app.infrastructure.rate_limiter import estimate_tokens
+
+TEMPLATE_TYPES = ["message_only", "asis_tobe", "case_box", "step_flow", "chart_insight", "node_map"]
+SLIDE_PURPOSES = ["problem_statement", "current_state", "analysis", "solution", "implementation", "conclusion"]
+
+# slide_content_service의 템플릿별 components 구조 (synthetic 응답 생성용 예시)
+SYNTHETIC_COMPONENTS = {
+    "message_only": {
+        "title": "string",
+        "main_message": "string",
+        "bullet_points": ["string"],
+        "call_to_action": "string",
+    },
+    "asis_tobe": {
+        "as_is_title": "string",
+        "as_is_points": ["string"],
+        "to_be_title": "string",
+        "to_be_points": ["string"],
+        "transition_method": "string",
+    },
+    "case_box": {
+        "cases": [{
+            "title": "string",
+            "description": "string",
+            "pros": ["string"],
+            "cons": ["string"],
+            "recommendation": "string",
+        }],
+        "insight_box": "string",
+    },
+    "step_flow": {
+        "steps": [{
+            "order": "number",
+            "title": "string",
+            "description": "string",
+            "deliverables": ["string"],
+            "timeline": "string",
+        }],
+        "action_guide": "string",
+    },
+    "chart_insight": {
+        "chart_title": "string",
+        "chart_type": "string",
+        "key_insights": ["string"],
+        "data_source": "string",
+        "evidence_block": "string",
+        "insight_box": "string",
+    },
+    "node_map": {
+        "central_concept": "string",
+        "primary_nodes": ["string"],
+        "connections": [{"from": "string", "to": "string", "relationship": "string"}],
+        "insight_box": "string",
+    },
+}
+
+_WORDS = [
+    "고객", "시장", "데이터", "전략", "성장", "효율", "비용", "혁신", "프로세스", "경쟁력",
+    "디지털", "전환", "품질", "운영", "매출", "리스크", "조직", "역량", "플랫폼", "서비스",
+    "자동화", "분석", "개선", "확대", "최적화", "투자", "협업", "성과", "채널", "브랜드",
+]
+_ELEMENT_TYPES = ["title", "sub_message", "bullet_points", "diagram", "insight_box", "action_guide", "caption", "data"]
+
+
+class SyntheticResponder:
+    """요청 내용으로 시드를 정해 항상 같은 응답을 만드는 합성 응답기"""
+
+    def structured(self, key: str, schema: Dict[str, Any]) -> Dict[str, Any]:
+        """스키마 예시(필드명 → 타입 설명)를 채운 JSON"""
+        rng = random.Random(key)
+        result = self._fill(schema, None, rng, 0)
+        # 다중 슬라이드 배치 스키마는 슬라이드 키별로 같은 구조가 들어 있음
+        for entry in [result, *result.values()]:
+            if not isinstance(entry, dict):
+                continue
+            content = entry.get("content")
+            if "user_needed_fields" in entry and isinstance(content, dict):
+                names = list(content.keys())
+                entry["user_needed_fields"] = rng.sample(names, k=min(1, len(names)))
+        return result
+
+    def text(self, key: str, prompt: str) -> str:
+        """generate() 프롬프트 종류(분류, 템플릿 추천, 컴포넌트 생성)에 맞는 응답 텍스트"""
+        rng = random.Random(key)
+        if "USER_NEEDED와 AI_GENERATED로 분류" in prompt:
+            return json.dumps(self._classification(rng), ensure_ascii=False)
+        if "템플릿을 추천" in prompt:
+            return json.dumps(self._template_suggestion(rng), ensure_ascii=False)
+        match = re.search(r"\*\*슬라이드 타입\*\*: (\w+)", prompt)
+        if match and match.group(1) in SYNTHETIC_COMPONENTS:
+            components = self._fill(SYNTHETIC_COMPONENTS[match.group(1)], None, rng, 0)
+            return json.dumps({"components": components}, ensure_ascii=False)
+        return " ".join(self._sentence(rng) + "." for _ in range(rng.randint(3, 6)))
+
+    def _fill(self, example: Any, key: Optional[str], rng: random.Random, index: int) -> Any:
+        if isinstance(example, dict):
+            return {name: self._fill(value, name, rng, index) for name, value in example.items()}
+        if isinstance(example, list):
+            item = example[0] if example else "string"
+            return [self._fill(item, key, rng, i) for i in range(rng.randint(3, 4))]
+        if isinstance(example, bool):
+            return rng.random() < 0.5
+        if isinstance(example, (int, float)):
+            return index + 1
+        return self._value(key, str(example), rng, index)
+
+    def _value(self, key: Optional[str], hint: str, rng: random.Random, index: int) -> Any:
+        if key == "order" or hint.startswith(("int", "number")):
+            return index + 1
+        if key == "purpose":
+            return SLIDE_PURPOSES[index % len(SLIDE_PURPOSES)]
+        if key in ("template_type", "template_suggestion"):
+            return TEMPLATE_TYPES[index % len(TEMPLATE_TYPES)]
+        if key == "chart_type":
+            return rng.choice(["bar", "line", "pie"])
+        if hint == "object":
+            labels = [f"{rng.choice(_WORDS)} {i + 1}" for i in range(rng.randint(4, 8))]
+            return {"labels": labels, "values": [rng.randint(10, 100) for _ in labels]}
+        if key and key.endswith(("title", "concept", "from", "to")):
+            return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(2, 3)))
+        return self._sentence(rng)
+
+    def _classification(self, rng: random.Random) -> Dict[str, Any]:
+        def element(classification: str) -> Dict[str, str]:
+            return {
+                "element_type": rng.choice(_ELEMENT_TYPES),
+                "description": self._sentence(rng),
+                "classification": classification,
+                "reason": self._sentence(rng),
+            }
+        return {
+            "user_needed": [element("USER_NEEDED") for _ in range(rng.randint(1, 2))],
+            "ai_generated": [element("AI_GENERATED") for _ in range(rng.randint(2, 3))],
+        }
+
+    def _template_suggestion(self, rng: random.Random) -> Dict[str, Any]:
+        template_type = rng.choice(TEMPLATE_TYPES)
+        return {
+            "template_type": template_type,
+            "reason": f"{self._sentence(rng)}. {self._sentence(rng)}.",
+            "components": [
+                {"type": element_type, "description": self._sentence(rng), "required": rng.random() < 0.7}
+                for element_type in rng.sample(_ELEMENT_TYPES, k=rng.randint(3, 5))
+            ],
+            "alternative_templates": rng.sample([t for t in TEMPLATE_TYPES if t != template_type], k=2),
+        }
+
+    @staticmethod
+    def _sentence(rng: random.Random) -> str:
+        return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(5, 10)))
+
+
+class LatencyModel:
+    """합성 응답 지연 = 분포에서 뽑은 기본 지연 + 출력 토큰당 지연
+
+    distribution: "fixed"(median), "uniform"(median ± spread 비율), "lognormal"(median, sigma=spread)
+    """
+
+    def __init__(self, distribution: str, median_ms: float, spread: float, per_token_ms: float, seed: int = 0):
+        if distribution not in ("fixed", "uniform", "lognormal"):
+            raise ValueError(f"지원하지 않는 지연 분포입니다: {distribution}")
+        self.distribution = distribution
+        self.median_ms = median_ms
+        self.spread = spread
+        self.per_token_ms = per_token_ms
+        self._rng = random.Random(seed)
+
+    def first_token_seconds(self) -> float:
+        if self.distribution == "fixed":
+            ms = self.median_ms
+        elif self.distribution == "uniform":
+            ms = self._rng.uniform(self.median_ms * (1 - self.spread), self.median_ms * (1 + self.spread))
+        else:
+            ms = self.median_ms * math.exp(self._rng.gauss(0, self.spread))
+        return max(0.0, ms) / 1000
+
+    def per_token_seconds(self) -> float:
+        return self.per_token_ms / 1000
+
+
+class SyntheticLLMProvider(LLMProvider):
+    """스키마에 맞는 합성 응답을 설정한 지연/토큰 수로 반환하는 Provider"""
+
+    def __init__(
+        self,
+        latency: LatencyModel,
+        completion_tokens: int = 0,
+        model: str = "synthetic",
+        responder: Optional[SyntheticResponder] = None,
+    ):
+        self.latency = latency
+        self.completion_tokens = completion_tokens  # 0이면 생성한 텍스트로 추정
+        self.model = model
+        self.responder = responder or SyntheticResponder()
+
+    async def generate(self, prompt: str, **kwargs) -> LLMResponse:
+        params = _request_params(GENERATE_DEFAULTS, kwargs)
+        text = self.responder.text(build_request_key("generate", prompt, self.model, params), prompt)
+        tokens, elapsed = await self._respond(prompt, text)
+        return LLMResponse(content=text, usage_tokens=tokens, latency_ms=int(elapsed * 1000))
+
+    async def generate_structured(self, prompt: str, schema: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        key = build_request_key("structured", prompt, self.model, _structured_params(schema, kwargs))
+        data = self.responder.structured(key, schema)
+        await self._respond(build_structured_prompt(prompt, schema), json.dumps(data, ensure_ascii=False))
+        return data
+
+    async def generate_stream(
+        self, prompt: str, schema: Optional[Dict[str, Any]] = None, **kwargs
+    ) -> AsyncIterator[str]:
+        if schema is not None:
+            key = build_request_key("structured", prompt, self.model, _structured_params(schema, kwargs))
+            text = json.dumps(self.responder.structured(key, schema), ensure_ascii=False)
+            prompt = build_structured_prompt(prompt, schema)
+        else:
+            key = build_request_key("generate", prompt, self.model, _request_params(GENERATE_DEFAULTS, kwargs))
+            text = self.responder.text(key, prompt)
+
+        note_upstream_attempt()
+        started = time.monotonic()
+        await asyncio.sleep(self.latency.first_token_seconds())
+        for chunk in _chunks(text):
+            await asyncio.sleep(self.latency.per_token_seconds() * estimate_tokens(chunk))
+            yield chunk
+        note_upstream_response(time.monotonic() - started, self._usage_tokens(prompt, text))
+
+    async def _respond(self, prompt: str, text: str):
+        """지연을 흉내 내고 (토큰 수, 소요 시간) 반환"""
+        note_upstream_attempt()
+        started = time.monotonic()
+        completion = self.completion_tokens or estimate_tokens(text)
+        await asyncio.sleep(self.latency.first_token_seconds() + self.latency.per_token_seconds() * completion)
+        elapsed = time.monotonic() - started
+        tokens = self._usage_tokens(prompt, text)
+        note_upstream_response(elapsed, tokens)
+        return tokens, elapsed
+
+    def _usage_tokens(self, prompt: str, text: str) -> int:
+        return estimate_tokens(prompt) + (self.completion_tokens or estimate_tokens(text))
+
+
+class CassetteStore:
+    """요청 해시별 JSON 파일로 저장된 녹화 응답"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._entries: Dict[str, Optional[Dict[str, Any]]] = {}
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        if key not in self._entries:
+            try:
+                with open(self._path(key), encoding="utf-8") as f:
+                    self._entries[key] = json.load(f)
+            except (OSError, ValueError):
+                self._entries[key] = None
+        return self._entries[key]
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f"{self._path(key)}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self._path(key))
+        self._entries[key] = entry
+
+
+class CassetteLLMProvider(LLMProvider):
+    """녹화/재생 Provider
+
+    record 모드는 inner(실제 Provider)를 호출하고 응답을 저장한다.
+    replay 모드는 같은 요청 해시의 응답을 녹화 당시 지연 × latency_scale로 재생하며,
+    녹화가 없으면 fallback(synthetic Provider)을 쓰거나 LLMProviderError를 발생시킨다.
+    """
+
+    def __init__(
+        self,
+        store: CassetteStore,
+        mode: str,
+        model: str,
+        inner: Optional[LLMProvider] = None,
+        fallback: Optional[LLMProvider] = None,
+        latency_scale: float = 1.0,
+    ):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"지원하지 않는 카세트 모드입니다: {mode}")
+        if mode == "record" and inner is None:
+            raise ValueError("record 모드에는 실제 Provider가 필요합니다")
+        self.store = store
+        self.mode = mode
+        self.model = model
+        self.inner = inner
+        self.fallback = fallback
+        self.latency_scale = latency_scale
+
+    async def generate(self, prompt: str, **kwargs) -> LLMResponse:
+        params = _request_params(GENERATE_DEFAULTS, kwargs)
+        key = build_request_key("generate", prompt, self.model, params)
+        if self.mode == "record":
+            started = time.monotonic()
+            response = await self.inner.generate(prompt, **kwargs)
+            await self._record(key, "generate", prompt, params, {"content": response.content},
+                               response.usage_tokens, time.monotonic() - started)
+            return response
+
+        entry = await self._replay(key)
+        if entry is None:
+            return await self._miss(key).generate(prompt, **kwargs)
+        return LLMResponse(
+            content=entry["response"]["content"],
+            usage_tokens=entry.get("usage_tokens"),
+            latency_ms=entry.get("latency_ms"),
+        )
+
+    async def generate_structured(self, prompt: str, schema: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        params = _structured_params(schema, kwargs)
+        key = build_request_key("structured", prompt, self.model, params)
+        if self.mode == "record":
+            started = time.monotonic()
+            result = await self.inner.generate_structured(prompt, schema, **kwargs)
+            await self._record(key, "structured", prompt, params, result, None, time.monotonic() - started)
+            return result
+
+        entry = await self._replay(key)
+        if entry is None:
+            return await self._miss(key).generate_structured(prompt, schema, **kwargs)
+        return entry["response"]
+
+    async def generate_stream(
+        self, prompt: str, schema: Optional[Dict[str, Any]] = None, **kwargs
+    ) -> AsyncIterator[str]:
+        # 비스트리밍 호출과 같은 키로 녹화/재생
+        if schema is not None:
+            kind, params = "structured", _structured_params(schema, kwargs)
+        else:
+            kind, params = "generate", _request_params(GENERATE_DEFAULTS, kwargs)
+        key = build_request_key(kind, prompt, self.model, params)
+
+        if self.mode == "record":
+            started = time.monotonic()
+            chunks: List[str] = []
+            async for chunk in self.inner.generate_stream(prompt, schema, **kwargs):
+                chunks.append(chunk)
+                yield chunk
+            text = "".join(chunks)
+            try:
+                response = json.loads(text) if schema is not None else {"content": text}
+            except ValueError:
+                # 잘린 JSON은 녹화하지 않음
+                return
+            await self._record(key, kind, prompt, params, response, None, time.monotonic() - started)
+            return
+
+        entry = await self._replay(key, sleep=False)
+        if entry is None:
+            async for chunk in self._miss(key).generate_stream(prompt, schema, **kwargs):
+                yield chunk
+            return
+        response = entry["response"]
+        text = json.dumps(response, ensure_ascii=False) if schema is not None else response["content"]
+        pieces = _chunks(text)
+        # 녹화 당시 전체 지연을 조각에 나눠 재생
+        delay = (entry.get("latency_ms") or 0) / 1000 * self.latency_scale / max(1, len(pieces))
+        for piece in pieces:
+            await asyncio.sleep(delay)
+            yield piece
+
+    async def aclose(self) -> None:
+        if self.inner is not None:
+            await self.inner.aclose()
+        if self.fallback is not None:
+            await self.fallback.aclose()
+
+    async def _record(
+        self,
+        key: str,
+        kind: str,
+        prompt: str,
+        params: Dict[str, Any],
+        response: Any,
+        usage_tokens: Optional[int],
+        elapsed: float,
+    ) -> None:
+        entry = {
+            "key": key,
+            "kind": kind,
+            "model": self.model,
+            "params": params,
+            "prompt": prompt,
+            "response": response,
+            "usage_tokens": usage_tokens,
+            "latency_ms": int(elapsed * 1000),
+            "recorded_at": datetime.utcnow().isoformat(),
+        }
+        await asyncio.to_thread(self.store.put, key, entry)
+
+    async def _replay(self, key: str, sleep: bool = True) -> Optional[Dict[str, Any]]:
+        entry = await asyncio.to_thread(self.store.get, key)
+        if entry is None:
+            return None
+        note_upstream_attempt()
+        latency = (entry.get("latency_ms") or 0) / 1000 * self.latency_scale
+        if sleep and latency > 0:
+            await asyncio.sleep(latency)
+        note_upstream_response(latency, entry.get("usage_tokens"))
+        return entry
+
+    def _miss(self, key: str) -> LLMProvider:
+        if self.fallback is None:
+            raise LLMProviderError(f"카세트에 녹화된 응답이 없습니다: {key}", kind="cassette_miss")
+        return self.fallback
+
+
+def _request_params(defaults: Dict[str, Any], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    return {name: kwargs.get(name, default) for name, default in defaults.items()}
+
+
+def _structured_params(schema: Dict[str, Any], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    return {**_request_params(STRUCTURED_DEFAULTS, kwargs), "response_format": "json_object", "schema": schema}
+
+
+def _chunks(text: str, size: int = 8) -> List[str]:
+    return [text[start:start + size] for start in range(0, len(text), size)]
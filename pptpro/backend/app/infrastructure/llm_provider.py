@@ -1,12 +1,49 @@
 """
 LLM Provider 추상화 레이어
 """
+import asyncio
+import copy
+import importlib.util
+import json
+import os
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
-from dataclasses import dataclass
+from contextlib import nullcontext
+from typing import AsyncContextManager, AsyncIterator, ContextManager, Dict, Any, List, Optional, Tuple
+from dataclasses import asdict, dataclass
 import openai
 import httpx
 from app.core.config import settings
+from app.db.memory_store import GenerationLog, generation_log_store
+from app.infrastructure.json_stream import PartialJSONError, parse_llm_json, schema_fields
+from app.infrastructure.llm_cache import LLMResponseCache, build_request_key
+from app.infrastructure.llm_telemetry import (
+    LLMCallRecord,
+    LLMTelemetry,
+    current_llm_call,
+    note_upstream_attempt,
+    note_upstream_response,
+    track_llm_call,
+)
+from app.infrastructure.llm_retry import (
+    Hedger,
+    LatencyTracker,
+    RetryPolicy,
+    provider_error,
+    retry_after_seconds,
+)
+from app.infrastructure.rate_limiter import (
+    AdaptiveConcurrency,
+    LLMRateLimiter,
+    RatePermit,
+    estimate_tokens,
+)
+from app.infrastructure.single_flight import SingleFlight
+
+
+# 호출 종류별 기본 생성 파라미터 (Provider와 캐시 키가 같은 값을 사용)
+GENERATE_DEFAULTS = {"max_tokens": 1000, "temperature": 0.7}
+STRUCTURED_DEFAULTS = {"max_tokens": 1500, "temperature": 0.3}
 
 
 @dataclass
@@ -18,6 +55,8 @@ class LLMResponse:
 
 class LLMProvider(ABC):
     """LLM Provider 추상 기본 클래스"""
+
+    model: str = ""
     
     @abstractmethod
     async def generate(self, prompt: str, **kwargs) -> LLMResponse:
@@ -29,22 +68,155 @@ class LLMProvider(ABC):
         """구조화된 JSON 응답 생성"""
         pass
 
+    @abstractmethod
+    def generate_stream(
+        self, prompt: str, schema: Optional[Dict[str, Any]] = None, **kwargs
+    ) -> AsyncIterator[str]:
+        """토큰 스트리밍 생성 (schema가 있으면 JSON 모드로 생성한 원문 텍스트 조각)"""
+        pass
+
+    async def aclose(self) -> None:
+        """보유한 커넥션 등 리소스 정리"""
+        pass
+
+
+def build_structured_prompt(prompt: str, schema: Dict[str, Any]) -> str:
+    """JSON 형식 요청을 프롬프트에 추가"""
+    return f"{prompt}\n\n응답은 반드시 다음 JSON 형식으로 해주세요:\n{schema}"
+
+
+def build_llm_http_client() -> httpx.AsyncClient:
+    """LLM 호출용 공유 httpx 클라이언트 (커넥션 풀, keep-alive, HTTP/2)"""
+    limits = httpx.Limits(
+        max_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.LLM_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    )
+    timeout = httpx.Timeout(
+        settings.LLM_HTTP_TIMEOUT_SECONDS,
+        connect=settings.LLM_HTTP_CONNECT_TIMEOUT_SECONDS,
+    )
+    # HTTP/2는 h2 패키지가 설치된 경우에만 활성화
+    http2 = settings.LLM_HTTP2 and importlib.util.find_spec("h2") is not None
+    return httpx.AsyncClient(limits=limits, timeout=timeout, http2=http2)
+
+
+def build_llm_rate_limiter() -> LLMRateLimiter:
+    """설정값으로 호출 속도 제한기 생성"""
+    concurrency = AdaptiveConcurrency(
+        initial=settings.LLM_CONCURRENCY_INITIAL,
+        minimum=settings.LLM_CONCURRENCY_MIN,
+        maximum=settings.LLM_CONCURRENCY_MAX,
+        latency_spike_ratio=settings.LLM_CONCURRENCY_LATENCY_SPIKE_RATIO,
+        decrease_factor=settings.LLM_CONCURRENCY_DECREASE_FACTOR,
+    )
+    return LLMRateLimiter(
+        requests_per_minute=settings.LLM_RATE_LIMIT_RPM,
+        tokens_per_minute=settings.LLM_RATE_LIMIT_TPM,
+        concurrency=concurrency,
+        queue_timeout=settings.LLM_RATE_LIMIT_QUEUE_TIMEOUT_SECONDS,
+    )
+
 
 class OpenAIProvider(LLMProvider):
     """OpenAI API Provider"""
     
-    def __init__(self, api_key: str, model: str = "gpt-3.5-turbo"):
-        self.client = openai.AsyncOpenAI(api_key=api_key)
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-3.5-turbo",
+        http_client: Optional[httpx.AsyncClient] = None,
+        rate_limiter: Optional[LLMRateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        hedger: Optional[Hedger] = None,
+    ):
+        # 재시도 정책이 있으면 SDK 자체 재시도는 끔 (429가 속도 제한기에 보이도록)
+        max_retries = 0 if retry_policy is not None else openai.DEFAULT_MAX_RETRIES
+        self.client = openai.AsyncOpenAI(
+            api_key=api_key, http_client=http_client, max_retries=max_retries
+        )
         self.model = model
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.hedger = hedger
+        # (JSON 모드 여부, max_tokens)별 지연 분포 - 호출 크기가 비슷한 것끼리 비교
+        self._latency: Dict[Tuple[bool, int], LatencyTracker] = {}
+    
+    async def _create(self, hedge: bool = False, **request) -> Any:
+        """chat completion 호출 (재시도, hedge=True면 p95 지연 초과 시 헤지 요청)"""
+        if hedge and self.hedger is not None:
+            delay = self.hedger.delay_for(self._latency_tracker(request))
+            if delay is not None:
+                return await self.hedger.run(lambda: self._create_with_retry(request), delay)
+        return await self._create_with_retry(request)
+    
+    async def _create_with_retry(self, request: Dict[str, Any]) -> Any:
+        attempt = 0
+        while True:
+            try:
+                return await self._create_once(request)
+            except Exception as e:
+                attempt += 1
+                delay = self._retry_delay(e, attempt)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+    
+    async def _create_once(self, request: Dict[str, Any]) -> Any:
+        """속도 제한기 슬롯을 얻은 뒤 한 번 호출"""
+        async with self._slot(request) as permit:
+            started = time.monotonic()
+            response = await self._call_upstream(permit, request)
+            elapsed = time.monotonic() - started
+            self._latency_tracker(request).record(elapsed)
+            tokens = response.usage.total_tokens if response.usage else None
+            if permit is not None:
+                permit.record_tokens(tokens)
+            note_upstream_response(elapsed, tokens)
+            return response
+    
+    def _slot(self, request: Dict[str, Any]) -> AsyncContextManager[Optional[RatePermit]]:
+        if self.rate_limiter is None:
+            return nullcontext()
+        return self.rate_limiter.acquire(
+            self._estimate_request_tokens(request), output_tokens=request["max_tokens"]
+        )
+    
+    async def _call_upstream(self, permit: Optional[RatePermit], request: Dict[str, Any]) -> Any:
+        note_upstream_attempt()
+        try:
+            return await self.client.chat.completions.create(**request)
+        except openai.RateLimitError as e:
+            if permit is not None:
+                permit.overloaded(retry_after_seconds(e))
+            raise
+    
+    def _retry_delay(self, error: Exception, attempt: int) -> Optional[float]:
+        if self.retry_policy is None:
+            return None
+        return self.retry_policy.next_delay(error, attempt)
+    
+    def _latency_tracker(self, request: Dict[str, Any]) -> LatencyTracker:
+        key = ("response_format" in request, request["max_tokens"])
+        if key not in self._latency:
+            self._latency[key] = LatencyTracker()
+        return self._latency[key]
+    
+    @staticmethod
+    def _estimate_request_tokens(request: Dict[str, Any]) -> int:
+        prompt_tokens = sum(estimate_tokens(message["content"]) for message in request["messages"])
+        return prompt_tokens + request["max_tokens"]
     
     async def generate(self, prompt: str, **kwargs) -> LLMResponse:
         """일반 텍스트 생성"""
+        started = time.monotonic()
         try:
-            response = await self.client.chat.completions.create(
+            response = await self._create(
+                hedge=kwargs.get("hedge", False),
                 model=self.model,
                 messages=[{"role": "user", "content": prompt}],
-                max_tokens=kwargs.get("max_tokens", 1000),
-                temperature=kwargs.get("temperature", 0.7)
+                max_tokens=kwargs.get("max_tokens", GENERATE_DEFAULTS["max_tokens"]),
+                temperature=kwargs.get("temperature", GENERATE_DEFAULTS["temperature"])
             )
             
             content = response.choices[0].message.content
@@ -52,37 +224,107 @@ class OpenAIProvider(LLMProvider):
             
             return LLMResponse(
                 content=content,
-                usage_tokens=tokens
+                usage_tokens=tokens,
+                latency_ms=int((time.monotonic() - started) * 1000)
             )
         except Exception as e:
-            raise Exception(f"OpenAI API Error: {str(e)}")
+            raise provider_error("OpenAI API Error", e) from e
     
     async def generate_structured(self, prompt: str, schema: Dict[str, Any], **kwargs) -> Dict[str, Any]:
         """JSON 모드를 사용한 구조화된 응답"""
         try:
             # JSON 형식 요청을 프롬프트에 추가
-            json_prompt = f"{prompt}\n\n응답은 반드시 다음 JSON 형식으로 해주세요:\n{schema}"
+            json_prompt = build_structured_prompt(prompt, schema)
             
-            response = await self.client.chat.completions.create(
+            response = await self._create(
+                hedge=kwargs.get("hedge", False),
                 model=self.model,
                 messages=[{"role": "user", "content": json_prompt}],
-                max_tokens=kwargs.get("max_tokens", 1500),
-                temperature=kwargs.get("temperature", 0.3),
+                max_tokens=kwargs.get("max_tokens", STRUCTURED_DEFAULTS["max_tokens"]),
+                temperature=kwargs.get("temperature", STRUCTURED_DEFAULTS["temperature"]),
                 response_format={"type": "json_object"}
             )
             
             content = response.choices[0].message.content
             
-            # JSON 파싱
-            import json
-            return json.loads(content)
+            # JSON 파싱 - max_tokens로 잘린 응답은 완결된 부분까지 복구해 PartialJSONError로 전달
+            parsed = parse_llm_json(content, schema_fields(schema))
+            if not parsed.complete:
+                raise PartialJSONError(parsed.data, parsed.missing_fields)
+            return parsed.data
             
+        except PartialJSONError:
+            raise
         except Exception as e:
-            raise Exception(f"OpenAI Structured API Error: {str(e)}")
+            raise provider_error("OpenAI Structured API Error", e) from e
+
+    async def generate_stream(
+        self, prompt: str, schema: Optional[Dict[str, Any]] = None, **kwargs
+    ) -> AsyncIterator[str]:
+        """응답 토큰이 도착하는 대로 텍스트 조각을 반환"""
+        defaults = STRUCTURED_DEFAULTS if schema is not None else GENERATE_DEFAULTS
+        request_kwargs: Dict[str, Any] = {}
+        if schema is not None:
+            prompt = build_structured_prompt(prompt, schema)
+            request_kwargs["response_format"] = {"type": "json_object"}
+        
+        request = {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": kwargs.get("max_tokens", defaults["max_tokens"]),
+            "temperature": kwargs.get("temperature", defaults["temperature"]),
+            "stream": True,
+            # 마지막 청크로 토큰 사용량을 받음
+            "stream_options": {"include_usage": True},
+            **request_kwargs,
+        }
+        
+        attempt = 0
+        while True:
+            started_streaming = False
+            try:
+                # 스트림이 끝날 때까지 슬롯 유지 (응답 길이에 좌우되는 지연은 동시성 조절에 쓰지 않음)
+                async with self._slot(request) as permit:
+                    if permit is not None:
+                        permit.observe_latency = False
+                    started = time.monotonic()
+                    stream = await self._call_upstream(permit, request)
+                    tokens = None
+                    async for chunk in stream:
+                        if chunk.usage:
+                            tokens = chunk.usage.total_tokens
+                        if chunk.choices and chunk.choices[0].delta.content:
+                            started_streaming = True
+                            yield chunk.choices[0].delta.content
+                    if permit is not None:
+                        permit.record_tokens(tokens)
+                    note_upstream_response(time.monotonic() - started, tokens)
+                return
+            except Exception as e:
+                # 이미 토큰을 내보낸 뒤에는 재시도하면 응답이 중복되므로 실패 처리
+                attempt += 1
+                delay = None if started_streaming else self._retry_delay(e, attempt)
+                if delay is None:
+                    raise provider_error("OpenAI Streaming API Error", e) from e
+                await asyncio.sleep(delay)
+
+    def stats(self) -> Dict[str, Any]:
+        """속도 제한, 재시도, 헤지 요청 현황"""
+        return {
+            "rate_limit": self.rate_limiter.stats() if self.rate_limiter else None,
+            "retries": self.retry_policy.stats()["retries"] if self.retry_policy else None,
+            "hedging": self.hedger.stats() if self.hedger else None,
+        }
+
+    async def aclose(self) -> None:
+        """커넥션 풀 종료"""
+        await self.client.close()
 
 
 class MockLLMProvider(LLMProvider):
     """개발/테스트용 Mock Provider"""
+
+    model = "mock"
     
     async def generate(self, prompt: str, **kwargs) -> LLMResponse:
         """Mock 응답"""
@@ -102,12 +344,376 @@ class MockLLMProvider(LLMProvider):
             "overall_narrative": "Mock narrative for development"
         }
 
+    async def generate_stream(
+        self, prompt: str, schema: Optional[Dict[str, Any]] = None, **kwargs
+    ) -> AsyncIterator[str]:
+        """Mock 응답을 작은 조각으로 나눠 스트리밍"""
+        if schema is not None:
+            text = json.dumps(
+                await self.generate_structured(prompt, schema, **kwargs), ensure_ascii=False
+            )
+        else:
+            text = (await self.generate(prompt, **kwargs)).content
+        
+        chunk_size = 8
+        for start in range(0, len(text), chunk_size):
+            yield text[start:start + chunk_size]
+            await asyncio.sleep(0)
+
+
+def _note_cache_status(status: str) -> None:
+    record = current_llm_call()
+    if record is not None:
+        record.cache_status = status
+
+
+class CachedLLMProvider(LLMProvider):
+    """응답 캐시를 적용하는 Provider 데코레이터
+
+    낮은 temperature(설정값 이하) 호출만 캐시한다. 호출 시 ``use_cache=False``를
+    넘기면 조회를 건너뛰고 새 응답으로 캐시를 갱신한다.
+    """
+
+    def __init__(self, inner: LLMProvider, cache: LLMResponseCache):
+        self.inner = inner
+        self.cache = cache
+        self.model = inner.model
+
+    async def generate(self, prompt: str, **kwargs) -> LLMResponse:
+        use_cache = kwargs.pop("use_cache", True)
+        params = self._cache_params(GENERATE_DEFAULTS, kwargs)
+        if not self._is_cacheable(params):
+            _note_cache_status("bypass")
+            return await self.inner.generate(prompt, **kwargs)
+
+        key = build_request_key("generate", prompt, self.model, params)
+        _note_cache_status("miss" if use_cache else "refresh")
+        if use_cache:
+            cached = await self.cache.get(key)
+            if cached is not None:
+                _note_cache_status("hit")
+                return LLMResponse(
+                    content=cached["content"],
+                    usage_tokens=cached.get("usage_tokens"),
+                    latency_ms=0,
+                )
+
+        response = await self.inner.generate(prompt, **kwargs)
+        await self.cache.set(key, {"content": response.content, "usage_tokens": response.usage_tokens})
+        return response
+
+    async def generate_structured(self, prompt: str, schema: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        use_cache = kwargs.pop("use_cache", True)
+        params = self._cache_params(STRUCTURED_DEFAULTS, kwargs)
+        if not self._is_cacheable(params):
+            _note_cache_status("bypass")
+            return await self.inner.generate_structured(prompt, schema, **kwargs)
+
+        params["response_format"] = "json_object"
+        params["schema"] = schema
+        key = build_request_key("structured", prompt, self.model, params)
+        _note_cache_status("miss" if use_cache else "refresh")
+        if use_cache:
+            cached = await self.cache.get(key)
+            if cached is not None:
+                _note_cache_status("hit")
+                return cached
+
+        result = await self.inner.generate_structured(prompt, schema, **kwargs)
+        await self.cache.set(key, result)
+        return result
+
+    async def generate_stream(
+        self, prompt: str, schema: Optional[Dict[str, Any]] = None, **kwargs
+    ) -> AsyncIterator[str]:
+        """캐시 히트는 한 번에 반환하고, 미스는 스트림을 전달하며 완료 후 저장"""
+        use_cache = kwargs.pop("use_cache", True)
+        defaults = STRUCTURED_DEFAULTS if schema is not None else GENERATE_DEFAULTS
+        params = self._cache_params(defaults, kwargs)
+        if not self._is_cacheable(params):
+            _note_cache_status("bypass")
+            async for chunk in self.inner.generate_stream(prompt, schema, **kwargs):
+                yield chunk
+            return
+
+        # 비스트리밍 호출과 같은 키를 사용해 캐시를 공유
+        if schema is not None:
+            params["response_format"] = "json_object"
+            params["schema"] = schema
+            key = build_request_key("structured", prompt, self.model, params)
+        else:
+            key = build_request_key("generate", prompt, self.model, params)
+
+        _note_cache_status("miss" if use_cache else "refresh")
+        if use_cache:
+            cached = await self.cache.get(key)
+            if cached is not None:
+                _note_cache_status("hit")
+                yield json.dumps(cached, ensure_ascii=False) if schema is not None else cached["content"]
+                return
+
+        chunks = []
+        async for chunk in self.inner.generate_stream(prompt, schema, **kwargs):
+            chunks.append(chunk)
+            yield chunk
+
+        text = "".join(chunks)
+        if schema is None:
+            await self.cache.set(key, {"content": text, "usage_tokens": None})
+            return
+        try:
+            await self.cache.set(key, json.loads(text))
+        except ValueError:
+            # 잘린 JSON 등은 캐시하지 않음
+            pass
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+    @staticmethod
+    def _cache_params(defaults: Dict[str, Any], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        return {name: kwargs.get(name, default) for name, default in defaults.items()}
+
+    @staticmethod
+    def _is_cacheable(params: Dict[str, Any]) -> bool:
+        return params["temperature"] <= settings.LLM_CACHE_MAX_TEMPERATURE
+
+
+class SingleFlightLLMProvider(LLMProvider):
+    """동일한 요청이 동시에 들어오면 upstream 호출 한 번의 결과를 공유하는 데코레이터"""
+
+    def __init__(self, inner: LLMProvider, flight: SingleFlight):
+        self.inner = inner
+        self.flight = flight
+        self.model = inner.model
+
+    async def generate(self, prompt: str, **kwargs) -> LLMResponse:
+        key = build_request_key("generate", prompt, self.model, {**GENERATE_DEFAULTS, **kwargs})
+        self._note_coalesced(key)
+        response = await self.flight.do(key, lambda: self.inner.generate(prompt, **kwargs))
+        return copy.deepcopy(response)
+
+    async def generate_structured(self, prompt: str, schema: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        params = {**STRUCTURED_DEFAULTS, **kwargs, "schema": schema}
+        key = build_request_key("structured", prompt, self.model, params)
+        self._note_coalesced(key)
+        result = await self.flight.do(
+            key, lambda: self.inner.generate_structured(prompt, schema, **kwargs)
+        )
+        # 공유된 결과를 호출자별로 독립적으로 수정할 수 있도록 복사
+        return copy.deepcopy(result)
+
+    async def generate_stream(
+        self, prompt: str, schema: Optional[Dict[str, Any]] = None, **kwargs
+    ) -> AsyncIterator[str]:
+        # 스트림은 호출자별로 소비되므로 합치지 않고 그대로 전달
+        async for chunk in self.inner.generate_stream(prompt, schema, **kwargs):
+            yield chunk
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+    def _note_coalesced(self, key: str) -> None:
+        # 진행 중인 호출에 합류하면 upstream 호출/토큰은 먼저 시작한 쪽 기록에 남음
+        record = current_llm_call()
+        if record is not None and self.flight.in_flight(key):
+            record.cache_status = "coalesced"
+
+
+class TelemetryLLMProvider(LLMProvider):
+    """모든 호출의 지연, 토큰, 캐시 상태를 기록하는 최외곽 데코레이터
+
+    기록은 LLMTelemetry 큐에 넣기만 하므로 호출 경로를 막지 않는다.
+    """
+
+    def __init__(self, inner: LLMProvider, provider_name: str, telemetry: LLMTelemetry):
+        self.inner = inner
+        self.provider_name = provider_name
+        self.telemetry = telemetry
+        self.model = inner.model
+
+    async def generate(self, prompt: str, **kwargs) -> LLMResponse:
+        with self._track("generate") as record:
+            response = await self.inner.generate(prompt, **kwargs)
+            # 캐시 히트는 토큰을 쓰지 않음
+            if record.tokens_used is None and record.cache_status != "hit":
+                record.tokens_used = response.usage_tokens
+            return response
+
+    async def generate_structured(self, prompt: str, schema: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        with self._track("structured"):
+            return await self.inner.generate_structured(prompt, schema, **kwargs)
+
+    async def generate_stream(
+        self, prompt: str, schema: Optional[Dict[str, Any]] = None, **kwargs
+    ) -> AsyncIterator[str]:
+        with self._track("stream"):
+            async for chunk in self.inner.generate_stream(prompt, schema, **kwargs):
+                yield chunk
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+    def _track(self, kind: str) -> ContextManager[LLMCallRecord]:
+        return track_llm_call(kind, self.provider_name, self.model, on_complete=self.telemetry.record)
+
+
+def build_llm_response_cache() -> LLMResponseCache:
+    """설정값으로 응답 캐시 생성"""
+    db_path = None
+    if settings.LLM_CACHE_DISK_ENABLED:
+        db_path = os.path.join(settings.LLM_CACHE_DIR, "llm_cache.sqlite3")
+    return LLMResponseCache(
+        db_path=db_path,
+        ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+        memory_max_entries=settings.LLM_CACHE_MEMORY_MAX_ENTRIES,
+        memory_max_bytes=settings.LLM_CACHE_MEMORY_MAX_BYTES,
+        disk_max_entries=settings.LLM_CACHE_DISK_MAX_ENTRIES,
+    )
+
+
+# 전역 응답 캐시 (모든 provider/model이 공유, 키에 model 포함)
+llm_response_cache = build_llm_response_cache()
+
+# 진행 중인 동일 LLM 요청 합치기
+llm_single_flight = SingleFlight()
+
+
+def _write_generation_logs(records: List[LLMCallRecord]) -> None:
+    """텔레메트리 배치를 GenerationLog 저장소에 기록"""
+    generation_log_store.add_logs([GenerationLog(**asdict(record)) for record in records])
+
+
+# LLM 호출 텔레메트리 (GenerationLog로 일괄 저장)
+llm_telemetry = LLMTelemetry(
+    sink=_write_generation_logs,
+    max_queue_size=settings.LLM_TELEMETRY_QUEUE_SIZE,
+    batch_size=settings.LLM_TELEMETRY_BATCH_SIZE,
+    flush_interval=settings.LLM_TELEMETRY_FLUSH_INTERVAL_SECONDS,
+)
+
+
+class LLMProviderRegistry:
+    """프로세스 전역 LLM Provider 레지스트리
+
+    provider/model 조합별로 하나의 인스턴스(= 하나의 커넥션 풀)를 유지해
+    요청마다 클라이언트를 새로 만들고 TLS 핸드셰이크를 반복하지 않도록 한다.
+    수명은 app.main의 lifespan에서 관리한다.
+    """
+
+    def __init__(self):
+        self._providers: Dict[Tuple[str, str], LLMProvider] = {}
+        # 데코레이터로 감싸기 전의 upstream Provider (운영 지표 조회용)
+        self._upstream: Dict[Tuple[str, str], OpenAIProvider] = {}
+
+    def get(self, provider: Optional[str] = None, model: Optional[str] = None) -> LLMProvider:
+        """provider/model에 해당하는 공유 인스턴스 반환 (없으면 생성)"""
+        name = provider or self._default_provider_name()
+        model = model or settings.OPENAI_MODEL
+        key = (name, model)
+        if key not in self._providers:
+            provider_instance = self._build(name, model)
+            # 캐시 미스인 동시 요청은 single-flight에서 하나로 합쳐진다
+            provider_instance = SingleFlightLLMProvider(provider_instance, llm_single_flight)
+            if settings.LLM_CACHE_ENABLED:
+                provider_instance = CachedLLMProvider(provider_instance, llm_response_cache)
+            if settings.LLM_TELEMETRY_ENABLED:
+                # 캐시 히트를 포함한 모든 호출을 기록하도록 가장 바깥에 둠
+                provider_instance = TelemetryLLMProvider(provider_instance, name, llm_telemetry)
+            self._providers[key] = provider_instance
+        return self._providers[key]
+
+    def _default_provider_name(self) -> str:
+        if settings.LLM_PROVIDER:
+            return settings.LLM_PROVIDER
+        # API 키가 없으면 Mock Provider 사용 (개발용)
+        return "openai" if settings.OPENAI_API_KEY else "mock"
+
+    def upstream_busy(self) -> bool:
+        """속도 제한기에 대기 중인 호출이 있거나 동시성 여유가 적은지 (백그라운드 작업 양보 기준)"""
+        return any(
+            provider.rate_limiter is not None and provider.rate_limiter.busy()
+            for provider in self._upstream.values()
+        )
+
+    def upstream_stats(self) -> Dict[str, Any]:
+        """provider/model별 속도 제한, 재시도, 헤지 요청 현황"""
+        return {f"{name}:{model}": provider.stats() for (name, model), provider in self._upstream.items()}
+
+    def _build(self, name: str, model: str) -> LLMProvider:
+        if name == "openai":
+            # 요청/토큰 한도는 API 키의 모델별 한도이므로 provider/model마다 하나
+            rate_limiter = build_llm_rate_limiter() if settings.LLM_RATE_LIMIT_ENABLED else None
+            retry_policy = None
+            if settings.LLM_RETRY_ENABLED:
+                retry_policy = RetryPolicy(
+                    base_delay=settings.LLM_RETRY_BASE_DELAY_SECONDS,
+                    max_delay=settings.LLM_RETRY_MAX_DELAY_SECONDS,
+                )
+            hedger = None
+            if settings.LLM_HEDGE_ENABLED:
+                hedger = Hedger(
+                    percentile=settings.LLM_HEDGE_PERCENTILE,
+                    min_samples=settings.LLM_HEDGE_MIN_SAMPLES,
+                    min_delay=settings.LLM_HEDGE_MIN_DELAY_SECONDS,
+                )
+            provider = OpenAIProvider(
+                api_key=settings.OPENAI_API_KEY,
+                model=model,
+                http_client=build_llm_http_client(),
+                rate_limiter=rate_limiter,
+                retry_policy=retry_policy,
+                hedger=hedger,
+            )
+            self._upstream[(name, model)] = provider
+            return provider
+        if name == "mock":
+            return MockLLMProvider()
+        if name == "synthetic":
+            return self._build_synthetic()
+        if name == "cassette":
+            # 모듈이 이 파일의 Provider 기본 클래스를 사용하므로 사용할 때 import
+            from app.infrastructure.llm_cassette import CassetteLLMProvider, CassetteStore
+
+            mode = settings.LLM_CASSETTE_MODE
+            return CassetteLLMProvider(
+                store=CassetteStore(os.path.join(settings.LLM_CASSETTE_DIR, model)),
+                mode=mode,
+                model=model,
+                inner=self._build("openai", model) if mode == "record" else None,
+                fallback=self._build_synthetic() if settings.LLM_CASSETTE_FALLBACK_SYNTHETIC else None,
+                latency_scale=settings.LLM_CASSETTE_LATENCY_SCALE,
+            )
+        raise ValueError(f"지원하지 않는 LLM provider입니다: {name}")
+
+    def _build_synthetic(self) -> LLMProvider:
+        from app.infrastructure.llm_cassette import LatencyModel, SyntheticLLMProvider
+
+        latency = LatencyModel(
+            distribution=settings.LLM_SYNTHETIC_LATENCY_DISTRIBUTION,
+            median_ms=settings.LLM_SYNTHETIC_LATENCY_MEDIAN_MS,
+            spread=settings.LLM_SYNTHETIC_LATENCY_SPREAD,
+            per_token_ms=settings.LLM_SYNTHETIC_LATENCY_PER_TOKEN_MS,
+            seed=settings.LLM_SYNTHETIC_SEED,
+        )
+        return SyntheticLLMProvider(latency, completion_tokens=settings.LLM_SYNTHETIC_COMPLETION_TOKENS)
+
+    async def aclose(self) -> None:
+        """모든 Provider의 커넥션 정리 (애플리케이션 종료 시)"""
+        providers = list(self._providers.values())
+        self._providers.clear()
+        self._upstream.clear()
+        for provider in providers:
+            await provider.aclose()
+        await llm_response_cache.aclose()
+        await llm_telemetry.aclose()
+
+
+# 전역 인스턴스
+llm_registry = LLMProviderRegistry()
+
 
 # LLM Provider Factory
 def get_llm_provider() -> LLMProvider:
-    """설정에 따라 적절한 LLM Provider 반환"""
-    if settings.OPENAI_API_KEY:
-        return OpenAIProvider(api_key=settings.OPENAI_API_KEY)
-    else:
-        # API 키가 없으면 Mock Provider 사용 (개발용)
-        return MockLLMProvider()
\ No newline at end of file
+    """설정에 따라 적절한 LLM Provider 반환 (프로세스 전역 공유 인스턴스)"""
+    return llm_registry.get()
\ No newline at end of file
@@ -0,0 +1,160 @@
+"""
+LLM 호출 재시도/헤징 - 오류 종류별 지수 백오프(지터), p95 기반 헤지 요청
+"""
+import asyncio
+import random
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+import openai
+
+from app.infrastructure.rate_limiter import RateLimitTimeout
+
+T = TypeVar("T")
+
+# 오류 종류별 최대 재시도 횟수 (타임아웃은 한 번 기다린 시간이 길어 1회만)
+RETRY_LIMITS = {
+    "rate_limit": 3,
+    "server": 2,
+    "connection": 2,
+    "timeout": 1,
+}
+
+
+class LLMProviderError(Exception):
+    """LLM Provider 호출 실패 (kind: 오류 종류, retryable: 재시도 대상이었는지)"""
+
+    def __init__(self, message: str, kind: str = "unknown", retryable: bool = False):
+        super().__init__(message)
+        self.kind = kind
+        self.retryable = retryable
+
+
+def provider_error(prefix: str, error: BaseException) -> LLMProviderError:
+    """SDK 예외를 오류 종류가 담긴 LLMProviderError로 변환"""
+    if isinstance(error, LLMProviderError):
+        return error
+    kind = classify_error(error)
+    return LLMProviderError(f"{prefix}: {error}", kind=kind, retryable=kind in RETRY_LIMITS)
+
+
+def classify_error(error: BaseException) -> str:
+    """openai SDK 예외를 재시도 정책의 오류 종류로 분류"""
+    if isinstance(error, RateLimitTimeout):
+        return "queue_timeout"
+    if isinstance(error, openai.RateLimitError):
+        return "rate_limit"
+    if isinstance(error, openai.APITimeoutError):
+        return "timeout"
+    if isinstance(error, openai.APIConnectionError):
+        return "connection"
+    if isinstance(error, openai.InternalServerError):
+        return "server"
+    if isinstance(error, openai.APIStatusError):
+        # 408/409도 일시적 오류로 취급 (SDK 기본 재시도 정책과 동일)
+        return "server" if error.status_code in (408, 409) else "client"
+    return "unknown"
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """429/503 응답의 Retry-After 헤더 (초)"""
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    try:
+        return float(response.headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """오류 종류별 재시도 여부와 full-jitter 지수 백오프 대기 시간 결정"""
+
+    def __init__(self, base_delay: float, max_delay: float, limits: Optional[Dict[str, int]] = None):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.limits = RETRY_LIMITS if limits is None else limits
+        self.counters: Dict[str, int] = {}
+
+    def next_delay(self, error: BaseException, attempt: int) -> Optional[float]:
+        """attempt번째 실패 후 대기할 시간 (재시도하지 않으면 None)"""
+        kind = classify_error(error)
+        if attempt > self.limits.get(kind, 0):
+            return None
+        self.counters[kind] = self.counters.get(kind, 0) + 1
+
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+        retry_after = retry_after_seconds(error)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+    def stats(self) -> Dict[str, Any]:
+        return {"retries": dict(self.counters)}
+
+
+class LatencyTracker:
+    """최근 성공 호출 지연 시간 분포 (헤지 시점 계산용)"""
+
+    def __init__(self, window: int = 200):
+        self._samples: Deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, p: float) -> Optional[float]:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+
+class Hedger:
+    """헤지 요청 - 첫 요청이 최근 p95 지연을 넘기면 같은 요청을 하나 더 보내고 먼저 온 응답 사용"""
+
+    def __init__(self, percentile: float, min_samples: int, min_delay: float):
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.counters = {"hedged_calls": 0, "hedges_sent": 0, "hedge_wins": 0}
+
+    def delay_for(self, tracker: LatencyTracker) -> Optional[float]:
+        """헤지 요청을 보낼 시점 (표본이 부족하면 None)"""
+        if len(tracker) < self.min_samples:
+            return None
+        return max(self.min_delay, tracker.percentile(self.percentile))
+
+    async def run(self, fn: Callable[[], Awaitable[T]], delay: float) -> T:
+        self.counters["hedged_calls"] += 1
+        primary = asyncio.ensure_future(fn())
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done:
+                return primary.result()
+
+            self.counters["hedges_sent"] += 1
+            hedge = asyncio.ensure_future(fn())
+            tasks.add(hedge)
+            pending = set(tasks)
+            first_error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.counters["hedge_wins"] += 1
+                        return task.result()
+                    first_error = first_error or task.exception()
+            raise first_error
+        finally:
+            # 늦은 쪽은 취소해 속도 제한 슬롯을 반환
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        return dict(self.counters)
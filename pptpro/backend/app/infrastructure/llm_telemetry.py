@@ -0,0 +1,217 @@
+"""
+LLM 호출 텔레메트리 - 호출별 지연/토큰/캐시 상태 기록, 비동기 큐로 모아 GenerationLog에 일괄 저장
+"""
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# 요청/서비스 단위 태그 (endpoint, template_type, project_id, slide_id)
+_call_tags: ContextVar[Dict[str, Any]] = ContextVar("llm_call_tags", default={})
+# 진행 중인 Provider 호출의 기록 (하위 데코레이터/Provider가 캐시 상태, 토큰 등을 채움)
+_current_call: ContextVar[Optional["LLMCallRecord"]] = ContextVar("llm_current_call", default=None)
+
+
+@dataclass
+class LLMCallRecord:
+    kind: str  # "generate", "structured", "stream"
+    llm_provider: str
+    model: str
+    endpoint: Optional[str] = None
+    template_type: Optional[str] = None
+    project_id: Optional[str] = None
+    slide_id: Optional[str] = None
+    cache_status: str = "none"  # "hit", "miss", "refresh", "bypass", "coalesced", "none"(캐시 미사용)
+    tokens_used: Optional[int] = None
+    latency_ms: Optional[int] = None  # 호출자 기준 전체 소요 시간 (대기열, 재시도 포함)
+    upstream_latency_ms: Optional[int] = None  # 마지막 upstream 응답 시간
+    attempts: int = 0  # upstream 호출 횟수 (재시도, 헤지 요청 포함)
+    status: str = "ok"  # "ok", "partial", "error", "cancelled"
+    error_kind: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+
+
+@contextmanager
+def llm_call_tags(**tags: Any) -> Iterator[None]:
+    """블록 안에서 발생하는 LLM 호출에 태그 추가"""
+    token = _call_tags.set({**_call_tags.get(), **tags})
+    try:
+        yield
+    finally:
+        _reset(_call_tags, token)
+
+
+@contextmanager
+def track_llm_call(
+    kind: str,
+    llm_provider: str,
+    model: str,
+    on_complete: Optional[Callable[["LLMCallRecord"], None]] = None,
+) -> Iterator[LLMCallRecord]:
+    """Provider 호출 하나를 기록 - 현재 태그로 기록을 만들고 하위 계층이 채울 수 있도록 공개,
+    호출이 끝나면 소요 시간과 결과를 채워 on_complete로 전달"""
+    record = LLMCallRecord(kind=kind, llm_provider=llm_provider, model=model, **_call_tags.get())
+    token = _current_call.set(record)
+    started = time.monotonic()
+    try:
+        yield record
+    except Exception as e:
+        record.status = "partial" if getattr(e, "missing_fields", None) is not None else "error"
+        record.error_kind = getattr(e, "kind", type(e).__name__)
+        raise
+    except BaseException:
+        # 클라이언트 연결 종료 등으로 취소되거나 소비가 중단된 스트림
+        record.status = "cancelled"
+        raise
+    finally:
+        record.latency_ms = int((time.monotonic() - started) * 1000)
+        _reset(_current_call, token)
+        if on_complete is not None:
+            on_complete(record)
+
+
+def current_llm_call() -> Optional[LLMCallRecord]:
+    """진행 중인 호출의 기록 (텔레메트리 미사용 시 None)"""
+    return _current_call.get()
+
+
+def note_upstream_attempt() -> None:
+    """upstream 호출 한 번 시작 (재시도, 헤지 요청 포함)"""
+    record = _current_call.get()
+    if record is not None:
+        record.attempts += 1
+
+
+def note_upstream_response(elapsed: float, tokens: Optional[int]) -> None:
+    """진행 중인 호출 기록에 upstream 응답 시간과 토큰 사용량 반영"""
+    record = _current_call.get()
+    if record is not None:
+        record.upstream_latency_ms = int(elapsed * 1000)
+        record.tokens_used = tokens
+
+
+def _reset(var: ContextVar, token: Any) -> None:
+    try:
+        var.reset(token)
+    except ValueError:
+        # 소비자가 다른 컨텍스트에서 닫은 async generator - 해당 컨텍스트는 이미 사라짐
+        pass
+
+
+class LLMTelemetry:
+    """호출 기록 수집기
+
+    record()는 큐에 넣기만 하고 즉시 반환한다 (큐가 가득 차면 버리고 dropped로 집계).
+    백그라운드 태스크가 batch_size개 또는 flush_interval마다 모아 sink에 저장한다.
+    """
+
+    def __init__(
+        self,
+        sink: Callable[[List[LLMCallRecord]], None],
+        max_queue_size: int,
+        batch_size: int,
+        flush_interval: float,
+    ):
+        self.sink = sink
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._batch: List[LLMCallRecord] = []  # 큐에서 꺼냈지만 아직 저장하지 않은 기록
+        self.counters = {"recorded": 0, "dropped": 0, "flushed": 0, "batches": 0, "flush_errors": 0}
+
+    def record(self, record: LLMCallRecord) -> None:
+        """기록 추가 (호출 경로를 막지 않음)"""
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(record)
+            self.counters["recorded"] += 1
+        except asyncio.QueueFull:
+            self.counters["dropped"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self.counters, "queued": self._queue.qsize() if self._queue else 0}
+
+    async def aclose(self) -> None:
+        """플러시 태스크를 멈추고 남은 기록 저장"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._queue is not None:
+            while not self._queue.empty():
+                self._batch.append(self._queue.get_nowait())
+        if self._batch:
+            self._flush()
+
+    def _ensure_started(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._task is None or self._task.done():
+            if self._loop is not loop:
+                self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+                self._loop = loop
+            self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            self._batch.append(await self._queue.get())
+            deadline = loop.time() + self.flush_interval
+            while len(self._batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                record = await self._get(timeout)
+                if record is None:
+                    break
+                self._batch.append(record)
+            self._flush()
+
+    async def _get(self, timeout: float) -> Optional[LLMCallRecord]:
+        """큐에서 기록 하나 꺼냄 (timeout 동안 없으면 None)
+
+        wait_for는 취소와 기록 도착이 겹치면 취소를 무시하므로(3.11) aclose()가 멈추지 않도록 직접 기다린다.
+        """
+        getter = asyncio.ensure_future(self._queue.get())
+        try:
+            done, _ = await asyncio.wait({getter}, timeout=timeout)
+        except BaseException:
+            getter.cancel()
+            if getter.done() and not getter.cancelled():
+                self._batch.append(getter.result())
+            raise
+        if not done:
+            getter.cancel()
+            return None
+        return getter.result()
+
+    def _flush(self) -> None:
+        batch, self._batch = self._batch, []
+        try:
+            self.sink(batch)
+            self.counters["flushed"] += len(batch)
+            self.counters["batches"] += 1
+        except Exception:
+            self.counters["flush_errors"] += 1
+
+
+class LLMTelemetryMiddleware:
+    """요청 경로를 LLM 호출의 endpoint 태그로 설정하는 ASGI 미들웨어"""
+
+    def __init__(self, app: Any):
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with llm_call_tags(endpoint=f"{scope['method']} {scope['path']}"):
+            await self.app(scope, receive, send)
@@ -0,0 +1,310 @@
+"""
+LLM 호출 속도 제한 - 분당 요청/토큰 버킷 + AIMD 적응형 동시성 제어
+"""
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+# 대기열 우선순위 (작을수록 먼저)
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+# 블록 안의 LLM 호출에 적용할 대기열 우선순위 (Provider 데코레이터를 거쳐도 유지되도록 컨텍스트로 전달)
+_call_priority: ContextVar[int] = ContextVar("llm_call_priority", default=PRIORITY_NORMAL)
+
+
+@contextmanager
+def llm_call_priority(priority: int) -> Iterator[None]:
+    """블록 안에서 발생하는 LLM 호출의 대기열 우선순위 지정 (추측 생성 등은 PRIORITY_LOW)"""
+    token = _call_priority.set(priority)
+    try:
+        yield
+    finally:
+        _call_priority.reset(token)
+
+
+class RateLimitTimeout(Exception):
+    """대기열에서 기한 내에 호출 슬롯을 얻지 못한 경우"""
+
+
+def estimate_tokens(text: str) -> int:
+    """토크나이저 없이 대략적인 토큰 수 추정 (한국어 1글자 ≈ 1토큰, 영어 ≈ 3글자당 1토큰)"""
+    return max(1, len(text.encode("utf-8")) // 3)
+
+
+class TokenBucket:
+    """분당 허용량을 초당 비율로 채우는 토큰 버킷"""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def delay(self, amount: float) -> float:
+        """amount만큼 꺼낼 수 있을 때까지 남은 시간(초)"""
+        self._refill()
+        # 버킷 용량보다 큰 요청은 버킷이 가득 찼을 때 허용
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def take(self, amount: float) -> None:
+        self._refill()
+        self.tokens -= min(amount, self.capacity)
+
+    def adjust(self, amount: float) -> None:
+        """추정치와 실제 사용량의 차이 반영 (음수면 반환)"""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - amount)
+
+
+class AdaptiveConcurrency:
+    """AIMD 동시성 창
+
+    성공할 때마다 창을 1/limit씩 늘리고(가산 증가), 429 응답이나 지연 급증
+    (평소 지연의 latency_spike_ratio배 초과) 시 decrease_factor배로 줄인다(승산 감소).
+    응답이 길수록 지연도 길므로 평소 지연은 응답 토큰 상한의 2배 단위 구간별로 따로 추적한다.
+    연속된 실패로 창이 한 번에 바닥까지 줄지 않도록 감소 후 cooldown 동안은 다시 줄이지 않는다.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int,
+        maximum: int,
+        latency_spike_ratio: float = 2.5,
+        decrease_factor: float = 0.5,
+        cooldown_seconds: float = 2.0,
+    ):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = float(min(max(initial, self.minimum), self.maximum))
+        self.latency_spike_ratio = latency_spike_ratio
+        self.decrease_factor = decrease_factor
+        self.cooldown_seconds = cooldown_seconds
+        self.in_flight = 0
+        self.baseline_latency: Dict[int, float] = {}  # 크기 구간 -> 평소 지연
+        self._last_decrease = 0.0
+        self.counters = {"increases": 0, "decreases": 0, "overloads": 0, "latency_spikes": 0}
+
+    def has_capacity(self) -> bool:
+        return self.in_flight < int(self.limit)
+
+    @staticmethod
+    def size_bucket(output_tokens: int) -> int:
+        """응답 토큰 상한의 크기 구간 (2배 단위)"""
+        return max(1, output_tokens).bit_length()
+
+    def on_success(self, latency: Optional[float], size_bucket: int = 0) -> None:
+        baseline = self.baseline_latency.get(size_bucket)
+        if latency is not None and baseline is not None and latency > baseline * self.latency_spike_ratio:
+            self.counters["latency_spikes"] += 1
+            self._decrease()
+        elif self.limit < self.maximum:
+            self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+            self.counters["increases"] += 1
+
+        if latency is not None:
+            # 지수 이동 평균으로 평소 지연 추적
+            if baseline is None:
+                self.baseline_latency[size_bucket] = latency
+            else:
+                self.baseline_latency[size_bucket] = baseline * 0.9 + latency * 0.1
+
+    def on_overload(self) -> None:
+        self.counters["overloads"] += 1
+        self._decrease()
+
+    def _decrease(self) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown_seconds:
+            return
+        self._last_decrease = now
+        self.limit = max(float(self.minimum), self.limit * self.decrease_factor)
+        self.counters["decreases"] += 1
+
+
+class _Waiter:
+    __slots__ = ("priority", "seq", "event")
+
+    def __init__(self, priority: int, seq: int):
+        self.priority = priority
+        self.seq = seq
+        self.event = asyncio.Event()
+
+    def __lt__(self, other: "_Waiter") -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class RatePermit:
+    """획득한 호출 슬롯 - 실제 사용량과 결과를 제한기에 알려준다"""
+
+    def __init__(self, limiter: "LLMRateLimiter", estimated_tokens: int, output_tokens: int):
+        self._limiter = limiter
+        self.estimated_tokens = estimated_tokens
+        self.size_bucket = AdaptiveConcurrency.size_bucket(output_tokens)
+        self.started_at = time.monotonic()
+        self.observe_latency = True  # 스트리밍처럼 지연이 응답 길이에 좌우되면 False
+        self._overloaded = False
+
+    def record_tokens(self, actual_tokens: Optional[int]) -> None:
+        """응답의 실제 토큰 사용량으로 TPM 버킷 보정"""
+        if actual_tokens is not None:
+            self._limiter.token_bucket.adjust(actual_tokens - self.estimated_tokens)
+
+    def overloaded(self, retry_after: Optional[float] = None) -> None:
+        """upstream이 429를 반환한 경우"""
+        self._overloaded = True
+        self._limiter.on_overload(retry_after)
+
+    def _release(self, failed: bool) -> None:
+        concurrency = self._limiter.concurrency
+        concurrency.in_flight -= 1
+        if not self._overloaded and not failed:
+            latency = time.monotonic() - self.started_at if self.observe_latency else None
+            concurrency.on_success(latency, self.size_bucket)
+        self._limiter._wake_head()
+
+
+class LLMRateLimiter:
+    """upstream LLM 호출 제한기
+
+    호출 전 acquire()로 슬롯을 얻는다. 분당 요청 수(RPM), 분당 토큰 수(TPM),
+    적응형 동시성 창이 모두 허용할 때까지 우선순위 순서로 대기하며,
+    queue_timeout 안에 슬롯을 얻지 못하면 RateLimitTimeout을 발생시킨다.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        concurrency: AdaptiveConcurrency,
+        queue_timeout: float,
+    ):
+        self.request_bucket = TokenBucket(requests_per_minute)
+        self.token_bucket = TokenBucket(tokens_per_minute)
+        self.concurrency = concurrency
+        self.queue_timeout = queue_timeout
+        self._queue: List[_Waiter] = []
+        self._seq = itertools.count()
+        self._paused_until = 0.0
+        self.counters = {"admitted": 0, "queued": 0, "timeouts": 0}
+
+    @asynccontextmanager
+    async def acquire(
+        self,
+        estimated_tokens: int,
+        priority: Optional[int] = None,
+        timeout: Optional[float] = None,
+        output_tokens: Optional[int] = None,
+    ) -> AsyncIterator[RatePermit]:
+        """호출 슬롯 획득 (async with 블록이 끝나면 반환, priority 생략 시 llm_call_priority 값)
+
+        output_tokens는 응답 토큰 상한(max_tokens)으로, 지연을 비슷한 크기의 호출끼리 비교하는 데 쓴다.
+        생략하면 estimated_tokens로 구분한다.
+        """
+        await self._admit(
+            estimated_tokens,
+            _call_priority.get() if priority is None else priority,
+            self.queue_timeout if timeout is None else timeout,
+        )
+        permit = RatePermit(self, estimated_tokens, estimated_tokens if output_tokens is None else output_tokens)
+        failed = True
+        try:
+            yield permit
+            failed = False
+        finally:
+            permit._release(failed)
+
+    def busy(self, headroom: float = 0.25) -> bool:
+        """대기 중인 호출이 있거나 동시성 창의 여유가 headroom 비율보다 적은지"""
+        limit = int(self.concurrency.limit)
+        return bool(self._queue) or self.concurrency.in_flight >= limit - int(limit * headroom) \
+            or time.monotonic() < self._paused_until
+
+    def on_overload(self, retry_after: Optional[float]) -> None:
+        self.concurrency.on_overload()
+        if retry_after:
+            # Retry-After 동안은 새 호출을 내보내지 않음
+            self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.counters,
+            **self.concurrency.counters,
+            "concurrency_limit": round(self.concurrency.limit, 2),
+            "in_flight": self.concurrency.in_flight,
+            "waiting": len(self._queue),
+            # 응답 토큰 상한 구간의 위쪽 경계 -> 평소 지연
+            "baseline_latency_ms": {
+                1 << bucket: round(latency * 1000)
+                for bucket, latency in sorted(self.concurrency.baseline_latency.items())
+            },
+            "request_tokens_available": round(self.request_bucket.tokens, 1),
+            "tpm_tokens_available": round(self.token_bucket.tokens, 1),
+        }
+
+    async def _admit(self, estimated_tokens: int, priority: int, timeout: float) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        waiter = _Waiter(priority, next(self._seq))
+        heapq.heappush(self._queue, waiter)
+        queued = False
+        try:
+            while True:
+                delay: Optional[float] = None
+                if self._queue[0] is waiter and self.concurrency.has_capacity():
+                    delay = max(
+                        self._paused_until - time.monotonic(),
+                        self.request_bucket.delay(1),
+                        self.token_bucket.delay(estimated_tokens),
+                    )
+                    if delay <= 0:
+                        heapq.heappop(self._queue)
+                        self.request_bucket.take(1)
+                        self.token_bucket.take(estimated_tokens)
+                        self.concurrency.in_flight += 1
+                        self.counters["admitted"] += 1
+                        # 다음 대기자도 바로 들어갈 수 있는지 확인
+                        self._wake_head()
+                        return
+
+                if not queued:
+                    queued = True
+                    self.counters["queued"] += 1
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    self.counters["timeouts"] += 1
+                    raise RateLimitTimeout(f"LLM 호출 대기 시간({timeout:g}초)을 초과했습니다")
+
+                # 버킷이 찰 때까지 또는 슬롯 반환/선두 변경 알림이 올 때까지 대기
+                waiter.event.clear()
+                try:
+                    await asyncio.wait_for(
+                        waiter.event.wait(),
+                        timeout=min(delay, remaining) if delay is not None else remaining,
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        except BaseException:
+            if waiter in self._queue:
+                self._queue.remove(waiter)
+                heapq.heapify(self._queue)
+                self._wake_head()
+            raise
+
+    def _wake_head(self) -> None:
+        if self._queue:
+            self._queue[0].event.set()
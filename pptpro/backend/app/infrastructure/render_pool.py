@@ -0,0 +1,232 @@
+"""
+PPT 렌더링 실행기 - CPU 작업(python-pptx 렌더링, 저장)을 이벤트 루프 밖의 전용 워커 풀에서 실행
+"""
+import asyncio
+import collections
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+from app.core.config import settings
+
+
+class RenderQueueFull(Exception):
+    """렌더링 대기열이 가득 참 (잠시 후 재시도)"""
+
+
+def _warm_worker() -> None:
+    """프로세스 워커 초기화 - pptx와 렌더러를 미리 import해 첫 렌더링 지연 제거"""
+    import pptx  # noqa: F401
+    import app.services.ppt_generation  # noqa: F401
+
+
+def _call_soon(loop: asyncio.AbstractEventLoop, callback: Callable[..., Any], *args: Any) -> None:
+    """워커 스레드에서 loop로 콜백 전달 (loop가 이미 닫혔으면 무시)"""
+    try:
+        loop.call_soon_threadsafe(callback, *args)
+    except RuntimeError:
+        pass
+
+
+class RenderExecutor:
+    """렌더링 전용 워커 풀
+
+    workers개까지 동시에 렌더링하고, 그 이상은 max_queue개까지만 대기시킨다.
+    대기열도 가득 차면 RenderQueueFull로 바로 거절해 큰 내보내기 요청이 쌓여도 다른 요청에 영향을 주지 않는다.
+    mode가 "process"면 프로세스 풀(GIL 영향 없음, 인자와 결과는 pickle 가능해야 함), "thread"면 스레드 풀을 사용한다.
+    """
+
+    def __init__(self, mode: str, workers: int, max_queue: int):
+        self.mode = mode
+        self.workers = max(1, workers)
+        self.max_queue = max(0, max_queue)
+        self._executor: Optional[Executor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._waiting = 0
+        self._running = 0
+        self.counters = {"submitted": 0, "completed": 0, "failed": 0, "rejected": 0}
+        self._wait_seconds = 0.0
+        self._render_seconds = 0.0
+        self._max_waiting = 0
+
+    async def run(self, fn: Callable[..., Any], *args: Any, block: bool = False) -> Any:
+        """fn(*args)를 워커 풀에서 실행
+
+        대기열이 가득 차면 RenderQueueFull. 백그라운드 작업처럼 거절하지 않고 차례를 기다릴 때는 block=True.
+        """
+        self._ensure_started()
+        if not block and self._waiting >= self.max_queue and self._slots.locked():
+            self.counters["rejected"] += 1
+            raise RenderQueueFull("PPT 생성 요청이 많아 잠시 후 다시 시도해주세요")
+
+        self.counters["submitted"] += 1
+        queued_at = time.perf_counter()
+        self._waiting += 1
+        self._max_waiting = max(self._max_waiting, self._waiting)
+        try:
+            await self._slots.acquire()
+        finally:
+            self._waiting -= 1
+
+        started_at = time.perf_counter()
+        self._wait_seconds += started_at - queued_at
+        self._running += 1
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._finished(None, started_at)
+            raise
+        # 호출자가 취소돼도 워커는 렌더링을 계속하므로 슬롯은 실제로 끝났을 때 반납
+        loop = self._loop
+        future.add_done_callback(lambda f: _call_soon(loop, self._finished, f, started_at))
+        return await asyncio.wrap_future(future, loop=loop)
+
+    def _finished(self, future: Optional[Future], started_at: float) -> None:
+        if future is None or future.cancelled() or future.exception() is not None:
+            self.counters["failed"] += 1
+        else:
+            self.counters["completed"] += 1
+        self._running -= 1
+        self._render_seconds += time.perf_counter() - started_at
+        self._slots.release()
+
+    def stats(self) -> Dict[str, Any]:
+        finished = self.counters["completed"] + self.counters["failed"]
+        started = finished + self._running
+        return {
+            **self.counters,
+            "mode": self.mode,
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "running": self._running,
+            "queued": self._waiting,
+            "max_queued": self._max_waiting,
+            "avg_wait_ms": round(self._wait_seconds / started * 1000, 1) if started else 0.0,
+            "avg_render_ms": round(self._render_seconds / finished * 1000, 1) if finished else 0.0,
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _ensure_started(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._slots = asyncio.Semaphore(self.workers)
+        if self._executor is None:
+            if self.mode == "process":
+                # SlideRenderPool과 같이 spawn (fork하면 서버 스레드의 잠금 상태가 복제됨)
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_warm_worker
+                )
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="ppt-render")
+
+
+class SlideRenderPool:
+    """큰 덱의 슬라이드 구간을 나눠 렌더링하는 프로세스 풀 (처음 사용할 때 생성)
+
+    RenderExecutor 워커 안에서 동기적으로 호출한다. map()은 구간 순서대로 결과를 내는 반복자를 돌려주며,
+    다음 결과가 아직 없으면 끝날 때까지 블로킹한다. 받아 가지 않은 결과가 쌓이지 않도록
+    한 번에 제출하는 구간은 워커 수의 2배까지다.
+    동시에 내보내는 덱들이 같은 풀을 나눠 쓴다. 이미 프로세스 풀 워커 안이면(RENDER_EXECUTOR=process)
+    풀 안에 풀을 만들면 워커 종료가 멈출 수 있으므로 같은 프로세스에서 차례로 실행한다.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = max(1, workers)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.counters = {"maps": 0, "chunks": 0, "inline": 0}
+
+    def map(self, fn: Callable[[Any], Any], chunks: List[Any]) -> Iterator[Any]:
+        if not chunks:
+            return iter(())
+        if multiprocessing.parent_process() is not None:
+            self.counters["inline"] += 1
+            return (fn(chunk) for chunk in chunks)
+        with self._lock:
+            if self._executor is None:
+                # spawn: 스레드가 여럿 도는 서버 프로세스를 fork하지 않음 (잠금 상태 복제 방지)
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_warm_worker
+                )
+            executor = self._executor
+            self.counters["maps"] += 1
+            self.counters["chunks"] += len(chunks)
+        return self._bounded_map(executor, fn, chunks)
+
+    def _bounded_map(self, executor: Executor, fn: Callable[[Any], Any], chunks: List[Any]) -> Iterator[Any]:
+        window = self.workers * 2
+        futures: Deque[Future] = collections.deque()
+        try:
+            for chunk in chunks:
+                futures.append(executor.submit(fn, chunk))
+                if len(futures) >= window:
+                    yield futures.popleft().result()
+            while futures:
+                yield futures.popleft().result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self.counters, "workers": self.workers, "started": self._executor is not None}
+
+    def __enter__(self) -> "SlideRenderPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+class CompressionPool:
+    """zip 항목 압축용 스레드 풀 (처음 사용할 때 생성, 프로세스별)
+
+    workers가 0이면 None을 돌려줘 저장하는 스레드에서 차례로 압축하게 한다.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = max(0, workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def executor(self) -> Optional[ThreadPoolExecutor]:
+        if self.workers == 0:
+            return None
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="ppt-deflate")
+            return self._executor
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# 전역 렌더링 실행기 (첫 렌더링 시 워커 풀 생성)
+render_executor = RenderExecutor(settings.RENDER_EXECUTOR, settings.RENDER_WORKERS, settings.RENDER_QUEUE_SIZE)
+
+# 전역 슬라이드 구간 렌더링 풀 (PPT_PARALLEL_WORKERS가 0이면 CPU 수)
+slide_render_pool = SlideRenderPool(settings.PPT_PARALLEL_WORKERS or os.cpu_count() or 1)
+
+# 전역 zip 압축 스레드 풀
+compression_pool = CompressionPool(settings.PPT_COMPRESSION_THREADS)
@@ -0,0 +1,52 @@
+"""
+Single-flight - 같은 키의 동시 요청을 하나의 실행으로 합치기
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """키별로 진행 중인 작업을 하나만 유지하고, 동시 호출자는 그 결과를 함께 기다린다.
+
+    작업은 별도 Task로 실행되므로 먼저 호출한 쪽이 취소(클라이언트 연결 종료 등)되어도
+    기다리는 다른 호출자에게는 결과가 전달된다.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, "asyncio.Task[Any]"] = {}
+        self.counters = {"executions": 0, "coalesced": 0}
+
+    def in_flight(self, key: str) -> bool:
+        """해당 키의 작업이 진행 중인지 여부"""
+        return key in self._inflight
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """키에 해당하는 작업을 실행하거나, 이미 진행 중이면 그 결과를 기다림"""
+        return await asyncio.shield(self.submit(key, fn))
+
+    def submit(self, key: str, fn: Callable[[], Awaitable[T]]) -> "asyncio.Task[T]":
+        """do와 같지만 기다리지 않고 공유 Task를 바로 반환 (await 없이 키를 선점해야 할 때)
+
+        반환한 Task는 다른 호출자와 공유하므로 취소하지 말고 asyncio.shield로 감싸 기다린다.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            self.counters["executions"] += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._on_done(key, t))
+        else:
+            self.counters["coalesced"] += 1
+        return task
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self.counters, "in_flight": len(self._inflight)}
+
+    def _on_done(self, key: str, task: "asyncio.Task[Any]") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 모든 호출자가 취소된 경우에도 예외가 "never retrieved"로 남지 않도록 조회
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,143 @@
+"""
+zip 패키지 조작 - 압축된 항목을 풀지 않고 다른 zip으로 그대로 복사, 항목별 병렬 압축 저장
+"""
+import copy
+import struct
+import time
+import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import Executor, Future
+from typing import IO, Callable, Deque, Dict, Optional, Tuple, Union
+
+# 압축 프로필 - (압축 방식, zlib 레벨). default는 python-pptx 저장과 같은 결과 (zlib 기본 레벨 6)
+COMPRESSION_PROFILES: Dict[str, Tuple[int, Optional[int]]] = {
+    "store": (zipfile.ZIP_STORED, None),
+    "fast": (zipfile.ZIP_DEFLATED, 1),
+    "default": (zipfile.ZIP_DEFLATED, None),
+    "max": (zipfile.ZIP_DEFLATED, 9),
+}
+
+# 로컬 파일 헤더 중 파일 이름 길이, extra 길이 위치
+_LOCAL_HEADER_LENGTHS = struct.Struct("<HH")
+_LOCAL_HEADER_LENGTHS_OFFSET = 26
+# 범용 플래그 bit 3 - 크기/CRC가 압축 데이터 뒤의 data descriptor에 기록됨
+_FLAG_DATA_DESCRIPTOR = 0x08
+
+
+def copy_member_raw(source: zipfile.ZipFile, target: zipfile.ZipFile, info: zipfile.ZipInfo) -> None:
+    """source의 항목을 압축 해제/재압축 없이 target 끝에 복사 (로컬 헤더 + 압축 데이터, 중앙 디렉터리는 target이 close 시 기록)
+
+    data descriptor를 쓰는 항목은 길이를 헤더만으로 알 수 없으므로 풀었다가 같은 방식으로 다시 압축한다.
+    """
+    if info.flag_bits & _FLAG_DATA_DESCRIPTOR:
+        target.writestr(info, source.read(info))
+        return
+
+    source.fp.seek(info.header_offset)
+    header = source.fp.read(zipfile.sizeFileHeader)
+    name_length, extra_length = _LOCAL_HEADER_LENGTHS.unpack_from(header, _LOCAL_HEADER_LENGTHS_OFFSET)
+    header += source.fp.read(name_length + extra_length)
+
+    _append_member(
+        target, copy.copy(info), header, lambda fp: _copy_bytes(source.fp, fp, info.compress_size)
+    )
+
+
+class ParallelZipWriter:
+    """받은 순서대로 zip에 기록하되 항목 압축은 executor(스레드 풀)에서 병렬로 실행
+
+    zlib은 압축 중 GIL을 놓으므로 스레드만으로 여러 코어를 쓴다. 메모리를 제한하려고 압축이 끝나지 않은
+    항목은 window개까지만 두고, 넘으면 가장 먼저 받은 항목이 끝나기를 기다려 기록한다.
+    슬라이드 XML처럼 작은 항목은 스레드에 넘기는 비용이 압축보다 크므로 min_parallel_bytes 미만이면
+    바로 압축한다. executor가 없으면 모두 같은 스레드에서 압축한다.
+    """
+
+    def __init__(
+        self, file: Union[str, IO[bytes]], profile: str = "default", executor: Optional[Executor] = None,
+        window: int = 32, min_parallel_bytes: int = 64 * 1024
+    ):
+        if profile not in COMPRESSION_PROFILES:
+            raise ValueError(f"알 수 없는 압축 프로필입니다: {profile}")
+        self.compress_type, self.level = COMPRESSION_PROFILES[profile]
+        self.executor = executor
+        self.window = max(1, window)
+        self.min_parallel_bytes = min_parallel_bytes
+        self._zip = zipfile.ZipFile(file, "w")
+        # (ZipInfo, 압축 결과 또는 Future) - 받은 순서대로 기록
+        self._pending: Deque[Tuple[zipfile.ZipInfo, Union[Tuple[int, bytes], Future]]] = deque()
+
+    def write(self, name: str, data: bytes) -> None:
+        info = zipfile.ZipInfo(name, date_time=time.localtime(time.time())[:6])
+        info.compress_type = self.compress_type
+        info.external_attr = 0o600 << 16  # ZipFile.writestr와 같은 권한
+        info.file_size = len(data)
+        if self.executor is None or len(data) < self.min_parallel_bytes:
+            if not self._pending:
+                self._append(info, self._compress(data))
+                return
+            self._pending.append((info, self._compress(data)))
+        else:
+            self._pending.append((info, self.executor.submit(self._compress, data)))
+        while len(self._pending) > self.window:
+            self._flush_one()
+
+    def close(self) -> None:
+        try:
+            while self._pending:
+                self._flush_one()
+        finally:
+            self._zip.close()
+
+    def __enter__(self) -> "ParallelZipWriter":
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        if exc_type is not None:
+            for _, future in self._pending:
+                if isinstance(future, Future):
+                    future.cancel()
+            self._pending.clear()
+        self.close()
+
+    def _flush_one(self) -> None:
+        info, compressed = self._pending.popleft()
+        self._append(info, compressed.result() if isinstance(compressed, Future) else compressed)
+
+    def _compress(self, data: bytes) -> Tuple[int, bytes]:
+        crc = zlib.crc32(data)
+        if self.compress_type == zipfile.ZIP_STORED:
+            return crc, data
+        level = zlib.Z_DEFAULT_COMPRESSION if self.level is None else self.level
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+        return crc, compressor.compress(data) + compressor.flush()
+
+    def _append(self, info: zipfile.ZipInfo, compressed: Tuple[int, bytes]) -> None:
+        info.CRC, data = compressed
+        info.compress_size = len(data)
+        zip64 = info.file_size > zipfile.ZIP64_LIMIT or info.compress_size > zipfile.ZIP64_LIMIT
+        _append_member(self._zip, info, info.FileHeader(zip64), lambda fp: fp.write(data))
+
+
+def _append_member(
+    target: zipfile.ZipFile, info: zipfile.ZipInfo, header: bytes, write_data: Callable[[IO[bytes]], None]
+) -> None:
+    """로컬 헤더와 압축 데이터를 target 끝에 쓰고 중앙 디렉터리 목록에 추가"""
+    target.fp.seek(target.start_dir)
+    info.header_offset = target.fp.tell()
+    target.fp.write(header)
+    write_data(target.fp)
+
+    target.filelist.append(info)
+    target.NameToInfo[info.filename] = info
+    target.start_dir = target.fp.tell()
+    target._didModify = True
+
+
+def _copy_bytes(source, target, length: int, chunk_size: int = 1024 * 1024) -> None:
+    while length > 0:
+        chunk = source.read(min(chunk_size, length))
+        if not chunk:
+            raise zipfile.BadZipFile("압축 데이터가 잘렸습니다")
+        target.write(chunk)
+        length -= len(chunk)
@@ -1,16 +1,41 @@
 """
 PPT Pro Backend - FastAPI Application
 """
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.api.content import content_prefetcher
 from app.api.routes import api_router
 from app.core.config import settings
+from app.infrastructure.jobs import job_manager
+from app.infrastructure.llm_provider import get_llm_provider, llm_registry
+from app.infrastructure.llm_telemetry import LLMTelemetryMiddleware
+from app.infrastructure.render_pool import compression_pool, render_executor, slide_render_pool
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """애플리케이션 수명 주기 - 공유 리소스 초기화/정리"""
+    # 기본 LLM Provider를 미리 생성해 커넥션 풀 공유
+    get_llm_provider()
+    # 백그라운드 작업 워커 시작 (대기 중이던 작업 재실행)
+    job_manager.start()
+    yield
+    await job_manager.aclose()
+    await content_prefetcher.aclose()
+    await llm_registry.aclose()
+    render_executor.shutdown()
+    slide_render_pool.shutdown()
+    compression_pool.shutdown()
+
 
 app = FastAPI(
     title="PPT Pro API",
     description="AI-powered presentation generator",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # CORS 설정
@@ -22,6 +47,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# LLM 호출 로그에 요청 경로 태그
+app.add_middleware(LLMTelemetryMiddleware)
+
 # API 라우터 등록
 app.include_router(api_router, prefix="/api")
 
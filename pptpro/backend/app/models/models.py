@@ -115,9 +115,18 @@ class GenerationLog(Base):
     slide_id = Column(UUID(as_uuid=True), ForeignKey("slides.id"), nullable=True)
     
     llm_provider = Column(String(50))  # openai, anthropic, etc.
+    model = Column(String(100))
+    kind = Column(String(20))  # generate, structured, stream
+    endpoint = Column(String(200))
+    template_type = Column(String(50))
+    cache_status = Column(String(20))  # hit, miss, refresh, bypass, coalesced, none
+    status = Column(String(20))  # ok, partial, error
+    error_kind = Column(String(50))
     prompt = Column(Text)
     response = Column(Text)
     tokens_used = Column(Integer)
     latency_ms = Column(Integer)
+    upstream_latency_ms = Column(Integer)
+    attempts = Column(Integer)
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
\ No newline at end of file
@@ -0,0 +1,379 @@
+"""
+차트 데이터 준비 - chart_insight 슬라이드의 chart_data를 python-pptx 네이티브 차트로 만들기 위한 정규화/다운샘플링
+
+값 변환과 다운샘플링은 NumPy 배열 연산으로 처리한다. 점이 많은 데이터(업로드한 수십만~수백만 행)도 차트 파트와
+내장 워크북이 커지지 않도록 차트 종류별로 줄인다.
+- line: LTTB (Largest-Triangle-Three-Buckets) - 모양(극값)을 유지하며 점 수 축소
+- bar, pie: 값 합계 상위 N개 + "기타"
+- scatter: 격자 칸마다 한 점만 남김 (분포/이상치 유지)
+속도와 워크북 크기 측정은 benchmarks/ppt_charts.py.
+"""
+import datetime
+import logging
+import math
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from pptx.chart.data import CategoryChartData, XyChartData
+from pptx.chart.xlsx import CategoryWorkbookWriter, XyWorkbookWriter
+from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION
+from pptx.util import Pt
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+OTHER_LABEL = "기타"
+# 내장 워크북 생성 시각 고정 - 같은 입력이면 같은 .xlsx (xlsxwriter 기본값은 현재 시각)
+_WORKBOOK_CREATED = datetime.datetime(2000, 1, 1)
+
+# chart_type 별칭 - 준비 방식(bar, line, pie, scatter)과 python-pptx 차트 종류
+_CHART_KINDS = {
+    "bar": ("bar", XL_CHART_TYPE.COLUMN_CLUSTERED),
+    "column": ("bar", XL_CHART_TYPE.COLUMN_CLUSTERED),
+    "horizontal_bar": ("bar", XL_CHART_TYPE.BAR_CLUSTERED),
+    "stacked_bar": ("bar", XL_CHART_TYPE.COLUMN_STACKED),
+    "line": ("line", XL_CHART_TYPE.LINE),
+    "area": ("line", XL_CHART_TYPE.AREA),
+    "pie": ("pie", XL_CHART_TYPE.PIE),
+    "donut": ("pie", XL_CHART_TYPE.DOUGHNUT),
+    "doughnut": ("pie", XL_CHART_TYPE.DOUGHNUT),
+    "scatter": ("scatter", XL_CHART_TYPE.XY_SCATTER),
+}
+
+
+@dataclass
+class PreparedChart:
+    """다운샘플링까지 끝난 차트 입력"""
+    kind: str  # bar, line, pie, scatter
+    chart_type: int  # XL_CHART_TYPE
+    categories: List[Any]  # 항목 이름 (scatter는 빈 목록)
+    series: List[Tuple[str, np.ndarray]]  # (계열 이름, 값) - scatter는 값이 (n, 2) x/y 배열
+    source_points: int  # 다운샘플링 전 점 수 (계열 합계)
+
+    @property
+    def points(self) -> int:
+        return sum(len(values) for _, values in self.series)
+
+
+def prepare_chart(content: Dict[str, Any]) -> Optional[PreparedChart]:
+    """슬라이드 콘텐츠의 chart_data(없으면 sample_data_structure)를 차트 입력으로 변환
+
+    숫자 값이 하나도 없으면(USER_NEEDED 등) None - 렌더러는 기존 차트 영역 표시로 대신한다.
+    """
+    raw = content.get("chart_data") or content.get("sample_data_structure")
+    if not raw:
+        return None
+    kind, chart_type = _CHART_KINDS.get(str(content.get("chart_type") or "bar").strip().lower(), _CHART_KINDS["bar"])
+
+    if kind == "scatter":
+        series = _parse_xy_series(raw)
+        if not series:
+            return None
+        source_points = sum(len(values) for _, values in series)
+        budget = max(1, settings.PPT_CHART_MAX_POINTS // len(series))
+        series = [(name, values[grid_thin_indices(values[:, 0], values[:, 1], budget)]) for name, values in series]
+        return PreparedChart(kind, chart_type, [], series, source_points)
+
+    parsed = _parse_category_series(raw)
+    if parsed is None:
+        return None
+    categories, names, matrix = parsed
+    source_points = matrix.size
+    if kind == "pie":
+        # 파이는 첫 계열만, 음수는 표시할 수 없으므로 0
+        names, matrix = names[:1], np.clip(np.nan_to_num(matrix[:1]), 0, None)
+        categories, matrix = top_n(categories, matrix, settings.PPT_CHART_PIE_SLICES, sort=True)
+    elif kind == "bar":
+        categories, matrix = top_n(categories, matrix, settings.PPT_CHART_MAX_CATEGORIES)
+    else:
+        indices = _line_indices(categories, matrix, settings.PPT_CHART_MAX_POINTS)
+        categories, matrix = categories[indices], matrix[:, indices]
+    labels = ["" if label is None else str(label) for label in categories.tolist()]
+    return PreparedChart(kind, chart_type, labels, list(zip(names, matrix)), source_points)
+
+
+def add_chart(slide, prepared: PreparedChart, left: int, top: int, width: int, height: int):
+    """슬라이드에 네이티브 차트 추가 (차트 파트 + 내장 워크북)"""
+    graphic_frame = slide.shapes.add_chart(
+        prepared.chart_type, left, top, width, height, build_chart_data(prepared)
+    )
+    chart = graphic_frame.chart
+    chart.font.size = Pt(12)
+    chart.has_legend = prepared.kind == "pie" or len(prepared.series) > 1
+    if chart.has_legend:
+        chart.legend.position = XL_LEGEND_POSITION.BOTTOM
+        chart.legend.include_in_layout = False
+    return graphic_frame
+
+
+def add_content_chart(slide, content: Dict[str, Any], left: int, top: int, width: int, height: int):
+    """슬라이드 콘텐츠로 네이티브 차트 추가 - 숫자 값이 없거나 준비/추가 중 오류가 나면 None
+
+    추가하다 실패하면 그때까지 붙은 도형과 차트 파트 관계를 되돌린다 (렌더러는 차트 영역 표시로 대신한다).
+    """
+    try:
+        prepared = prepare_chart(content)
+    except Exception:
+        logger.warning("차트 데이터 준비 실패, 차트 영역 표시로 대체", exc_info=True)
+        return None
+    if prepared is None:
+        return None
+    sp_tree = slide.shapes._spTree
+    shape_count = len(sp_tree)
+    rIds = set(slide.part.rels.keys())
+    try:
+        return add_chart(slide, prepared, left, top, width, height)
+    except Exception:
+        logger.warning("차트 추가 실패, 차트 영역 표시로 대체", exc_info=True)
+        for element in list(sp_tree)[shape_count:]:
+            sp_tree.remove(element)
+        for rId in set(slide.part.rels.keys()) - rIds:
+            slide.part.rels.pop(rId)
+        return None
+
+
+def build_chart_data(prepared: PreparedChart):
+    """python-pptx ChartData (NaN은 빈 값)"""
+    if prepared.kind == "scatter":
+        chart_data = _XyChartData()
+        for name, values in prepared.series:
+            series = chart_data.add_series(name)
+            for x, y in values.tolist():
+                series.add_data_point(x, y)
+        return chart_data
+
+    chart_data = _CategoryChartData()
+    chart_data.categories = prepared.categories
+    for name, values in prepared.series:
+        chart_data.add_series(name, [None if value != value else value for value in values.tolist()])
+    return chart_data
+
+
+class _FixedTimeWorkbookMixin:
+    @contextmanager
+    def _open_worksheet(self, xlsx_file):
+        with super()._open_worksheet(xlsx_file) as (workbook, worksheet):
+            workbook.set_properties({"created": _WORKBOOK_CREATED})
+            yield workbook, worksheet
+
+
+class _CategoryWorkbookWriter(_FixedTimeWorkbookMixin, CategoryWorkbookWriter):
+    pass
+
+
+class _XyWorkbookWriter(_FixedTimeWorkbookMixin, XyWorkbookWriter):
+    pass
+
+
+class _CategoryChartData(CategoryChartData):
+    @property
+    def _workbook_writer(self):
+        return _CategoryWorkbookWriter(self)
+
+
+class _XyChartData(XyChartData):
+    @property
+    def _workbook_writer(self):
+        return _XyWorkbookWriter(self)
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """LTTB로 남길 점의 인덱스 (첫 점과 마지막 점 포함, threshold개)
+
+    가운데 점들을 threshold - 2개 구간으로 나누고, 구간마다 직전에 고른 점과 다음 구간 평균점으로 만든 삼각형의
+    넓이가 가장 큰 점을 고른다. 다음 구간 평균은 누적합으로 한 번에 구하고, 구간 안의 넓이 계산은 배열 연산이다.
+    """
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.nan_to_num(np.asarray(y, dtype=np.float64))
+
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.intp)
+    starts, ends = edges[:-1], edges[1:]
+    cumulative_x = np.concatenate(([0.0], np.cumsum(x)))
+    cumulative_y = np.concatenate(([0.0], np.cumsum(y)))
+    # 구간 i의 다음 구간 평균 (마지막 구간은 마지막 점)
+    next_starts = np.append(starts[1:], n - 1)
+    next_ends = np.append(ends[1:], n)
+    lengths = next_ends - next_starts
+    next_x = (cumulative_x[next_ends] - cumulative_x[next_starts]) / lengths
+    next_y = (cumulative_y[next_ends] - cumulative_y[next_starts]) / lengths
+
+    selected = np.empty(threshold, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for bucket, (start, end) in enumerate(zip(starts.tolist(), ends.tolist())):
+        ax, ay = x[previous], y[previous]
+        areas = np.abs(
+            (ax - next_x[bucket]) * (y[start:end] - ay) - (ax - x[start:end]) * (next_y[bucket] - ay)
+        )
+        previous = start + int(np.argmax(areas))
+        selected[bucket + 1] = previous
+    return selected
+
+
+def top_n(
+    categories: np.ndarray, matrix: np.ndarray, limit: int, sort: bool = False
+) -> Tuple[np.ndarray, np.ndarray]:
+    """계열 합계(절댓값) 상위 limit - 1개 항목 + 나머지 합계 "기타" (항목이 limit개 이하면 그대로)
+
+    sort면 남긴 항목을 큰 순서로, 아니면 원래 순서(시간 순 막대 등)로 둔다.
+    """
+    limit = max(2, limit)
+    if len(categories) <= limit:
+        return categories, matrix
+    totals = np.nansum(np.abs(matrix), axis=0)
+    keep = np.argpartition(-totals, limit - 2)[:limit - 1]
+    keep = keep[np.argsort(-totals[keep], kind="stable")] if sort else np.sort(keep)
+    rest = np.ones(len(categories), dtype=bool)
+    rest[keep] = False
+    other = np.nansum(matrix[:, rest], axis=1, keepdims=True)
+    return (
+        np.append(categories[keep], np.array([OTHER_LABEL], dtype=object)),
+        np.concatenate((matrix[:, keep], other), axis=1)
+    )
+
+
+def grid_thin_indices(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """x/y 범위를 약 max_points개 격자 칸으로 나눠 칸마다 첫 점만 남긴 인덱스 (값이 없는 점 제외)"""
+    finite = np.flatnonzero(np.isfinite(x) & np.isfinite(y))
+    if len(finite) <= max_points:
+        return finite
+    side = max(1, math.isqrt(max_points))
+    cells = np.zeros(len(finite), dtype=np.int64)
+    for values, scale in ((x[finite], side), (y[finite], 1)):
+        low, span = values.min(), np.ptp(values)
+        position = np.zeros(len(values), dtype=np.int64) if span == 0 else (
+            np.minimum((values - low) / span * side, side - 1).astype(np.int64)
+        )
+        cells += position * scale
+    _, first = np.unique(cells, return_index=True)
+    return finite[np.sort(first)]
+
+
+def _line_indices(categories: np.ndarray, matrix: np.ndarray, max_points: int) -> np.ndarray:
+    """계열마다 LTTB로 고른 점의 합집합 (항목 축을 공유하므로 항목 수 예산은 max_points // 계열 수)
+
+    합집합이 예산을 넘으면 합집합 안에서 고르게 줄인다 (계열의 극값 근처에 몰린 밀도는 유지).
+    """
+    if matrix.size <= max_points:
+        return np.arange(len(categories))
+    x = _to_numbers(categories)
+    if np.isnan(x).any() or np.any(np.diff(x) < 0):
+        x = np.arange(len(categories), dtype=np.float64)
+    budget = max(3, max_points // len(matrix))
+    merged = np.unique(np.concatenate([lttb_indices(x, values, budget) for values in matrix]))
+    if len(merged) <= budget:
+        return merged
+    return merged[np.unique(np.linspace(0, len(merged) - 1, budget).round().astype(np.intp))]
+
+
+def _parse_category_series(raw: Any) -> Optional[Tuple[np.ndarray, List[str], np.ndarray]]:
+    """(항목, 계열 이름, 계열×항목 값 행렬) - 값이 모두 비어 있으면 None
+
+    지원 형식: {"labels"|"categories"|"x": [...], "values"|"y"|"data": [...]},
+    {"labels": [...], "series"|"datasets": [{"name"|"label": ..., "values"|"data": [...]}, ...] 또는 {이름: [...]}},
+    {항목: 값, ...}, [{"label"|"name": ..., "value": ...}, ...], [값, ...]
+    """
+    categories: Optional[Sequence[Any]] = None
+    named: List[Tuple[str, Any]] = []
+    if isinstance(raw, dict):
+        categories = _first(raw, "labels", "categories", "x")
+        series = _first(raw, "series", "datasets")
+        if isinstance(series, dict):
+            named = [(str(name), values) for name, values in series.items()]
+        elif isinstance(series, list):
+            named = [
+                (str(_first(item, "name", "label") or f"계열 {index + 1}"), _first(item, "values", "data", "y"))
+                for index, item in enumerate(series) if isinstance(item, dict)
+            ]
+        else:
+            values = _first(raw, "values", "y", "data")
+            if values is not None:
+                named = [(str(raw.get("name") or raw.get("label") or "값"), values)]
+            elif categories is None:
+                categories, named = list(raw.keys()), [("값", list(raw.values()))]
+    elif isinstance(raw, list) and raw and all(isinstance(item, dict) for item in raw):
+        categories = [_first(item, "label", "name", "category", "x") for item in raw]
+        named = [("값", [_first(item, "value", "y", "count") for item in raw])]
+    elif isinstance(raw, list):
+        named = [("값", raw)]
+
+    rows = [(name, _to_numbers(values)) for name, values in named if isinstance(values, (list, tuple))]
+    rows = [(name, values) for name, values in rows if values.ndim == 1 and len(values)]
+    if not rows:
+        return None
+    length = max(len(values) for _, values in rows)
+    if categories is None or not isinstance(categories, (list, tuple)):
+        categories = [str(index + 1) for index in range(length)]
+    length = min(length, len(categories))
+    matrix = np.full((len(rows), length), np.nan)
+    for row, (_, values) in enumerate(rows):
+        matrix[row, :min(length, len(values))] = values[:length]
+    if length == 0 or np.isnan(matrix).all():
+        return None
+    # 항목 이름은 다운샘플링 후 남은 것만 문자열로 바꿈 (prepare_chart)
+    labels = np.empty(length, dtype=object)
+    labels[:] = categories[:length]
+    return labels, [name for name, _ in rows], matrix
+
+
+def _parse_xy_series(raw: Any) -> List[Tuple[str, np.ndarray]]:
+    """산점도 계열 - {"x": [...], "y": [...]}, {"points": [[x, y], ...]}, {"series": [{"name", "x", "y"}, ...]}"""
+    items = _first(raw, "series", "datasets") if isinstance(raw, dict) else raw
+    if isinstance(items, dict):
+        items = [{"name": name, **value} for name, value in items.items() if isinstance(value, dict)]
+    if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+        items = [raw] if isinstance(raw, dict) else []
+    series = []
+    for index, item in enumerate(items):
+        points = item.get("points")
+        if isinstance(points, list):
+            values = _to_numbers(points)
+        else:
+            # 스칼라 등 1차원이 아닌 x/y는 빈 계열로 봄
+            x, y = (_to_numbers(item.get(key) or []) for key in ("x", "y"))
+            x, y = (values if values.ndim == 1 else np.empty(0) for values in (x, y))
+            length = min(len(x), len(y))
+            values = np.column_stack((x[:length], y[:length]))
+        if values.ndim != 2 or values.shape[1] != 2:
+            continue
+        values = values[np.isfinite(values).all(axis=1)]
+        if len(values):
+            series.append((str(_first(item, "name", "label") or f"계열 {index + 1}"), values))
+    return series
+
+
+def _to_numbers(values: Any) -> np.ndarray:
+    """float64 배열 - 숫자로 바꿀 수 없는 값(USER_NEEDED, 빈 값 등)과 무한대("Infinity", "1e999" 등)는 NaN"""
+    try:
+        array = np.asarray(values, dtype=np.float64)
+    except (TypeError, ValueError, OverflowError):
+        array = np.asarray(values, dtype=object)
+        flat = np.fromiter((_to_float(value) for value in array.ravel()), dtype=np.float64, count=array.size)
+        return flat.reshape(array.shape)
+    infinite = np.isinf(array)
+    return np.where(infinite, np.nan, array) if infinite.any() else array
+
+
+def _to_float(value: Any) -> float:
+    if isinstance(value, str):
+        value = value.replace(",", "").strip().rstrip("%")
+    try:
+        number = float(value)
+    except (TypeError, ValueError, OverflowError):
+        return math.nan
+    return number if math.isfinite(number) else math.nan
+
+
+def _first(item: Any, *keys: str) -> Any:
+    if not isinstance(item, dict):
+        return None
+    for key in keys:
+        if item.get(key) is not None:
+            return item[key]
+    return None
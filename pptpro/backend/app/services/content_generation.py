@@ -1,10 +1,42 @@
 """
 콘텐츠 생성 서비스 - 슬라이드별 세부 내용 LLM 생성
 """
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
-from app.infrastructure.llm_provider import get_llm_provider
-from app.db.memory_store import Slide
+import asyncio
+import copy
+import json
+import logging
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass, field, replace
+from app.infrastructure.json_stream import (
+    IncrementalJSONParser,
+    JSONPath,
+    PartialJSONError,
+    format_path,
+    parse_path,
+    schema_fields,
+)
+from app.core.config import settings
+from app.infrastructure.llm_provider import build_structured_prompt, get_llm_provider
+from app.infrastructure.llm_telemetry import llm_call_tags
+from app.infrastructure.rate_limiter import estimate_tokens
+from app.db.memory_store import Project, Slide
+
+logger = logging.getLogger(__name__)
+
+# 템플릿별 예상 응답 토큰 수 (배치 크기 계산용)
+TEMPLATE_OUTPUT_TOKENS = {
+    "message_only": 400,
+    "asis_tobe": 550,
+    "case_box": 900,
+    "step_flow": 850,
+    "chart_insight": 550,
+    "node_map": 700,
+}
+DEFAULT_OUTPUT_TOKENS = 600
+# 배치 응답 max_tokens 여유 배율 (예상보다 긴 응답이 잘리지 않도록)
+BATCH_OUTPUT_HEADROOM = 1.3
+# 필드 재생성 시 기존 값이 없는 필드의 예상 응답 토큰 수
+FIELD_OUTPUT_TOKENS = 150
 
 
 @dataclass
@@ -22,6 +54,33 @@ class SlideContent:
     generated_content: Dict[str, Any]  # 템플릿별 구조화된 내용
     user_needed_items: List[str]  # 사용자가 직접 입력해야 할 항목들
     generation_notes: str  # AI 생성 과정의 메모
+    missing_fields: List[str] = field(default_factory=list)  # 응답이 잘려 채우지 못한 필드
+
+
+@dataclass
+class FieldRegeneration:
+    slide_content: SlideContent  # 재생성한 필드를 병합한 슬라이드 콘텐츠
+    regenerated_fields: List[str]
+    # 예상 토큰 수 - 이번 요청과 슬라이드 전체 재생성 비교
+    prompt_tokens: int
+    output_tokens: int
+    full_prompt_tokens: int
+    full_output_tokens: int
+    # 필드 경로별 생성 값 (None이면 응답에 없음)과 응답 메모 - 다른 콘텐츠에 다시 병합할 때 사용
+    values: Dict[JSONPath, Any] = field(default_factory=dict)
+    notes: str = ""
+    
+    def token_usage(self) -> Dict[str, int]:
+        used = self.prompt_tokens + self.output_tokens
+        full = self.full_prompt_tokens + self.full_output_tokens
+        return {
+            "prompt_tokens": self.prompt_tokens,
+            "output_tokens": self.output_tokens,
+            "full_prompt_tokens": self.full_prompt_tokens,
+            "full_output_tokens": self.full_output_tokens,
+            "saved_tokens": full - used,
+            "saved_output_tokens": self.full_output_tokens - self.output_tokens,
+        }
 
 
 class ContentGenerationService:
@@ -33,30 +92,430 @@ class ContentGenerationService:
     async def generate_slide_content(
         self, 
         slide: Slide, 
-        project_context: Dict[str, str]
+        project_context: Dict[str, str],
+        use_cache: bool = True
     ) -> SlideContent:
-        """슬라이드 템플릿에 맞는 내용 생성"""
+        """슬라이드 템플릿에 맞는 내용 생성 (재생성 시 use_cache=False)"""
         
         prompt = self._build_content_prompt(slide, project_context)
         schema = self._get_template_schema(slide.template_type)
         
         try:
-            response = await self.llm_provider.generate_structured(prompt, schema)
+            with self._call_tags(slide):
+                response = await self.llm_provider.generate_structured(
+                    prompt, schema, use_cache=use_cache
+                )
+            return self._build_slide_content(slide, response)
             
-            # USER_NEEDED 항목 추출
-            user_needed_items = self._extract_user_needed_items(response)
-            
-            return SlideContent(
-                slide_id=slide.id,
-                template_type=slide.template_type,
-                generated_content=response.get("content", {}),
-                user_needed_items=user_needed_items,
-                generation_notes=response.get("notes", "AI가 생성한 초안입니다.")
-            )
+        except PartialJSONError as e:
+            # 잘린 응답은 완결된 필드를 살리고 누락 필드만 보고
+            return self._build_partial_content(slide, e.data, e.missing_fields)
+        except Exception as e:
+            # LLM 실패 시 기본 구조 반환
+            logger.warning("LLM 콘텐츠 생성 실패, 기본 구조로 대체: %s", e)
+            return self._get_fallback_content(slide)
+    
+    async def stream_slide_content(
+        self, 
+        slide: Slide, 
+        project_context: Dict[str, str],
+        use_cache: bool = True
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """스트리밍 생성
+
+        ("token", 텍스트 조각)과 완결된 콘텐츠 필드마다 ("field", {"name", "value"})를
+        보낸 뒤 마지막에 ("result", SlideContent)를 보낸다.
+        """
+        
+        prompt = self._build_content_prompt(slide, project_context)
+        schema = self._get_template_schema(slide.template_type)
+        
+        parser = IncrementalJSONParser()
+        try:
+            with self._call_tags(slide):
+                async for chunk in self.llm_provider.generate_stream(
+                    prompt, schema, use_cache=use_cache
+                ):
+                    yield "token", chunk
+                    for path, value in parser.feed(chunk):
+                        if path[0] == "content" and len(path) == 2:
+                            yield "field", {"name": path[1], "value": value}
             
+            parsed = parser.result(schema_fields(schema))
+            if parsed.complete:
+                result = self._build_slide_content(slide, parsed.data)
+            else:
+                result = self._build_partial_content(slide, parsed.data, parsed.missing_fields)
         except Exception as e:
             # LLM 실패 시 기본 구조 반환
+            logger.warning("LLM 콘텐츠 생성 실패, 기본 구조로 대체: %s", e)
+            result = self._get_fallback_content(slide)
+        
+        yield "result", result
+    
+    async def generate_slides_content(
+        self,
+        slides: List[Slide],
+        project_context: Dict[str, str],
+        use_cache: bool = True
+    ) -> Dict[str, SlideContent]:
+        """같은 프로젝트의 여러 슬라이드를 배치로 묶어 생성 (slide_id -> SlideContent)
+
+        프로젝트 맥락과 생성 원칙은 배치마다 한 번만 보내고, 배치 크기는 토큰 예산에 맞춰 정한다.
+        응답에서 빠지거나 잘린 슬라이드만 절반씩 나눠 다시 요청하며, 한 장이 남으면 단건 생성으로 처리한다.
+        호출 자체가 실패한 배치는 나누지 않고 슬라이드별 단건 생성으로 대체한다.
+        """
+        results: Dict[str, SlideContent] = {}
+        batches = self._plan_batches(slides, project_context)
+        await asyncio.gather(*(
+            self._generate_batch(batch, project_context, use_cache, results) for batch in batches
+        ))
+        return results
+    
+    def _plan_batches(self, slides: List[Slide], project_context: Dict[str, str]) -> List[List[Slide]]:
+        """슬라이드 순서대로 최대 장수, 프롬프트/응답 토큰 예산 안에서 배치 구성"""
+        max_output_tokens = settings.CONTENT_BATCH_MAX_OUTPUT_TOKENS / BATCH_OUTPUT_HEADROOM
+        batches: List[List[Slide]] = []
+        current: List[Slide] = []
+        for slide in slides:
+            candidate = current + [slide]
+            if current and (
+                len(candidate) > settings.CONTENT_BATCH_MAX_SLIDES
+                or self._batch_output_tokens(candidate) > max_output_tokens
+                or self._batch_prompt_tokens(candidate, project_context) > settings.CONTENT_BATCH_MAX_PROMPT_TOKENS
+            ):
+                batches.append(current)
+                candidate = [slide]
+            current = candidate
+        if current:
+            batches.append(current)
+        return batches
+    
+    async def _generate_batch(
+        self,
+        slides: List[Slide],
+        project_context: Dict[str, str],
+        use_cache: bool,
+        results: Dict[str, SlideContent]
+    ) -> None:
+        """배치 하나 생성 - 응답에서 빠지거나 잘린 슬라이드만 나눠서 재시도"""
+        if len(slides) == 1:
+            results[slides[0].id] = await self.generate_slide_content(slides[0], project_context, use_cache)
+            return
+        
+        keyed_slides = self._batch_keys(slides)
+        prompt = self._build_batch_prompt(keyed_slides, project_context)
+        schema = self._get_batch_schema(keyed_slides)
+        max_tokens = min(
+            settings.CONTENT_BATCH_MAX_OUTPUT_TOKENS,
+            int(self._batch_output_tokens(slides) * BATCH_OUTPUT_HEADROOM),
+        )
+        
+        truncated: set = set()
+        try:
+            with llm_call_tags(template_type="batch", project_id=slides[0].project_id):
+                response = await self.llm_provider.generate_structured(
+                    prompt, schema, use_cache=use_cache, max_tokens=max_tokens
+                )
+        except PartialJSONError as e:
+            # 잘린 응답은 완결된 슬라이드만 사용
+            response = e.data
+            truncated = {path.split(".")[0] for path in e.missing_fields}
+        except Exception as e:
+            # 호출 자체가 실패하면 나눠도 같은 오류가 반복되므로 단건 생성으로 한 번만 대체
+            logger.warning("배치 콘텐츠 생성 실패, 슬라이드별로 생성: %s", e)
+            contents = await asyncio.gather(*(
+                self.generate_slide_content(slide, project_context, use_cache) for slide in slides
+            ))
+            results.update((slide.id, content) for slide, content in zip(slides, contents))
+            return
+        
+        failed = []
+        for key, slide in keyed_slides.items():
+            entry = response.get(key)
+            if key in truncated or not self._is_complete_entry(slide, entry):
+                failed.append(slide)
+            else:
+                results[slide.id] = self._build_slide_content(slide, entry)
+        
+        if failed:
+            middle = (len(failed) + 1) // 2
+            halves = [half for half in (failed[:middle], failed[middle:]) if half]
+            await asyncio.gather(*(
+                self._generate_batch(half, project_context, use_cache, results) for half in halves
+            ))
+    
+    async def regenerate_fields(
+        self,
+        slide: Slide,
+        project_context: Dict[str, str],
+        field_paths: Optional[List[str]] = None,
+        use_cache: bool = False
+    ) -> FieldRegeneration:
+        """지정한 필드만 다시 생성해 기존 콘텐츠에 병합
+
+        field_paths는 "as_is_points", "cases[2].description" 형식이며, 생략하면 USER_NEEDED가
+        남은 필드를 다시 생성한다. 나머지 콘텐츠는 고정된 맥락으로만 보내므로 응답이 작다.
+        잘못된 경로나 다시 생성할 필드가 없으면 ValueError.
+        """
+        content = slide.content or {}
+        paths = self._resolve_field_paths(slide, content, field_paths)
+        keyed_paths = {f"f{index}": path for index, path in enumerate(paths, start=1)}
+        
+        prompt = self._build_fields_prompt(slide, project_context, content, keyed_paths)
+        schema = self._get_fields_schema(slide.template_type, keyed_paths)
+        output_tokens = sum(self._field_output_tokens(content, path) for path in paths)
+        max_tokens = int(
+            min(TEMPLATE_OUTPUT_TOKENS.get(slide.template_type, DEFAULT_OUTPUT_TOKENS), output_tokens)
+            * BATCH_OUTPUT_HEADROOM
+        )
+        
+        with self._call_tags(slide):
+            try:
+                response = await self.llm_provider.generate_structured(
+                    prompt, schema, use_cache=use_cache, max_tokens=max_tokens
+                )
+            except PartialJSONError as e:
+                # 완결된 필드만 병합
+                response = e.data
+        
+        fields = response.get("fields") or {}
+        values = {
+            path: None if fields.get(key) in (None, "", [], {}) else fields[key]
+            for key, path in keyed_paths.items()
+        }
+        notes = response.get("notes") or "선택한 항목을 다시 생성했습니다."
+        slide_content, regenerated = self._merge_fields(slide, content, values, notes)
+        return FieldRegeneration(
+            slide_content=slide_content,
+            regenerated_fields=regenerated,
+            prompt_tokens=estimate_tokens(build_structured_prompt(prompt, schema)),
+            output_tokens=output_tokens,
+            full_prompt_tokens=estimate_tokens(build_structured_prompt(
+                self._build_content_prompt(slide, project_context),
+                self._get_template_schema(slide.template_type),
+            )),
+            # 전체 재생성은 적어도 지금 콘텐츠만큼 응답해야 함
+            full_output_tokens=max(
+                TEMPLATE_OUTPUT_TOKENS.get(slide.template_type, DEFAULT_OUTPUT_TOKENS),
+                estimate_tokens(json.dumps(content, ensure_ascii=False)),
+            ),
+            values=values,
+            notes=notes
+        )
+    
+    def apply_regeneration(self, slide: Slide, regeneration: FieldRegeneration) -> FieldRegeneration:
+        """재생성한 필드만 슬라이드의 현재 콘텐츠에 다시 병합
+        
+        생성하는 동안 사용자가 다른 필드를 수정했을 수 있으므로 저장 직전에 다시 읽은 슬라이드에 적용한다.
+        """
+        slide_content, regenerated = self._merge_fields(
+            slide, slide.content or {}, regeneration.values, regeneration.notes
+        )
+        return replace(regeneration, slide_content=slide_content, regenerated_fields=regenerated)
+    
+    def _merge_fields(
+        self, slide: Slide, content: Dict[str, Any], values: Dict[JSONPath, Any], notes: str
+    ) -> Tuple[SlideContent, List[str]]:
+        """생성 값을 콘텐츠 사본에 병합 - (병합한 콘텐츠, 재생성한 필드 목록)"""
+        merged = copy.deepcopy(content)
+        regenerated, missing = [], []
+        for path, value in values.items():
+            if value is None or not self._set_path(merged, path, value):
+                missing.append(format_path(path))
+            else:
+                regenerated.append(format_path(path))
+        
+        if missing:
+            notes = f"일부 항목이 생성되지 않았습니다: {', '.join(missing)}"
+        slide_content = SlideContent(
+            slide_id=slide.id,
+            template_type=slide.template_type,
+            generated_content=merged,
+            user_needed_items=self._extract_user_needed_items({"content": merged}),
+            generation_notes=notes,
+            missing_fields=missing
+        )
+        return slide_content, regenerated
+    
+    @staticmethod
+    def project_context(project: Project) -> Dict[str, str]:
+        """프롬프트에 넣을 프로젝트 맥락"""
+        return {
+            "topic": project.topic,
+            "target_audience": project.target_audience,
+            "goal": project.goal,
+            "title": project.title
+        }
+    
+    def estimate_request_tokens(self, slide: Slide, project_context: Dict[str, str]) -> int:
+        """단건 생성 요청의 예상 토큰 수 (프롬프트 + 템플릿별 예상 응답)"""
+        prompt = build_structured_prompt(
+            self._build_content_prompt(slide, project_context),
+            self._get_template_schema(slide.template_type),
+        )
+        return estimate_tokens(prompt) + TEMPLATE_OUTPUT_TOKENS.get(slide.template_type, DEFAULT_OUTPUT_TOKENS)
+    
+    def _resolve_field_paths(
+        self, slide: Slide, content: Dict[str, Any], field_paths: Optional[List[str]]
+    ) -> List[JSONPath]:
+        """재생성할 필드 경로 검증 (생략 시 USER_NEEDED 필드)"""
+        if not field_paths:
+            paths = self._find_user_needed_paths(content)
+            if not paths:
+                raise ValueError("다시 생성할 USER_NEEDED 항목이 없습니다")
+            return paths
+        
+        template_fields = self._get_template_schema(slide.template_type)["content"]
+        paths = []
+        for text in dict.fromkeys(field_paths):
+            path = parse_path(text)
+            if path[0] not in template_fields and path[0] not in content:
+                raise ValueError(f"템플릿에 없는 필드입니다: {text}")
+            # 배열 항목은 기존 배열 안이거나 바로 뒤(추가)여야 함
+            node: Any = content
+            for index, segment in enumerate(path[:-1]):
+                if isinstance(segment, int):
+                    exists = isinstance(node, list) and segment < len(node)
+                else:
+                    exists = isinstance(node, dict) and segment in node
+                if not exists:
+                    raise ValueError(f"기존 콘텐츠에 없는 경로입니다: {format_path(path[:index + 1])}")
+                node = node[segment]
+            if isinstance(path[-1], int) and (not isinstance(node, list) or path[-1] > len(node)):
+                raise ValueError(f"기존 콘텐츠에 없는 경로입니다: {text}")
+            paths.append(path)
+        return paths
+    
+    @staticmethod
+    def _find_user_needed_paths(content: Any, prefix: JSONPath = ()) -> List[JSONPath]:
+        """값에 USER_NEEDED가 들어 있는 가장 안쪽 필드 경로들"""
+        if isinstance(content, dict):
+            items = content.items()
+        elif isinstance(content, list):
+            items = enumerate(content)
+        else:
+            return [prefix] if isinstance(content, str) and "USER_NEEDED" in content and prefix else []
+        paths: List[JSONPath] = []
+        for key, value in items:
+            paths.extend(ContentGenerationService._find_user_needed_paths(value, prefix + (key,)))
+        return paths
+    
+    @staticmethod
+    def _set_path(content: Dict[str, Any], path: JSONPath, value: Any) -> bool:
+        """경로에 값 설정 (배열 끝 바로 다음 인덱스는 추가) - 설정할 수 없으면 False"""
+        node: Any = content
+        for segment in path[:-1]:
+            try:
+                node = node[segment]
+            except (KeyError, IndexError, TypeError):
+                return False
+        last = path[-1]
+        if isinstance(last, int):
+            if not isinstance(node, list) or last > len(node):
+                return False
+            if last == len(node):
+                node.append(value)
+            else:
+                node[last] = value
+        elif isinstance(node, dict):
+            node[last] = value
+        else:
+            return False
+        return True
+    
+    @staticmethod
+    def _field_output_tokens(content: Dict[str, Any], path: JSONPath) -> int:
+        """필드 하나의 예상 응답 토큰 수 (기존 값 길이 기준)"""
+        node: Any = content
+        for segment in path:
+            try:
+                node = node[segment]
+            except (KeyError, IndexError, TypeError):
+                return FIELD_OUTPUT_TOKENS
+        return max(FIELD_OUTPUT_TOKENS, estimate_tokens(json.dumps(node, ensure_ascii=False)))
+    
+    def _get_fields_schema(self, template_type: str, keyed_paths: Dict[str, JSONPath]) -> Dict[str, Any]:
+        """필드 키(f1, f2, ...)별 템플릿 스키마 조각"""
+        fields = {}
+        for key, path in keyed_paths.items():
+            node: Any = self._get_template_schema(template_type)["content"]
+            for segment in path:
+                if isinstance(segment, int):
+                    node = node[0] if isinstance(node, list) and node else "string"
+                elif isinstance(node, dict):
+                    node = node.get(segment, "string")
+                else:
+                    node = "string"
+            fields[key] = node
+        return {"fields": fields, "notes": "string (생성 과정 설명)"}
+    
+    @staticmethod
+    def _batch_keys(slides: List[Slide]) -> Dict[str, Slide]:
+        """응답 키(s1, s2, ...) -> 슬라이드"""
+        return {f"s{index}": slide for index, slide in enumerate(slides, start=1)}
+    
+    @staticmethod
+    def _batch_output_tokens(slides: List[Slide]) -> int:
+        return sum(TEMPLATE_OUTPUT_TOKENS.get(slide.template_type, DEFAULT_OUTPUT_TOKENS) for slide in slides)
+    
+    def _batch_prompt_tokens(self, slides: List[Slide], project_context: Dict[str, str]) -> int:
+        keyed_slides = self._batch_keys(slides)
+        return estimate_tokens(build_structured_prompt(
+            self._build_batch_prompt(keyed_slides, project_context),
+            self._get_batch_schema(keyed_slides),
+        ))
+    
+    def _get_batch_schema(self, keyed_slides: Dict[str, Slide]) -> Dict[str, Any]:
+        """슬라이드 키별 템플릿 응답 스키마"""
+        return {key: self._get_template_schema(slide.template_type) for key, slide in keyed_slides.items()}
+    
+    def _is_complete_entry(self, slide: Slide, entry: Any) -> bool:
+        """배치 응답의 슬라이드 항목이 템플릿 필드를 모두 갖췄는지"""
+        if not isinstance(entry, dict) or not isinstance(entry.get("content"), dict):
+            return False
+        content = entry["content"]
+        required = self._get_template_schema(slide.template_type)["content"]
+        if not required:
+            return bool(content)
+        return all(content.get(name) not in (None, "", [], {}) for name in required)
+    
+    @staticmethod
+    def _call_tags(slide: Slide):
+        """LLM 호출 로그에 슬라이드 정보 태그"""
+        return llm_call_tags(
+            template_type=slide.template_type, project_id=slide.project_id, slide_id=slide.id
+        )
+    
+    def _build_slide_content(self, slide: Slide, response: Dict[str, Any]) -> SlideContent:
+        """LLM 응답을 SlideContent로 변환"""
+        # USER_NEEDED 항목 추출
+        user_needed_items = self._extract_user_needed_items(response)
+        
+        return SlideContent(
+            slide_id=slide.id,
+            template_type=slide.template_type,
+            generated_content=response.get("content", {}),
+            user_needed_items=user_needed_items,
+            generation_notes=response.get("notes", "AI가 생성한 초안입니다.")
+        )
+    
+    def _build_partial_content(
+        self, slide: Slide, response: Dict[str, Any], missing_fields: List[str]
+    ) -> SlideContent:
+        """잘린 응답 복구 결과 - 콘텐츠가 하나도 없으면 기본 콘텐츠"""
+        if not response.get("content"):
             return self._get_fallback_content(slide)
+        
+        slide_content = self._build_slide_content(slide, response)
+        slide_content.missing_fields = [
+            path[len("content."):] for path in missing_fields if path.startswith("content.")
+        ]
+        if slide_content.missing_fields:
+            slide_content.generation_notes = (
+                f"응답이 잘려 일부 항목이 생성되지 않았습니다: {', '.join(slide_content.missing_fields)}"
+            )
+        return slide_content
     
     def _build_content_prompt(self, slide: Slide, project_context: Dict[str, str]) -> str:
         """콘텐츠 생성 프롬프트 구성"""
@@ -64,10 +523,7 @@ class ContentGenerationService:
         base_prompt = f"""
 당신은 전문 컨설팅 슬라이드 작성자입니다. 다음 정보를 바탕으로 슬라이드 내용을 생성해주세요.
 
-**프로젝트 맥락:**
-- 주제: {project_context.get('topic', '')}
-- 타겟: {project_context.get('target_audience', '')}
-- 목표: {project_context.get('goal', '')}
+{self._format_project_context(project_context)}
 
 **슬라이드 정보:**
 - 헤드메시지: {slide.head_message}
@@ -85,6 +541,75 @@ class ContentGenerationService:
         template_instruction = self._get_template_instruction(slide.template_type)
         return f"{base_prompt}\n\n{template_instruction}"
     
+    def _build_batch_prompt(self, keyed_slides: Dict[str, Slide], project_context: Dict[str, str]) -> str:
+        """여러 슬라이드 생성 프롬프트 - 공통 맥락과 템플릿 지침은 한 번씩만 포함"""
+        
+        slide_lines = "\n".join(
+            f"- {key}: 헤드메시지: {slide.head_message} / 템플릿: {slide.template_type} / "
+            f"목적: {slide.purpose} / 순서: {slide.order}번째 슬라이드"
+            for key, slide in keyed_slides.items()
+        )
+        
+        base_prompt = f"""
+당신은 전문 컨설팅 슬라이드 작성자입니다. 다음 정보를 바탕으로 여러 슬라이드의 내용을 한 번에 생성해주세요.
+
+{self._format_project_context(project_context)}
+
+**슬라이드 목록:**
+{slide_lines}
+
+**생성 원칙:**
+1. 각 슬라이드의 헤드메시지를 뒷받침하는 구체적 내용 생성
+2. 컨설팅 스타일: 논리적, 간결, 액션 지향적
+3. 데이터가 필요한 부분은 "USER_NEEDED" 표시
+4. 슬라이드 키(s1, s2, ...)별로 해당 템플릿 구조에 맞는 형태로 출력
+5. 슬라이드 간 내용이 겹치지 않도록 전체 흐름 고려
+"""
+        
+        template_types = dict.fromkeys(slide.template_type for slide in keyed_slides.values())
+        template_instructions = "".join(self._get_template_instruction(t) for t in template_types)
+        return f"{base_prompt}\n\n{template_instructions}"
+    
+    def _build_fields_prompt(
+        self,
+        slide: Slide,
+        project_context: Dict[str, str],
+        content: Dict[str, Any],
+        keyed_paths: Dict[str, JSONPath]
+    ) -> str:
+        """필드 재생성 프롬프트 - 기존 콘텐츠는 고정 맥락으로 전달"""
+        
+        field_lines = "\n".join(f"- {key}: {format_path(path)}" for key, path in keyed_paths.items())
+        
+        return f"""
+당신은 전문 컨설팅 슬라이드 작성자입니다. 이미 작성된 슬라이드에서 지정한 항목만 다시 작성해주세요.
+
+{self._format_project_context(project_context)}
+
+**슬라이드 정보:**
+- 헤드메시지: {slide.head_message}
+- 템플릿: {slide.template_type}
+- 목적: {slide.purpose}
+
+**현재 슬라이드 내용 (수정하지 말 것):**
+{json.dumps(content, ensure_ascii=False)}
+
+**다시 작성할 항목 (키: 필드 경로):**
+{field_lines}
+
+**작성 원칙:**
+1. 지정한 항목의 값만 키(f1, f2, ...)별로 작성하고 다른 항목은 출력하지 않음
+2. 현재 내용과 어조, 형식, 논리 흐름을 맞출 것
+3. USER_NEEDED 표시 대신 구체적인 내용으로 작성하되, 실제 데이터가 꼭 필요한 부분만 USER_NEEDED 유지
+"""
+    
+    @staticmethod
+    def _format_project_context(project_context: Dict[str, str]) -> str:
+        return f"""**프로젝트 맥락:**
+- 주제: {project_context.get('topic', '')}
+- 타겟: {project_context.get('target_audience', '')}
+- 목표: {project_context.get('goal', '')}"""
+    
     def _get_template_instruction(self, template_type: str) -> str:
         """템플릿별 생성 지침"""
         
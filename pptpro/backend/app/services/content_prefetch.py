@@ -0,0 +1,152 @@
+"""
+콘텐츠 추측 생성 - 스토리라인으로 슬라이드가 만들어지면 사용자가 열기 전에 미리 콘텐츠 생성
+"""
+import asyncio
+import logging
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+from app.db.memory_store import Project, Slide, project_store, slide_store
+from app.infrastructure.llm_telemetry import llm_call_tags
+from app.infrastructure.rate_limiter import PRIORITY_LOW, llm_call_priority
+from app.infrastructure.single_flight import SingleFlight
+from app.services.content_generation import ContentGenerationService
+
+logger = logging.getLogger(__name__)
+
+# (슬라이드, 프로젝트, 생성 시작 시점의 updated_at) - 저장 직전 updated_at이 다르면 SlideChangedError
+SlideGenerator = Callable[[Slide, Project, datetime], Awaitable[Any]]
+
+
+class SlideChangedError(Exception):
+    """생성하는 동안 슬라이드가 수정/삭제되어 결과를 저장하지 않음"""
+
+
+class TokenBudget:
+    """사용자별 토큰 예산 - 최근 window초 동안 limit 토큰까지 허용"""
+
+    def __init__(self, limit: int, window: float):
+        self.limit = limit
+        self.window = window
+        self._spent: Dict[str, Deque[Tuple[float, int]]] = {}
+
+    def remaining(self, user_id: str) -> int:
+        return max(0, self.limit - self._used(user_id))
+
+    def reserve(self, user_id: str, tokens: int) -> bool:
+        """예산 안이면 tokens만큼 차감하고 True"""
+        if self._used(user_id) + tokens > self.limit:
+            return False
+        self._spent.setdefault(user_id, deque()).append((time.monotonic(), tokens))
+        return True
+
+    def _used(self, user_id: str) -> int:
+        entries = self._spent.get(user_id)
+        if not entries:
+            return 0
+        cutoff = time.monotonic() - self.window
+        while entries and entries[0][0] < cutoff:
+            entries.popleft()
+        return sum(tokens for _, tokens in entries)
+
+
+class ContentPrefetcher:
+    """슬라이드 콘텐츠 추측 생성기
+
+    schedule()로 넣은 슬라이드를 순서대로 concurrency개의 워커가 낮은 우선순위(PRIORITY_LOW)로 생성한다.
+    - 대화형 요청이 속도 제한기에서 기다리고 있으면(is_busy) 새 생성을 시작하지 않고 양보
+    - 사용자별 토큰 예산(예상 토큰 기준)을 넘으면 남은 슬라이드는 건너뜀
+    - 슬라이드별 생성 가드(flight)를 공유해, 생성 중에 사용자가 슬라이드를 열면 그 결과를 함께 받음
+    - 생성 중에 사용자가 슬라이드를 편집하면 결과를 버림 (편집 내용을 덮어쓰지 않음)
+    """
+
+    def __init__(
+        self,
+        flight: SingleFlight,
+        generate: SlideGenerator,
+        concurrency: int,
+        budget: TokenBudget,
+        is_busy: Callable[[], bool],
+        busy_poll_interval: float = 0.5,
+    ):
+        self.flight = flight
+        self.generate = generate
+        self.concurrency = max(1, concurrency)
+        self.budget = budget
+        self.is_busy = is_busy
+        self.busy_poll_interval = busy_poll_interval
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._workers: List[asyncio.Task] = []
+        self.counters = {
+            "scheduled": 0, "generated": 0, "skipped": 0,
+            "budget_exhausted": 0, "deferred": 0, "failed": 0, "discarded": 0,
+        }
+
+    def schedule(self, user_id: str, project: Project, slides: List[Slide]) -> int:
+        """슬라이드 순서대로 추측 생성 대기열에 추가"""
+        self._ensure_started()
+        ordered = sorted(slides, key=lambda slide: slide.order)
+        for slide in ordered:
+            self._queue.put_nowait((user_id, project.id, slide.id))
+        self.counters["scheduled"] += len(ordered)
+        return len(ordered)
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self.counters, "queued": self._queue.qsize() if self._queue else 0}
+
+    async def aclose(self) -> None:
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def _ensure_started(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._workers:
+            return
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._workers = [loop.create_task(self._worker()) for _ in range(self.concurrency)]
+
+    async def _worker(self) -> None:
+        while True:
+            user_id, project_id, slide_id = await self._queue.get()
+            try:
+                await self._prefetch(user_id, project_id, slide_id)
+            except Exception as e:
+                self.counters["failed"] += 1
+                logger.warning("콘텐츠 추측 생성 실패: %s", e)
+
+    async def _prefetch(self, user_id: str, project_id: str, slide_id: str) -> None:
+        # 대화형 요청이 대기 중이면 여유가 생길 때까지 양보
+        deferred = False
+        while self.is_busy():
+            if not deferred:
+                deferred = True
+                self.counters["deferred"] += 1
+            await asyncio.sleep(self.busy_poll_interval)
+
+        # 그 사이 사용자가 직접 생성/편집했거나 삭제된 슬라이드는 건너뜀
+        slide = slide_store.get_slide(slide_id)
+        project = project_store.get_project(project_id)
+        if slide is None or project is None or slide.content or self.flight.in_flight(slide_id):
+            self.counters["skipped"] += 1
+            return
+
+        service = ContentGenerationService()
+        tokens = service.estimate_request_tokens(slide, service.project_context(project))
+        if not self.budget.reserve(user_id, tokens):
+            self.counters["budget_exhausted"] += 1
+            return
+
+        updated_at = slide.updated_at
+        try:
+            with llm_call_priority(PRIORITY_LOW), llm_call_tags(endpoint="content_prefetch"):
+                await self.flight.do(slide_id, lambda: self.generate(slide, project, updated_at))
+        except SlideChangedError:
+            self.counters["discarded"] += 1
+            return
+        self.counters["generated"] += 1
@@ -0,0 +1,119 @@
+"""
+일괄 생성 파이프라인 - 스토리라인 생성, 슬라이드 콘텐츠 동시 생성, PPT 렌더링을 한 작업으로 실행
+"""
+import asyncio
+from dataclasses import asdict
+from typing import Any, Dict, List
+
+from app.core.config import settings
+from app.db.memory_store import Project, Slide, project_store, slide_store
+from app.infrastructure.jobs import JobContext
+from app.services.content_generation import ContentGenerationService
+from app.infrastructure.render_pool import render_executor
+from app.services.ppt_generation import PPTX_MEDIA_TYPE, PPTGenerationService, render_presentation_to_file
+from app.services.storyline import StorylineService
+
+
+class PipelineService:
+    """스토리라인 → 콘텐츠 → PPT 파이프라인
+
+    진행 상황(단계, 슬라이드별 생성 결과)은 작업 기록의 progress에 바로 반영되어 /jobs API로 확인할 수 있다.
+    콘텐츠는 슬라이드별로 동시에 생성하되 동시 실행 수는 concurrency로 제한한다.
+    """
+
+    def __init__(self, concurrency: int = settings.PIPELINE_CONTENT_CONCURRENCY):
+        self.concurrency = max(1, concurrency)
+        self.storyline_service = StorylineService()
+        self.content_service = ContentGenerationService()
+
+    async def run(self, job: JobContext) -> Dict[str, Any]:
+        """작업 실행 - 결과 PPT는 작업 결과 파일로 저장"""
+        project = await self._create_project(job)
+        slides = slide_store.get_slides_for_project(project.id)
+        await self._generate_contents(job, project, slides)
+        return await self._render(job, project, slides)
+
+    async def _create_project(self, job: JobContext) -> Project:
+        """스토리라인 생성 후 프로젝트와 슬라이드 생성"""
+        job.update_progress(stage="storyline")
+        request = job.payload
+
+        result = await self.storyline_service.generate_storyline(
+            topic=request["topic"],
+            target=request["target"],
+            goal=request["goal"],
+            narrative_style=request.get("narrative_style") or "consulting"
+        )
+
+        project = project_store.create_project(
+            user_id=job.user_id,
+            title=request.get("project_title") or f"{request['topic']} 프로젝트",
+            topic=request["topic"],
+            target_audience=request["target"],
+            goal=request["goal"]
+        )
+        slides = slide_store.create_slides_from_storyline(
+            project.id, [asdict(slide) for slide in result.outline]
+        )
+
+        job.update_progress(project_id=project.id, slides=[
+            {
+                "slide_id": slide.id,
+                "order": slide.order,
+                "head_message": slide.head_message,
+                "template_type": slide.template_type,
+                "status": "pending",
+            }
+            for slide in slides
+        ])
+        return project
+
+    async def _generate_contents(self, job: JobContext, project: Project, slides: List[Slide]) -> None:
+        """슬라이드 콘텐츠 동시 생성 (완료되는 대로 작업에 반영)"""
+        job.update_progress(stage="content", total_slides=len(slides), completed_slides=0)
+        project_context = {
+            "topic": project.topic,
+            "target_audience": project.target_audience,
+            "goal": project.goal,
+            "title": project.title
+        }
+        semaphore = asyncio.Semaphore(self.concurrency)
+        progress = {entry["slide_id"]: entry for entry in job.job.progress["slides"]}
+        completed = 0
+
+        async def generate(slide: Slide) -> None:
+            nonlocal completed
+            async with semaphore:
+                slide_content = await self.content_service.generate_slide_content(slide, project_context)
+            slide_store.update_slide(
+                slide.id,
+                content=slide_content.generated_content,
+                status="ai_generated"
+            )
+            entry = progress[slide.id]
+            entry["status"] = "generated"
+            entry["missing_fields"] = slide_content.missing_fields
+            completed += 1
+            job.update_progress(completed_slides=completed)
+
+        await asyncio.gather(*(generate(slide) for slide in slides))
+
+    async def _render(self, job: JobContext, project: Project, slides: List[Slide]) -> Dict[str, Any]:
+        """PPT 렌더링 (CPU 작업이므로 렌더링 워커 풀에서 실행) 후 결과 파일 저장"""
+        job.update_progress(stage="rendering")
+        slides = [slide for slide in slides if slide.content]
+        if not slides:
+            raise ValueError("콘텐츠가 생성된 슬라이드가 없습니다")
+
+        # 결과 파일에 바로 저장 (파일 내용을 메모리로 옮기지 않음)
+        artifact = "presentation.pptx"
+        await render_executor.run(
+            render_presentation_to_file, project, slides, job.artifact_path(artifact), block=True
+        )
+
+        return {
+            "project_id": project.id,
+            "filename": PPTGenerationService.build_filename(project),
+            "artifact": artifact,
+            "media_type": PPTX_MEDIA_TYPE,
+        }
@@ -1,14 +1,43 @@
 """
 PPT 생성 서비스 - python-pptx를 사용한 .pptx 파일 생성
 """
+import datetime
+import functools
 import io
-from typing import Dict, Any, List, Optional
+import os
+import types
+import zipfile
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Set, Tuple
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
+from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from pptx.opc.oxml import serialize_part_xml
+from pptx.opc.package import Part, _Relationship
+from pptx.opc.packuri import PackURI
+from pptx.opc.serialized import PackageWriter
+from pptx.parts.slide import SlidePart
+from app.core.config import settings
 from app.db.memory_store import Project, Slide
+from app.infrastructure.render_pool import CompressionPool, SlideRenderPool, compression_pool, slide_render_pool
+from app.infrastructure.zip_package import COMPRESSION_PROFILES, ParallelZipWriter, copy_member_raw
+from app.services.chart_data import add_content_chart
+from app.services.ppt_xml_renderer import XMLTemplateRenderer
+from app.services.presentation_cache import DEFAULT_TEMPLATE, presentation_cache
+from app.services.slide_part_cache import SlidePartCache, slide_cache_key, slide_part_cache
+
+PPTX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+# 렌더러 출력이 바뀌면 올려서 캐시된 슬라이드 XML을 무효화
+SLIDE_RENDER_VERSION = 2
+# PPTGenerationService(slide_cache=...) 기본값 표시 (설정에 따라 전역 캐시 사용)
+DEFAULT_SLIDE_CACHE = object()
+# 저장하면서 렌더링할 때 zip에 쓰기 전에 모아 두는 최대 슬라이드 XML 수
+_SPOOL_BATCH_SLIDES = 32
+# 생성한 .pptx 파일 캐시 (project_version 기준, 같은 바이트 LRU 사용)
+ppt_artifact_cache = SlidePartCache(settings.PPT_ARTIFACT_CACHE_MAX_BYTES)
 
 
 class PPTTemplateRenderer:
@@ -230,18 +259,20 @@ class PPTTemplateRenderer:
         chart_width = Inches(5)
         chart_height = Inches(4)
         
-        chart_placeholder = slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE, chart_left, chart_top, chart_width, chart_height
-        )
-        chart_placeholder.fill.solid()
-        chart_placeholder.fill.fore_color.rgb = self.colors['light']
-        chart_placeholder.line.color.rgb = self.colors['secondary']
-        
-        # 차트 플레이스홀더 텍스트
-        chart_frame = chart_placeholder.text_frame
-        chart_frame.text = f"[{content.get('chart_type', 'Chart')} 차트 영역]\n\n데이터 소스:\n{content.get('data_source', 'USER_NEEDED')}"
-        chart_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-        chart_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
+        # chart_data에 숫자 값이 있으면 네이티브 차트, 없거나 차트를 만들 수 없으면 차트 영역 표시
+        if add_content_chart(slide, content, chart_left, chart_top, chart_width, chart_height) is None:
+            chart_placeholder = slide.shapes.add_shape(
+                MSO_SHAPE.RECTANGLE, chart_left, chart_top, chart_width, chart_height
+            )
+            chart_placeholder.fill.solid()
+            chart_placeholder.fill.fore_color.rgb = self.colors['light']
+            chart_placeholder.line.color.rgb = self.colors['secondary']
+            
+            # 차트 플레이스홀더 텍스트
+            chart_frame = chart_placeholder.text_frame
+            chart_frame.text = f"[{content.get('chart_type', 'Chart')} 차트 영역]\n\n데이터 소스:\n{content.get('data_source', 'USER_NEEDED')}"
+            chart_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
+            chart_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
         
         # 인사이트 영역 (오른쪽)
         insights = content.get('key_insights', [])
@@ -375,41 +406,170 @@ class PPTTemplateRenderer:
 class PPTGenerationService:
     """PPT 생성 메인 서비스"""
     
-    def __init__(self):
+    def __init__(
+        self,
+        engine: Optional[str] = None,
+        slide_cache: Optional[SlidePartCache] = DEFAULT_SLIDE_CACHE,
+        slide_pool: Optional[SlideRenderPool] = None,
+        parallel_min_slides: Optional[int] = None,
+        compression: Optional[str] = None,
+        deflate_pool: Optional[CompressionPool] = None
+    ):
+        # 렌더링 엔진 - xml: XMLTemplateRenderer (같은 결과, 더 빠름), pptx: PPTTemplateRenderer
+        self.engine = engine or settings.PPT_RENDER_ENGINE
+        self.renderer_class = XMLTemplateRenderer if self.engine == "xml" else PPTTemplateRenderer
+        # 렌더링된 슬라이드 캐시 (None이면 매번 렌더링)
+        if slide_cache is DEFAULT_SLIDE_CACHE:
+            slide_cache = slide_part_cache if settings.PPT_SLIDE_CACHE_ENABLED else None
+        self.slide_cache = slide_cache
+        # 큰 덱의 구간 병렬 렌더링 (parallel_min_slides가 0이면 사용 안 함)
+        self.slide_pool = slide_pool or slide_render_pool
+        self.parallel_min_slides = (
+            settings.PPT_PARALLEL_MIN_SLIDES if parallel_min_slides is None else parallel_min_slides
+        )
+        # zip 압축 프로필 (COMPRESSION_PROFILES)
+        self.compression = compression or settings.PPT_COMPRESSION_PROFILE
+        if self.compression not in COMPRESSION_PROFILES:
+            raise ValueError(f"알 수 없는 압축 프로필입니다: {self.compression}")
+        # 항목 압축 스레드 풀 (CompressionPool, workers 0이면 차례로 압축)
+        self.deflate_pool = deflate_pool or compression_pool
         self.template_renderers = {
-            'message_only': PPTTemplateRenderer.render_message_only,
-            'asis_tobe': PPTTemplateRenderer.render_asis_tobe,
-            'case_box': PPTTemplateRenderer.render_case_box,
-            'step_flow': PPTTemplateRenderer.render_step_flow,
-            'chart_insight': PPTTemplateRenderer.render_chart_insight,
-            'node_map': PPTTemplateRenderer.render_node_map
+            'message_only': 'render_message_only',
+            'asis_tobe': 'render_asis_tobe',
+            'case_box': 'render_case_box',
+            'step_flow': 'render_step_flow',
+            'chart_insight': 'render_chart_insight',
+            'node_map': 'render_node_map'
         }
     
-    def generate_ppt(self, project: Project, slides: List[Slide]) -> io.BytesIO:
-        """프로젝트와 슬라이드들로부터 PPT 생성"""
+    def generate_ppt(
+        self, project: Project, slides: List[Slide], base_template: Optional[str] = None
+    ) -> io.BytesIO:
+        """프로젝트와 슬라이드들로부터 PPT 생성 (base_template: presentation_cache에 등록한 템플릿 해시)"""
+        # 메모리 버퍼에 저장
+        ppt_buffer = io.BytesIO()
+        self.save_ppt(project, slides, ppt_buffer, base_template)
+        ppt_buffer.seek(0)
         
-        # 새 프레젠테이션 생성
-        prs = Presentation()
+        return ppt_buffer
+    
+    def save_ppt(
+        self, project: Project, slides: List[Slide], path, base_template: Optional[str] = None
+    ) -> None:
+        """PPT 생성 후 파일(경로 또는 파일 객체)로 저장
+        
+        슬라이드는 렌더링하는 대로 zip에 쓰고 XML 트리를 버리므로(_SlideSpooler) 최대 메모리가 덱 크기와 무관하다.
+        """
+        with ParallelZipWriter(path, self.compression, self.deflate_pool.executor()) as zip_writer:
+            prs = self._render(project, slides, base_template, _SlideSpooler(zip_writer))
+            self._write_package(prs, zip_writer)
+    
+    def patch_ppt(
+        self,
+        previous: bytes,
+        slides: List[Slide],
+        changed_slide_ids: Set[str],
+        path: str,
+        base_template: Optional[str] = None
+    ) -> bool:
+        """이전에 생성한 파일(previous)에서 바뀐 슬라이드의 ppt/slides/slideN.xml만 다시 렌더링해 path에 저장
+        
+        나머지 zip 항목은 압축된 그대로 복사한다. slides는 이전 파일과 같은 구성/순서, 같은 압축 프로필이어야
+        하며 (ExportManifest.changed_slide_ids로 확인), 바뀐 슬라이드가 다른 파트를 참조하면 XML만 교체할 수
+        없으므로 아무것도 쓰지 않고 False를 반환한다 (전체 렌더링 필요).
+        """
+        theme = base_template or DEFAULT_TEMPLATE
+        content_slides = [slide_data for slide_data in sorted(slides, key=lambda x: x.order) if slide_data.content]
+        # 제목 슬라이드가 slide1.xml이므로 콘텐츠 슬라이드는 slide2.xml부터
+        changed = [
+            (f"ppt/slides/slide{index}.xml", slide_data)
+            for index, slide_data in enumerate(content_slides, start=2) if slide_data.id in changed_slide_ids
+        ]
+        
+        if any(self._has_chart_data(slide_data) for _, slide_data in changed):
+            return False
+        cache_keys = [self._slide_cache_key(slide_data, theme) for _, slide_data in changed]
+        blobs = [self.slide_cache.get(key) if key is not None else None for key in cache_keys]
+        missing = [index for index, blob in enumerate(blobs) if blob is None]
+        rendered = _render_slide_range(self.engine, [changed[index][1] for index in missing], base_template)
+        for index, blob in zip(missing, rendered):
+            if blob is None:
+                return False
+            blobs[index] = blob
+            if cache_keys[index] is not None:
+                self.slide_cache.set(cache_keys[index], blob)
+        replacements = {member: blob for (member, _), blob in zip(changed, blobs)}
+        
+        with zipfile.ZipFile(io.BytesIO(previous)) as source:
+            if not replacements.keys() <= set(source.namelist()):
+                return False
+            compress_type, level = COMPRESSION_PROFILES[self.compression]
+            with zipfile.ZipFile(path, "w") as target:
+                for info in source.infolist():
+                    if info.filename in replacements:
+                        target.writestr(info, replacements[info.filename], compress_type, level)
+                    else:
+                        copy_member_raw(source, target, info)
+        return True
+    
+    def _save(self, prs: Presentation, file) -> None:
+        """prs.save와 같은 순서/내용으로 저장하되 압축 프로필을 적용하고 항목 압축은 스레드 풀에서 병렬 실행"""
+        with ParallelZipWriter(file, self.compression, self.deflate_pool.executor()) as zip_writer:
+            self._write_package(prs, zip_writer)
+    
+    @staticmethod
+    def _write_package(prs: Presentation, zip_writer: ParallelZipWriter) -> None:
+        """[Content_Types].xml, 패키지 관계, 파트를 zip에 씀 (_SlideSpooler가 이미 쓴 파트는 건너뜀)"""
+        package = prs.part.package
+        parts = tuple(package.iter_parts())
+        # PackageWriter는 write(PackURI, blob)만 호출
+        phys_writer = types.SimpleNamespace(write=lambda pack_uri, blob: zip_writer.write(pack_uri.membername, blob))
+        package_writer = PackageWriter(None, package._rels, parts)
+        package_writer._write_content_types_stream(phys_writer)
+        package_writer._write_pkg_rels(phys_writer)
+        PackageWriter(
+            None, package._rels, tuple(part for part in parts if not isinstance(part, _SpooledPart))
+        )._write_parts(phys_writer)
+    
+    def _render(
+        self,
+        project: Project,
+        slides: List[Slide],
+        base_template: Optional[str] = None,
+        spooler: Optional["_SlideSpooler"] = None
+    ) -> Presentation:
+        """저장 전 단계까지 렌더링 (spooler가 있으면 제목/콘텐츠 슬라이드는 추가하는 대로 zip에 씀)"""
+        
+        # 캐시된 기본 프레젠테이션의 사본으로 시작 (템플릿 패키지를 매번 파싱하지 않음)
+        prs = presentation_cache.copy(base_template)
         
         # 제목 슬라이드 추가
         self._add_title_slide(prs, project)
+        if spooler is not None:
+            spooler.spool_last(prs)
         
         # 각 슬라이드 추가
-        renderer = PPTTemplateRenderer(prs)
+        renderer = self.renderer_class(prs)
         
-        for slide_data in sorted(slides, key=lambda x: x.order):
-            if slide_data.content:  # 콘텐츠가 있는 슬라이드만 추가
-                self._add_content_slide(prs, slide_data, renderer)
+        theme = base_template or DEFAULT_TEMPLATE
+        # 콘텐츠가 있는 슬라이드만 추가
+        content_slides = [slide_data for slide_data in sorted(slides, key=lambda x: x.order) if slide_data.content]
+        if self._use_parallel(len(content_slides), base_template):
+            self._add_content_slides_parallel(prs, content_slides, renderer, theme, spooler)
+        else:
+            for slide_data in content_slides:
+                self._add_content_slide(prs, slide_data, renderer, theme, spooler)
         
         # 마무리 슬라이드 추가
         self._add_closing_slide(prs, project)
         
-        # 메모리 버퍼에 저장
-        ppt_buffer = io.BytesIO()
-        prs.save(ppt_buffer)
-        ppt_buffer.seek(0)
-        
-        return ppt_buffer
+        return prs
+    
+    @staticmethod
+    def build_filename(project: Project) -> str:
+        """다운로드 파일명 (프로젝트 제목 + 생성 시각)"""
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        return f"{project.title}_{timestamp}.pptx"
     
     def _add_title_slide(self, prs: Presentation, project: Project):
         """제목 슬라이드 추가"""
@@ -435,24 +595,154 @@ class PPTGenerationService:
         subtitle.text = subtitle_text
         subtitle.text_frame.paragraphs[0].font.size = Pt(18)
     
-    def _add_content_slide(self, prs: Presentation, slide_data: Slide, renderer: PPTTemplateRenderer):
-        """콘텐츠 슬라이드 추가"""
+    def _add_content_slide(
+        self, prs: Presentation, slide_data: Slide, renderer, theme: str = DEFAULT_TEMPLATE,
+        spooler: Optional["_SlideSpooler"] = None
+    ):
+        """콘텐츠 슬라이드 추가 (렌더링 입력이 같은 슬라이드는 캐시된 XML 재사용)"""
         # 콘텐츠 슬라이드 레이아웃 사용
-        slide_layout = prs.slide_layouts[6]  # 빈 레이아웃
-        slide = prs.slides.add_slide(slide_layout)
+        slide_layout = prs.slide_layouts[5]  # 제목만 있는 레이아웃 (렌더러가 제목 placeholder 사용)
+        
+        cache_key = self._slide_cache_key(slide_data, theme)
+        if cache_key is not None:
+            blob = self.slide_cache.get(cache_key)
+            if blob is not None:
+                self._add_slide_xmls(prs, slide_layout, [blob], spooler)
+                return
         
         # 템플릿별 렌더링
+        slide = prs.slides.add_slide(slide_layout)
+        render_method, render_source = self._resolve_render(slide_data)
+        getattr(renderer, render_method)(slide, render_source)
+        
+        if cache_key is not None:
+            blob = self._portable_slide_xml(slide)
+            if blob is not None:
+                self.slide_cache.set(cache_key, blob)
+        if spooler is not None:
+            spooler.spool_last(prs)
+    
+    def _add_content_slides_parallel(
+        self, prs: Presentation, slides: List[Slide], renderer, theme: str, spooler: Optional["_SlideSpooler"] = None
+    ):
+        """콘텐츠 슬라이드를 구간별로 프로세스 풀에서 렌더링한 뒤 순서대로 슬라이드 파트로 조립
+        
+        워커는 슬라이드 XML만 돌려주고, 슬라이드 ID/rId/[Content_Types].xml은 여기서 파트를 추가할 때
+        python-pptx 패키지가 정한다. 워커가 XML로 돌려줄 수 없는 슬라이드(다른 파트 참조)는 여기서 렌더링한다.
+        구간 결과는 앞 구간부터 받는 대로 조립하므로 덱 전체의 XML을 한꺼번에 들고 있지 않는다.
+        """
+        slide_layout = prs.slide_layouts[5]
+        cache_keys = [self._slide_cache_key(slide_data, theme) for slide_data in slides]
+        blobs = [self.slide_cache.get(key) if key is not None else None for key in cache_keys]
+        
+        # 차트 슬라이드는 차트 파트를 참조해 워커에서 XML로 돌려받을 수 없으므로 처음부터 여기서 렌더링
+        missing = [
+            index for index, blob in enumerate(blobs) if blob is None and not self._has_chart_data(slides[index])
+        ]
+        chunk_size = max(1, -(-len(missing) // (self.slide_pool.workers * 2)))
+        chunk_size = min(chunk_size, settings.PPT_PARALLEL_CHUNK_SLIDES)
+        chunks = [missing[i:i + chunk_size] for i in range(0, len(missing), chunk_size)]
+        # 구간 순서대로 결과를 내는 반복자 - 조립할 슬라이드의 구간까지만 받음
+        results = zip(chunks, self.slide_pool.map(
+            functools.partial(_render_slide_range, self.engine),
+            [[slides[index] for index in chunk] for chunk in chunks]
+        ))
+        awaiting = set(missing)
+        rendered: Dict[int, Optional[bytes]] = {}
+        
+        pending = []
+        for index, slide_data in enumerate(slides):
+            blob = blobs[index]
+            if index in awaiting:
+                while index not in rendered:
+                    chunk, chunk_blobs = next(results)
+                    for chunk_index, chunk_blob in zip(chunk, chunk_blobs):
+                        rendered[chunk_index] = chunk_blob
+                        if cache_keys[chunk_index] is not None and chunk_blob is not None:
+                            self.slide_cache.set(cache_keys[chunk_index], chunk_blob)
+                blob = rendered.pop(index)
+            if blob is not None:
+                pending.append(blob)
+                # zip에 바로 쓰는 경우 모아 두는 XML 양을 제한
+                if spooler is not None and len(pending) >= _SPOOL_BATCH_SLIDES:
+                    self._add_slide_xmls(prs, slide_layout, pending, spooler)
+                    pending = []
+                continue
+            self._add_slide_xmls(prs, slide_layout, pending, spooler)
+            pending = []
+            self._add_content_slide(prs, slide_data, renderer, theme, spooler)
+        self._add_slide_xmls(prs, slide_layout, pending, spooler)
+    
+    def _use_parallel(self, slide_count: int, base_template: Optional[str]) -> bool:
+        """구간 병렬 렌더링 여부 - 기본 템플릿이고 슬라이드가 parallel_min_slides 이상일 때"""
+        # 사용자 템플릿은 프로세스별로 등록되므로 워커에서 쓸 수 없음
+        return bool(self.parallel_min_slides) and slide_count >= self.parallel_min_slides and base_template is None
+    
+    def _resolve_render(self, slide_data: Slide):
+        """(렌더러 메서드 이름, 렌더링 입력)"""
         render_method = self.template_renderers.get(slide_data.template_type)
         if render_method:
             content_payload = slide_data.content.get("ppt_payload") if isinstance(slide_data.content, dict) else None
-            render_source = content_payload or slide_data.content
-            render_method(renderer, slide, render_source)
-        else:
-            # 기본 렌더링
-            renderer.render_message_only(slide, {
-                'main_message': slide_data.head_message,
-                'supporting_points': ['콘텐츠를 확인해주세요']
-            })
+            return render_method, content_payload or slide_data.content
+        # 기본 렌더링
+        return 'render_message_only', {
+            'main_message': slide_data.head_message,
+            'supporting_points': ['콘텐츠를 확인해주세요']
+        }
+    
+    def _has_chart_data(self, slide_data: Slide) -> bool:
+        """네이티브 차트로 렌더링할 데이터가 있는 chart_insight 슬라이드인지"""
+        render_method, render_source = self._resolve_render(slide_data)
+        return render_method == 'render_chart_insight' and bool(
+            render_source.get('chart_data') or render_source.get('sample_data_structure')
+        )
+    
+    def _slide_cache_key(self, slide_data: Slide, theme: str) -> Optional[str]:
+        # 차트 슬라이드는 XML만 캐시할 수 없으므로 (큰 chart_data를 해시하지 않도록) 키도 만들지 않음
+        if self.slide_cache is None or self._has_chart_data(slide_data):
+            return None
+        render_method, render_source = self._resolve_render(slide_data)
+        return slide_cache_key(
+            version=SLIDE_RENDER_VERSION, engine=self.engine, theme=theme,
+            render_method=render_method, content=render_source
+        )
+    
+    @staticmethod
+    def _portable_slide_xml(slide) -> Optional[bytes]:
+        """다른 프레젠테이션에 그대로 붙일 수 있는 슬라이드 XML
+        
+        레이아웃 외에 다른 파트(이미지, 차트 등)를 참조하는 슬라이드는 XML만으로 옮길 수 없으므로 None.
+        """
+        if len(slide.part.rels) != 1:
+            return None
+        return serialize_part_xml(slide.part._element)
+    
+    @staticmethod
+    def _add_slide_xmls(prs: Presentation, slide_layout, blobs: List[bytes], spooler: Optional["_SlideSpooler"] = None):
+        """렌더링된 슬라이드 XML들로 슬라이드 파트 추가 (Slides.add_slide와 같은 파트 이름/rId/슬라이드 ID)
+        
+        새 파트이므로 기존 관계를 찾지 않고 rId와 슬라이드 ID를 차례로 매긴다 (add_slide는 슬라이드마다
+        전체 관계와 ID를 훑어 덱 크기의 제곱에 비례). spooler가 있으면 XML을 파싱하지 않고 바로 zip에 쓴다.
+        """
+        if not blobs:
+            return
+        presentation_part = prs.part
+        sldIdLst = prs.slides._sldIdLst
+        next_id = sldIdLst._next_id
+        number = len(sldIdLst) + 1
+        for blob in blobs:
+            partname = PackURI(f"/ppt/slides/slide{number}.xml")
+            if spooler is None:
+                slide_part = SlidePart.load(partname, CT.PML_SLIDE, presentation_part.package, blob)
+                slide_part.relate_to(slide_layout.part, RT.SLIDE_LAYOUT)
+            else:
+                slide_part = _SpooledPart(partname, CT.PML_SLIDE, presentation_part.package)
+                slide_part.relate_to(slide_layout.part, RT.SLIDE_LAYOUT)
+                spooler.write(slide_part, blob)
+            rId = presentation_part.rels._add_relationship(RT.SLIDE, slide_part)
+            sldIdLst._add_sldId(id=next_id, rId=rId)
+            next_id += 1
+            number += 1
     
     def _add_closing_slide(self, prs: Presentation, project: Project):
         """마무리 슬라이드 추가"""
@@ -479,4 +769,160 @@ class PPTGenerationService:
         info_frame = info_textbox.text_frame
         info_frame.text = f"Generated by PPT Pro • {project.title}"
         info_frame.paragraphs[0].font.size = Pt(14)
-        info_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
\ No newline at end of file
+        info_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
+
+
+class _SpooledPart(Part):
+    """이미 zip에 쓴 파트 - [Content_Types].xml과 관계 목록을 만들 때 필요한 이름/형식/관계만 남김
+    
+    내용이 없으므로 prs.save 등 python-pptx 저장 경로로 쓰면 빈 파트가 되는 대신 오류를 낸다
+    (_write_package만 이 파트를 건너뛰고 저장할 수 있음).
+    """
+    
+    @property
+    def blob(self) -> bytes:
+        raise RuntimeError(f"이미 zip에 쓴 파트입니다: {self.partname}")
+
+
+class _SlideSpooler:
+    """추가한 슬라이드를 바로 zip에 쓰고 패키지에는 내용 없는 _SpooledPart만 남김
+    
+    슬라이드 XML 트리(슬라이드당 수십 KB)를 저장할 때까지 들고 있지 않으므로, 덱 크기에 비례해 남는 것은
+    슬라이드 목록/관계/zip 디렉터리 항목(슬라이드당 수 KB)뿐이다.
+    슬라이드가 참조하는 차트와 내장 워크북도 함께 쓰고, 레이아웃/이미지처럼 공유하는 파트는 마지막에 한 번 쓴다.
+    """
+    
+    OWNED_RELTYPES = (RT.CHART, RT.PACKAGE)
+    
+    def __init__(self, zip_writer: ParallelZipWriter):
+        self.zip_writer = zip_writer
+    
+    def spool_last(self, prs: Presentation) -> None:
+        """마지막에 추가한 슬라이드를 zip에 쓰고 빈 파트로 교체"""
+        rels = prs.part.rels
+        rel = rels[prs.slides._sldIdLst[-1].rId]
+        # target_part는 lazyproperty라 관계 객체째 바꿈
+        rels._rels[rel.rId] = _Relationship(
+            prs.part.partname.baseURI, rel.rId, rel.reltype, rel._target_mode, self._spool(rel.target_part)
+        )
+    
+    def write(self, part: Part, blob: bytes) -> None:
+        self.zip_writer.write(part.partname.membername, blob)
+        if part._rels:
+            self.zip_writer.write(part.partname.rels_uri.membername, part.rels.xml)
+    
+    def _spool(self, part: Part) -> _SpooledPart:
+        spooled = _SpooledPart(part.partname, part.content_type, part.package)
+        for rel in part.rels.values():
+            target = rel.target_ref if rel.is_external else rel.target_part
+            if not rel.is_external and rel.reltype in self.OWNED_RELTYPES:
+                target = self._spool(target)
+            spooled.rels._rels[rel.rId] = _Relationship(
+                part.partname.baseURI, rel.rId, rel.reltype, rel._target_mode, target
+            )
+        self.write(part, part.blob)
+        return spooled
+
+
+def _render_slide_range(
+    engine: str, slides: List[Slide], base_template: Optional[str] = None
+) -> List[Optional[bytes]]:
+    """슬라이드 구간 렌더링 - 프로세스 풀 워커에서 실행, 슬라이드별 XML(옮길 수 없으면 None) 반환"""
+    service = PPTGenerationService(engine=engine, slide_cache=None)
+    prs = presentation_cache.copy(base_template)
+    renderer = service.renderer_class(prs)
+    slide_layout = prs.slide_layouts[5]
+    blobs = []
+    for slide_data in slides:
+        slide = prs.slides.add_slide(slide_layout)
+        render_method, render_source = service._resolve_render(slide_data)
+        getattr(renderer, render_method)(slide, render_source)
+        blobs.append(service._portable_slide_xml(slide))
+        # 렌더링한 슬라이드는 바로 떼어내 워커의 프레젠테이션이 커지지 않게 함 (add_slide 비용이 슬라이드 수에 비례)
+        sldId = prs.slides._sldIdLst[-1]
+        prs.part.rels.pop(sldId.rId)
+        prs.slides._sldIdLst.remove(sldId)
+    return blobs
+
+
+def slide_version(slide: Slide) -> str:
+    """슬라이드 렌더링 결과에 영향을 주는 필드의 해시"""
+    return slide_cache_key(
+        id=slide.id, order=slide.order, template_type=slide.template_type,
+        head_message=slide.head_message, content=slide.content, updated_at=slide.updated_at
+    )
+
+
+def project_version(project: Project, slides: List[Slide], compression: Optional[str] = None) -> str:
+    """내보낼 프로젝트 상태의 해시 - 프로젝트 정보, 슬라이드 구성/내용, 렌더러 버전, 압축 프로필이 같으면 같은 값"""
+    return slide_cache_key(
+        version=SLIDE_RENDER_VERSION,
+        engine=settings.PPT_RENDER_ENGINE,
+        compression=compression or settings.PPT_COMPRESSION_PROFILE,
+        project=_project_key(project),
+        slides=[slide_version(slide) for slide in sorted(slides, key=lambda x: x.order)]
+    )
+
+
+def _project_key(project: Project) -> str:
+    """제목/마무리 슬라이드에 들어가는 프로젝트 정보의 해시"""
+    return slide_cache_key(
+        id=project.id, title=project.title, topic=project.topic,
+        target_audience=project.target_audience, goal=project.goal, updated_at=project.updated_at
+    )
+
+
+@dataclass
+class ExportManifest:
+    """생성한 파일의 구성 - 다음 내보내기에서 바뀐 슬라이드만 교체할 수 있는지 판단하는 데 사용"""
+    etag: str
+    project_key: str
+    renderer: str  # 렌더러 버전/엔진/압축 프로필 (바뀌면 모든 슬라이드를 다시 렌더링)
+    slide_versions: List[Tuple[str, str]]  # 콘텐츠 슬라이드 순서대로 (slide_id, slide_version)
+
+    @classmethod
+    def build(
+        cls, etag: str, project: Project, slides: List[Slide], compression: Optional[str] = None
+    ) -> "ExportManifest":
+        compression = compression or settings.PPT_COMPRESSION_PROFILE
+        return cls(
+            etag=etag,
+            project_key=_project_key(project),
+            renderer=f"{SLIDE_RENDER_VERSION}:{settings.PPT_RENDER_ENGINE}:{compression}",
+            slide_versions=[
+                (slide.id, slide_version(slide))
+                for slide in sorted(slides, key=lambda x: x.order) if slide.content
+            ]
+        )
+
+    def changed_slide_ids(self, current: "ExportManifest") -> Optional[Set[str]]:
+        """이 파일에서 current 상태로 가려면 다시 렌더링할 슬라이드 ID
+        
+        프로젝트 정보, 렌더러, 슬라이드 구성/순서가 달라 슬라이드 XML 교체만으로 안 되면 None.
+        """
+        if (self.project_key, self.renderer) != (current.project_key, current.renderer):
+            return None
+        if [slide_id for slide_id, _ in self.slide_versions] != [slide_id for slide_id, _ in current.slide_versions]:
+            return None
+        return {
+            slide_id
+            for (slide_id, version), (_, current_version) in zip(self.slide_versions, current.slide_versions)
+            if version != current_version
+        }
+
+
+def render_patch_to_file(
+    previous: bytes, slides: List[Slide], changed_slide_ids: Set[str], path: str, compression: Optional[str] = None
+) -> Optional[int]:
+    """이전 파일에서 바뀐 슬라이드만 교체해 path에 저장하고 파일 크기 반환 (교체할 수 없으면 None)"""
+    if not PPTGenerationService(compression=compression).patch_ppt(previous, slides, changed_slide_ids, path):
+        return None
+    return os.path.getsize(path)
+
+
+def render_presentation_to_file(
+    project: Project, slides: List[Slide], path: str, compression: Optional[str] = None
+) -> int:
+    """PPT 파일을 path에 바로 저장하고 파일 크기 반환 - 렌더링 실행기(프로세스 풀 포함)에서 호출하는 진입점"""
+    PPTGenerationService(compression=compression).save_ppt(project, slides, path)
+    return os.path.getsize(path)
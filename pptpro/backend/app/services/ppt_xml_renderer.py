@@ -0,0 +1,346 @@
+"""
+XML 직접 렌더러 - 미리 만든 XML 조각에 값을 채워 슬라이드 도형을 한 번에 생성
+
+PPTTemplateRenderer와 같은 XML을 만들되, 문단/글꼴/색상을 python-pptx 프록시로 하나씩 설정하지 않고
+슬라이드마다 XML 문자열을 한 번만 파싱한다. 결과 비교와 속도 측정은 benchmarks/ppt_render.py.
+"""
+import re
+from typing import Any, Dict, List, Optional
+from xml.sax.saxutils import escape
+
+from pptx import Presentation
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from pptx.util import Inches, Pt
+
+from app.services.chart_data import add_content_chart
+
+# PPTTemplateRenderer.colors와 같은 팔레트 (srgbClr 값)
+COLORS = {
+    'primary': "007BFF",
+    'secondary': "6C757D",
+    'success': "28A745",
+    'warning': "FFC107",
+    'danger': "DC3545",
+    'dark': "343A40",
+    'light': "F8F9FA",
+}
+WHITE = "FFFFFF"
+
+_CONTROL_CHARS = re.compile(r"([\x00-\x08\x0B-\x1F])")
+_LINE_BREAKS = re.compile("\n|\v")
+
+_TEXTBOX = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="%d" name="TextBox %d"/><p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="%d" y="%d"/><a:ext cx="%d" cy="%d"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+    '<p:txBody><a:bodyPr wrap="none"><a:spAutoFit/></a:bodyPr><a:lstStyle/>%s</p:txBody></p:sp>'
+)
+_AUTOSHAPE = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="%d" name="%s %d"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="%d" y="%d"/><a:ext cx="%d" cy="%d"/></a:xfrm>'
+    '<a:prstGeom prst="%s"><a:avLst/></a:prstGeom>%s</p:spPr>'
+    '<p:style><a:lnRef idx="1"><a:schemeClr val="accent1"/></a:lnRef>'
+    '<a:fillRef idx="3"><a:schemeClr val="accent1"/></a:fillRef>'
+    '<a:effectRef idx="2"><a:schemeClr val="accent1"/></a:effectRef>'
+    '<a:fontRef idx="minor"><a:schemeClr val="lt1"/></a:fontRef></p:style>'
+    '<p:txBody><a:bodyPr rtlCol="0" anchor="ctr"/><a:lstStyle/>%s</p:txBody></p:sp>'
+)
+# MSO_SHAPE 이름과 prst 값
+_RECTANGLE = ("Rectangle", "rect")
+_OVAL = ("Oval", "ellipse")
+_RIGHT_ARROW = ("Right Arrow", "rightArrow")
+# 도형 기본 문단 (python-pptx add_shape의 초기 문단)
+_DEFAULT_ALIGN = "ctr"
+
+
+def _solid_fill(color: str) -> str:
+    return f'<a:solidFill><a:srgbClr val="{color}"/></a:solidFill>'
+
+
+def _runs(text: str) -> str:
+    """_Paragraph.text와 같은 규칙 - 줄바꿈(\\n, \\v)은 a:br, 빈 run은 생략, 제어 문자는 _xHHHH_"""
+    parts = []
+    for index, run_text in enumerate(_LINE_BREAKS.split(text)):
+        if index > 0:
+            parts.append("<a:br/>")
+        if run_text:
+            run_text = _CONTROL_CHARS.sub(lambda match: "_x%04X_" % ord(match.group(1)), run_text)
+            parts.append(f"<a:r><a:t>{escape(run_text)}</a:t></a:r>")
+    return "".join(parts)
+
+
+def _paragraph(
+    text: str,
+    size: Optional[int] = None,
+    bold: bool = False,
+    color: Optional[str] = None,
+    align: Optional[str] = None,
+    space_after: Optional[int] = None,
+) -> str:
+    """a:p 조각 (size, space_after는 pt 단위)"""
+    children = ""
+    if space_after is not None:
+        children += f'<a:spcAft><a:spcPts val="{space_after * 100}"/></a:spcAft>'
+    if size is not None or bold or color is not None:
+        attrs = (f' sz="{size * 100}"' if size is not None else "") + (' b="1"' if bold else "")
+        fill = _solid_fill(color) if color is not None else ""
+        children += f"<a:defRPr{attrs}>{fill}</a:defRPr>" if fill else f"<a:defRPr{attrs}/>"
+    align_attr = f' algn="{align}"' if align else ""
+    if children:
+        properties = f"<a:pPr{align_attr}>{children}</a:pPr>"
+    else:
+        properties = f"<a:pPr{align_attr}/>" if align_attr else ""
+    runs = _runs(text)
+    return f"<a:p>{properties}{runs}</a:p>" if properties or runs else "<a:p/>"
+
+
+def _frame_text(text: str, **first_paragraph: Any) -> str:
+    """TextFrame.text와 같은 규칙 - \\n마다 새 문단, 서식은 첫 문단에만"""
+    lines = text.split("\n")
+    return _paragraph(lines[0], **first_paragraph) + "".join(_paragraph(line) for line in lines[1:])
+
+
+class _SlideShapes:
+    """한 슬라이드에 추가할 도형 XML을 모았다가 한 번에 파싱해 붙임"""
+
+    def __init__(self, slide):
+        self.slide = slide
+        self.sp_tree = slide.shapes._spTree
+        self.next_id = self.sp_tree.max_shape_id + 1
+        self.title_paragraphs: Optional[str] = None
+        self.shapes: List[str] = []
+
+    def set_title(self, paragraphs: str) -> None:
+        self.title_paragraphs = paragraphs
+
+    def add_textbox(self, left: int, top: int, width: int, height: int, paragraphs: str) -> None:
+        shape_id = self._take_id()
+        self.shapes.append(_TEXTBOX % (shape_id, shape_id - 1, left, top, width, height, paragraphs))
+
+    def add_shape(
+        self,
+        shape_type: tuple,
+        left: int,
+        top: int,
+        width: int,
+        height: int,
+        paragraphs: str,
+        fill: Optional[str] = None,
+        line: Optional[str] = None,
+        line_width: Optional[int] = None,
+    ) -> None:
+        shape_id = self._take_id()
+        name, prst = shape_type
+        properties = _solid_fill(fill) if fill is not None else ""
+        if line is not None:
+            width_attr = f' w="{line_width}"' if line_width is not None else ""
+            properties += f"<a:ln{width_attr}>{_solid_fill(line)}</a:ln>"
+        self.shapes.append(
+            _AUTOSHAPE % (shape_id, name, shape_id - 1, left, top, width, height, prst, properties, paragraphs)
+        )
+
+    def commit(self) -> None:
+        fragment = parse_xml(
+            f'<p:txBody {nsdecls("a", "p", "r")}>{self.title_paragraphs or ""}'
+            f'<p:spTree>{"".join(self.shapes)}</p:spTree></p:txBody>'
+        )
+        if self.title_paragraphs is not None:
+            title_body = self.slide.shapes.title._element.txBody
+            for p in title_body.findall(qn("a:p")):
+                title_body.remove(p)
+            for p in fragment.findall(qn("a:p")):
+                title_body.append(p)
+        for sp in fragment.find(qn("p:spTree")):
+            self.sp_tree.insert_element_before(sp, "p:extLst")
+
+    def _take_id(self) -> int:
+        shape_id = self.next_id
+        self.next_id += 1
+        return shape_id
+
+
+class XMLTemplateRenderer:
+    """PPTTemplateRenderer와 같은 메서드와 결과를 가진 XML 직접 렌더러"""
+
+    def __init__(self, presentation: Presentation):
+        self.prs = presentation
+        self.colors = COLORS
+
+    def render_message_only(self, slide, content: Dict[str, Any]):
+        """메시지 중심 템플릿"""
+        shapes = _SlideShapes(slide)
+        shapes.set_title(_frame_text(
+            content.get('main_message', ''), size=36, color=self.colors['dark'], align="ctr"
+        ))
+
+        supporting_points = content.get('supporting_points', [])
+        if supporting_points:
+            paragraphs = "".join(
+                _paragraph(f"• {point}", size=20, color=self.colors['secondary'], space_after=12)
+                for point in supporting_points
+            )
+            shapes.add_textbox(Inches(1), Inches(2.5), Inches(8), Inches(4), paragraphs)
+
+        cta = content.get('call_to_action', '')
+        if cta:
+            shapes.add_textbox(Inches(1), Inches(7), Inches(8), Inches(1), _frame_text(
+                cta, size=18, bold=True, color=self.colors['primary'], align="ctr"
+            ))
+        shapes.commit()
+
+    def render_asis_tobe(self, slide, content: Dict[str, Any]):
+        """As-Is To-Be 템플릿"""
+        shapes = _SlideShapes(slide)
+        shapes.set_title(_frame_text("As-Is vs To-Be", size=32))
+
+        self._add_two_column_content(
+            shapes,
+            content.get('as_is_title', 'As-Is'), content.get('as_is_points', []),
+            content.get('to_be_title', 'To-Be'), content.get('to_be_points', []),
+            left_color=self.colors['danger'],
+            right_color=self.colors['success']
+        )
+
+        transition = content.get('transition_method', '')
+        if transition:
+            shapes.add_textbox(Inches(3), Inches(6.5), Inches(4), Inches(1), _frame_text(
+                f"→ {transition}", size=16, color=self.colors['primary'], align="ctr"
+            ))
+        shapes.commit()
+
+    def render_case_box(self, slide, content: Dict[str, Any]):
+        """케이스 박스 템플릿"""
+        shapes = _SlideShapes(slide)
+        shapes.set_title(_frame_text("Cases & Options"))
+
+        cases = content.get('cases', [])
+        if cases:
+            cols = 2 if len(cases) > 2 else len(cases)
+            box_width = Inches(4)
+            box_height = Inches(2.5)
+
+            for i, case in enumerate(cases[:4]):  # 최대 4개까지
+                left = Inches(0.5) + (i % cols) * (box_width + Inches(0.5))
+                top = Inches(2) + (i // cols) * (box_height + Inches(0.3))
+                paragraphs = (
+                    _paragraph(case.get('title', f'Case {i+1}'), size=16, bold=True,
+                               color=self.colors['dark'], align=_DEFAULT_ALIGN)
+                    + _paragraph(case.get('description', ''), size=12, color=self.colors['secondary'])
+                )
+                shapes.add_shape(
+                    _RECTANGLE, left, top, box_width, box_height, paragraphs,
+                    fill=self.colors['light'], line=self.colors['primary'], line_width=Pt(2)
+                )
+        shapes.commit()
+
+    def render_step_flow(self, slide, content: Dict[str, Any]):
+        """단계별 플로우 템플릿"""
+        shapes = _SlideShapes(slide)
+        shapes.set_title(_frame_text("Implementation Steps"))
+
+        steps = content.get('steps', [])
+        if steps:
+            step_width = Inches(1.5)
+            step_height = Inches(1.2)
+            arrow_width = Inches(0.8)
+
+            total_width = len(steps) * step_width + (len(steps) - 1) * arrow_width
+            start_left = (Inches(10) - total_width) / 2
+            top = Inches(3)
+
+            for i, step in enumerate(steps):
+                left = start_left + i * (step_width + arrow_width)
+
+                shapes.add_shape(
+                    _OVAL, left, top, step_width, step_height,
+                    _paragraph(str(step.get('order', i + 1)), size=24, bold=True, color=WHITE, align="ctr"),
+                    fill=self.colors['primary'], line=self.colors['dark']
+                )
+                shapes.add_textbox(
+                    left - Inches(0.5), top + step_height + Inches(0.2), step_width + Inches(1), Inches(0.8),
+                    _frame_text(step.get('title', f'Step {i+1}'), size=12, align="ctr")
+                )
+
+                # 화살표 (마지막 단계 제외)
+                if i < len(steps) - 1:
+                    shapes.add_shape(
+                        _RIGHT_ARROW, left + step_width, top + step_height / 2, arrow_width, Inches(0.4),
+                        _paragraph("", align=_DEFAULT_ALIGN),
+                        fill=self.colors['secondary']
+                    )
+        shapes.commit()
+
+    def render_chart_insight(self, slide, content: Dict[str, Any]):
+        """차트 & 인사이트 템플릿"""
+        shapes = _SlideShapes(slide)
+        shapes.set_title(_frame_text(content.get('chart_title', 'Data Insights')))
+
+        # 차트 파트는 python-pptx로 추가 (도형 순서를 맞추려고 앞의 도형을 먼저 붙임)
+        shapes.commit()
+        chart = add_content_chart(slide, content, Inches(0.5), Inches(2), Inches(5), Inches(4))
+        shapes = _SlideShapes(slide)
+        if chart is None:
+            chart_text = (
+                f"[{content.get('chart_type', 'Chart')} 차트 영역]\n\n데이터 소스:\n"
+                f"{content.get('data_source', 'USER_NEEDED')}"
+            )
+            shapes.add_shape(
+                _RECTANGLE, Inches(0.5), Inches(2), Inches(5), Inches(4),
+                _frame_text(chart_text, align="ctr"),
+                fill=self.colors['light'], line=self.colors['secondary']
+            )
+
+        insights = content.get('key_insights', [])
+        if insights:
+            paragraphs = _paragraph("📈 Key Insights", size=18, bold=True, color=self.colors['primary']) + "".join(
+                _paragraph(f"• {insight}", size=14, color=self.colors['dark'], space_after=8)
+                for insight in insights
+            )
+            shapes.add_textbox(Inches(6), Inches(2), Inches(4), Inches(4), paragraphs)
+        shapes.commit()
+
+    def render_node_map(self, slide, content: Dict[str, Any]):
+        """노드 맵 템플릿"""
+        shapes = _SlideShapes(slide)
+        shapes.set_title(_frame_text(content.get('central_concept', 'Concept Map')))
+
+        center_left = Inches(4)
+        center_top = Inches(3.5)
+        center_width = Inches(2)
+        center_height = Inches(1)
+
+        shapes.add_shape(
+            _OVAL, center_left, center_top, center_width, center_height,
+            _frame_text(content.get('central_concept', 'Central'), size=14, color=WHITE, align="ctr"),
+            fill=self.colors['primary'], line=self.colors['dark']
+        )
+
+        primary_nodes = content.get('primary_nodes', [])
+        if primary_nodes:
+            angles = [0, 60, 120, 180, 240, 300]  # 6개 노드까지 지원
+            radius = Inches(2)
+
+            for i, node_text in enumerate(primary_nodes[:6]):
+                angle = angles[i] * 3.14159 / 180  # 라디안 변환
+
+                node_left = center_left + center_width/2 + radius * 1.2 * (1 if angle < 3.14159/2 or angle > 3*3.14159/2 else -1) - Inches(0.75)
+                node_top = center_top + center_height/2 + radius * 0.8 * (1 if angle > 0 and angle < 3.14159 else -1) - Inches(0.4)
+
+                shapes.add_shape(
+                    _RECTANGLE, node_left, node_top, Inches(1.5), Inches(0.8),
+                    _frame_text(node_text, size=10, color=WHITE, align="ctr"),
+                    fill=self.colors['success'], line=self.colors['dark']
+                )
+        shapes.commit()
+
+    def _add_two_column_content(self, shapes: _SlideShapes, left_title, left_points, right_title, right_points, left_color, right_color):
+        """두 컬럼 콘텐츠 추가"""
+        for left, title, points, color in (
+            (Inches(0.5), left_title, left_points, left_color),
+            (Inches(5.5), right_title, right_points, right_color),
+        ):
+            paragraphs = _paragraph(title, size=20, bold=True, color=color) + "".join(
+                _paragraph(f"• {point}", size=14, color=self.colors['secondary']) for point in points
+            )
+            shapes.add_textbox(left, Inches(2), Inches(4), Inches(4), paragraphs)
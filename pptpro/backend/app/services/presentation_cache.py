@@ -0,0 +1,89 @@
+"""
+기본 프레젠테이션 캐시 - 템플릿 패키지(.pptx)를 프로세스당 한 번만 파싱하고 내보내기마다 가벼운 사본 제공
+"""
+import copy
+import hashlib
+import io
+import threading
+from typing import Dict, Optional, Set
+
+from pptx import Presentation
+from pptx.opc.package import Part, XmlPart, _Relationship, _Relationships
+from pptx.package import Package
+from pptx.parts.slide import SlideLayoutPart, SlideMasterPart
+
+DEFAULT_TEMPLATE = "default"
+
+
+class PresentationCache:
+    """파싱된 기본 프레젠테이션 보관소
+
+    copy()는 프레젠테이션 파트, 슬라이드 등 내보내기 중 바뀌는 파트만 XML 요소를 복사해 새 파트로 만들고,
+    렌더링 중 수정하지 않는 슬라이드 마스터/레이아웃과 바이너리 파트(테마, 이미지 등)는 원본을 공유한다.
+    원본 파트에 붙은 python-pptx 프록시와 lazyproperty 캐시(원본의 slides 등)는 사본으로 넘어가지 않는다.
+    사용자 템플릿은 내용 해시로 등록하며, 등록은 프로세스별이다 (프로세스 풀 워커는 각자 등록해야 함).
+    """
+
+    def __init__(self):
+        self._templates: Dict[str, Presentation] = {}
+        self._shared_parts: Dict[str, Set[Part]] = {}
+        self._lock = threading.Lock()
+
+    def register(self, data: bytes) -> str:
+        """사용자 템플릿(.pptx) 등록 후 내용 해시 반환 (이미 등록된 내용이면 다시 파싱하지 않음)"""
+        template_hash = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            if template_hash not in self._templates:
+                self._store(template_hash, Presentation(io.BytesIO(data)))
+        return template_hash
+
+    def copy(self, template_hash: Optional[str] = None) -> Presentation:
+        """내보내기용 독립 사본 (template_hash가 없으면 python-pptx 기본 템플릿)"""
+        key = template_hash or DEFAULT_TEMPLATE
+        with self._lock:
+            if key not in self._templates:
+                if template_hash:
+                    raise ValueError(f"등록되지 않은 템플릿입니다: {template_hash}")
+                self._store(DEFAULT_TEMPLATE, Presentation())
+            base = self._templates[key]
+            shared_parts = self._shared_parts[key]
+        return _rebuild(base.part.package, shared_parts)
+
+    def stats(self) -> Dict[str, int]:
+        return {"templates": len(self._templates)}
+
+    def _store(self, key: str, presentation: Presentation) -> None:
+        self._templates[key] = presentation
+        self._shared_parts[key] = {
+            part for part in presentation.part.package.iter_parts()
+            if isinstance(part, (SlideMasterPart, SlideLayoutPart)) or not isinstance(part, XmlPart)
+        }
+
+
+def _rebuild(source: Package, shared_parts: Set[Part]) -> Presentation:
+    """source 패키지의 파트 그래프를 새 패키지로 다시 구성 (공유 파트 외에는 XML 요소를 복사한 새 파트)"""
+    package = Package(None)
+    parts: Dict[Part, Part] = {
+        part: part if part in shared_parts else type(part)(
+            part.partname, part.content_type, package, copy.deepcopy(part._element)
+        )
+        for part in source.iter_parts()
+    }
+    _copy_rels(source._rels, package._rels, parts)
+    for part, new_part in parts.items():
+        if new_part is not part:
+            _copy_rels(part.rels, new_part.rels, parts)
+    return package.presentation_part.presentation
+
+
+def _copy_rels(source: _Relationships, target: _Relationships, parts: Dict[Part, Part]) -> None:
+    """같은 rId로 관계 복사 (대상 파트는 새 파트로 바꿈, 외부 관계는 그대로)"""
+    for rel in source.values():
+        target_part = rel.target_ref if rel.is_external else parts[rel.target_part]
+        target._rels[rel.rId] = _Relationship(
+            source._base_uri, rel.rId, rel.reltype, rel._target_mode, target_part
+        )
+
+
+# 전역 캐시 (프로세스별)
+presentation_cache = PresentationCache()
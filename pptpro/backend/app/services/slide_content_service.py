@@ -1,9 +1,10 @@
 """
 Slide content classification and generation service
 """
-import json
 from typing import Dict, Any, List
+from app.infrastructure.json_stream import parse_llm_json
 from app.infrastructure.llm_provider import get_llm_provider
+from app.infrastructure.llm_telemetry import llm_call_tags
 from app.schemas.slide_content import (
     SlideClassificationRequest,
     SlideClassificationResponse,
@@ -14,6 +15,19 @@ from app.schemas.slide_content import (
 )
 
 
+# 템플릿별로 LLM이 채워야 하는 components 필드 (잘린 응답의 누락 필드 판단용)
+TEMPLATE_COMPONENT_FIELDS = {
+    "message_only": ["title", "main_message", "bullet_points", "call_to_action"],
+    "asis_tobe": ["as_is_title", "as_is_points", "to_be_title", "to_be_points", "transition_method"],
+    "case_box": ["cases", "insight_box"],
+    "step_flow": ["steps", "action_guide"],
+    "chart_insight": ["chart_title", "chart_type", "key_insights", "data_source", "evidence_block", "insight_box"],
+    "node_map": ["central_concept", "primary_nodes", "connections", "insight_box"],
+}
+
+CONTENT_ELEMENT_FIELDS = ("element_type", "description", "classification", "reason")
+
+
 class SlideContentService:
     """슬라이드 콘텐츠 분류 및 생성 서비스"""
     
@@ -32,10 +46,12 @@ class SlideContentService:
         
         prompt_text = f"{self._get_classification_system_prompt()}\n\n{prompt}"
 
-        llm_response = await self.llm.generate(
-            prompt=prompt_text,
-            temperature=0.2,  # 일관된 분류를 위해 낮은 temperature
-        )
+        with llm_call_tags(template_type=request.slide_type):
+            llm_response = await self.llm.generate(
+                prompt=prompt_text,
+                temperature=0.2,  # 일관된 분류를 위해 낮은 temperature
+                hedge=True,  # 짧은 호출이므로 느린 응답은 헤지 요청으로 대체
+            )
         
         # LLM 응답 파싱
         result = self._parse_classification_response(
@@ -56,10 +72,11 @@ class SlideContentService:
         
         prompt_text = f"{self._get_generation_system_prompt(request.slide_type)}\n\n{prompt}"
 
-        llm_response = await self.llm.generate(
-            prompt=prompt_text,
-            temperature=0.7,  # 창의적인 콘텐츠 생성을 위해 적절한 temperature
-        )
+        with llm_call_tags(template_type=request.slide_type):
+            llm_response = await self.llm.generate(
+                prompt=prompt_text,
+                temperature=0.7,  # 창의적인 콘텐츠 생성을 위해 적절한 temperature
+            )
         
         # LLM 응답 파싱
         raw_result = self._parse_generation_response(
@@ -136,28 +153,10 @@ class SlideContentService:
         return prompt
     
     def _parse_classification_response(self, response: str) -> Dict[str, Any]:
-        """분류 응답 파싱"""
-        try:
-            response = response.strip()
-            
-            # Markdown 코드 블록 제거
-            if response.startswith("```"):
-                lines = response.split("\n")
-                response = "\n".join(lines[1:-1]) if len(lines) > 2 else response
-                if response.startswith("json"):
-                    response = response[4:].strip()
-            
-            data = json.loads(response)
-            
-            # 기본값 설정
-            if "user_needed" not in data:
-                data["user_needed"] = []
-            if "ai_generated" not in data:
-                data["ai_generated"] = []
-            
-            return data
-            
-        except json.JSONDecodeError:
+        """분류 응답 파싱 (잘린 응답은 완결된 요소까지 복구)"""
+        parsed = parse_llm_json(response, ["user_needed", "ai_generated"])
+        
+        if not parsed.data:
             # 파싱 실패 시 기본값
             return {
                 "user_needed": [
@@ -177,6 +176,25 @@ class SlideContentService:
                     }
                 ],
             }
+        
+        data = parsed.data
+        
+        # 기본값 설정
+        if "user_needed" not in data:
+            data["user_needed"] = []
+        if "ai_generated" not in data:
+            data["ai_generated"] = []
+        
+        if not parsed.complete:
+            # 잘린 응답의 마지막 요소는 필드가 빠져 있을 수 있으므로 제외
+            for key in ("user_needed", "ai_generated"):
+                data[key] = [
+                    element for element in data[key]
+                    if isinstance(element, dict)
+                    and all(name in element for name in CONTENT_ELEMENT_FIELDS)
+                ]
+        
+        return data
     
     def _get_generation_system_prompt(self, slide_type: str) -> str:
         """콘텐츠 생성용 시스템 프롬프트"""
@@ -216,26 +234,13 @@ class SlideContentService:
         response: str, 
         slide_type: str
     ) -> Dict[str, Any]:
-        """콘텐츠 생성 응답 파싱"""
-        try:
-            response = response.strip()
-            
-            # Markdown 코드 블록 제거
-            if response.startswith("```"):
-                lines = response.split("\n")
-                response = "\n".join(lines[1:-1]) if len(lines) > 2 else response
-                if response.startswith("json"):
-                    response = response[4:].strip()
-            
-            data = json.loads(response)
-            
-            # components가 없으면 빈 객체
-            if "components" not in data:
-                data["components"] = {}
-
-            return data
-
-        except json.JSONDecodeError:
+        """콘텐츠 생성 응답 파싱 (잘린 응답은 완결된 필드를 살리고 누락 필드를 metadata에 기록)"""
+        required_fields = [
+            f"components.{name}" for name in TEMPLATE_COMPONENT_FIELDS.get(slide_type, [])
+        ]
+        parsed = parse_llm_json(response, required_fields)
+        
+        if not parsed.data:
             # 파싱 실패 시 기본값
             return {
                 "components": {
@@ -245,6 +250,25 @@ class SlideContentService:
                 },
                 "metadata": {"status": "fallback"},
             }
+        
+        data = parsed.data
+        
+        # components가 없으면 빈 객체
+        if not isinstance(data.get("components"), dict):
+            data["components"] = {}
+        
+        if not parsed.complete:
+            # 다시 요청할 필드만 알 수 있도록 누락 필드 기록
+            data["metadata"] = {
+                **(data.get("metadata") or {}),
+                "status": "partial",
+                "missing_fields": [
+                    path.split(".", 1)[1] if path.startswith("components.") else path
+                    for path in parsed.missing_fields
+                ],
+            }
+        
+        return data
 
     def _get_template_generation_guidance(self, slide_type: str) -> str:
         """템플릿별 생성 가이드"""
@@ -475,6 +499,7 @@ JSON 구조:
                 "data_source": normalized.get("data_source"),
                 "evidence_block": normalized.get("evidence_block"),
                 "insight_box": normalized.get("insight_box"),
+                "chart_data": normalized.get("chart_data") or normalized.get("sample_data_structure"),
             },
             "node_map": {
                 "central_concept": normalized.get("central_concept"),
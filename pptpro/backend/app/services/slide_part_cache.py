@@ -0,0 +1,69 @@
+"""
+렌더링된 슬라이드 XML 캐시 - 내용이 그대로인 슬라이드는 다시 렌더링하지 않고 이전 결과를 붙여 넣음
+"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+
+
+def slide_cache_key(**parts: Any) -> str:
+    """슬라이드 렌더링 입력(템플릿, 콘텐츠, 렌더러 버전, 테마 등)의 해시"""
+    encoded = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class SlidePartCache:
+    """슬라이드 파트 XML(bytes) LRU 캐시 - 전체 크기 max_bytes 기준 축출
+
+    렌더링 워커 스레드에서 동시에 사용하므로 잠금으로 보호한다 (프로세스 풀이면 프로세스별).
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.counters = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            blob = self._entries.get(key)
+            if blob is None:
+                self.counters["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.counters["hits"] += 1
+            return blob
+
+    def set(self, key: str, blob: bytes) -> None:
+        if len(blob) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            self._entries[key] = blob
+            self._bytes += len(blob)
+            self.counters["writes"] += 1
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.counters["evictions"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.counters["hits"] + self.counters["misses"]
+        return {
+            **self.counters,
+            "hit_rate": round(self.counters["hits"] / lookups, 4) if lookups else 0.0,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+
+# 전역 캐시 (프로세스별)
+slide_part_cache = SlidePartCache(settings.PPT_SLIDE_CACHE_MAX_BYTES)
@@ -1,10 +1,14 @@
 """
 스토리라인 생성 서비스
 """
-from typing import List, Dict, Any
+import logging
+from typing import AsyncIterator, List, Dict, Any, Tuple
 from dataclasses import dataclass
+from app.infrastructure.json_stream import IncrementalJSONParser, PartialJSONError
 from app.infrastructure.llm_provider import get_llm_provider
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class SlideOutline:
@@ -41,26 +45,81 @@ class StorylineService:
         try:
             # LLM으로 구조화된 응답 생성
             response = await self.llm_provider.generate_structured(prompt, schema)
+            return self._build_result(response)
             
-            # 응답을 SlideOutline 객체로 변환
-            outline = []
-            for item in response.get("outline", []):
-                slide = SlideOutline(
-                    order=item.get("order", 0),
-                    head_message=item.get("head_message", ""),
-                    purpose=item.get("purpose", "general"),
-                    template_suggestion=self._suggest_template(item.get("purpose", "general"))
-                )
-                outline.append(slide)
-            
-            return StorylineResult(
-                outline=outline,
-                overall_narrative=response.get("overall_narrative", "")
-            )
+        except PartialJSONError as e:
+            # 잘린 응답이라도 완결된 슬라이드가 있으면 사용
+            return self._build_partial_result(e.data, topic, target, goal)
+        except Exception as e:
+            # LLM 실패 시 기본 구조 반환
+            logger.warning("LLM 스토리라인 생성 실패, 기본 구조로 대체: %s", e)
+            return self._get_fallback_storyline(topic, target, goal)
+    
+    async def stream_storyline(
+        self, 
+        topic: str, 
+        target: str, 
+        goal: str, 
+        narrative_style: str = "consulting"
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """스트리밍 생성
+
+        ("token", 텍스트 조각)과 완결된 슬라이드마다 ("outline_item", SlideOutline)을
+        보낸 뒤 마지막에 ("result", StorylineResult)를 보낸다.
+        """
+        
+        prompt = self._build_storyline_prompt(topic, target, goal, narrative_style)
+        schema = self._get_response_schema()
+        
+        parser = IncrementalJSONParser()
+        try:
+            async for chunk in self.llm_provider.generate_stream(prompt, schema):
+                yield "token", chunk
+                for path, value in parser.feed(chunk):
+                    if path[0] == "outline" and isinstance(value, dict):
+                        yield "outline_item", self._build_outline_item(value)
             
+            response, complete = parser.finish()
+            if complete:
+                result = self._build_result(response)
+            else:
+                result = self._build_partial_result(response, topic, target, goal)
         except Exception as e:
             # LLM 실패 시 기본 구조 반환
+            logger.warning("LLM 스토리라인 생성 실패, 기본 구조로 대체: %s", e)
+            result = self._get_fallback_storyline(topic, target, goal)
+        
+        yield "result", result
+    
+    def _build_result(self, response: Dict[str, Any]) -> StorylineResult:
+        """LLM 응답을 SlideOutline 객체로 변환"""
+        outline = [self._build_outline_item(item) for item in response.get("outline", [])]
+        
+        return StorylineResult(
+            outline=outline,
+            overall_narrative=response.get("overall_narrative", "")
+        )
+    
+    def _build_outline_item(self, item: Dict[str, Any]) -> SlideOutline:
+        return SlideOutline(
+            order=item.get("order", 0),
+            head_message=item.get("head_message", ""),
+            purpose=item.get("purpose", "general"),
+            template_suggestion=self._suggest_template(item.get("purpose", "general"))
+        )
+    
+    def _build_partial_result(
+        self, response: Dict[str, Any], topic: str, target: str, goal: str
+    ) -> StorylineResult:
+        """잘린 응답 복구 결과 - 헤드메시지까지 완결된 슬라이드만 사용, 없으면 기본 구조"""
+        outline = [
+            item for item in response.get("outline", [])
+            if isinstance(item, dict) and item.get("head_message")
+        ]
+        if not outline:
             return self._get_fallback_storyline(topic, target, goal)
+        
+        return self._build_result({**response, "outline": outline})
     
     def _build_storyline_prompt(self, topic: str, target: str, goal: str, style: str) -> str:
         """프롬프트 생성"""
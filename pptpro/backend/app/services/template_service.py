@@ -1,8 +1,8 @@
 """
 Template suggestion service using LLM
 """
-import json
 from typing import Dict, Any, List
+from app.infrastructure.json_stream import parse_llm_json
 from app.infrastructure.llm_provider import get_llm_provider
 from app.schemas.template import (
     TemplateSuggestionRequest,
@@ -40,6 +40,7 @@ class TemplateService:
         llm_response = await self.llm.generate(
             prompt=prompt_text,
             temperature=0.3,  # 일관된 추천을 위해 낮은 temperature
+            hedge=True,  # 짧은 호출이므로 느린 응답은 헤지 요청으로 대체
         )
         
         # LLM 응답 파싱
@@ -102,31 +103,10 @@ class TemplateService:
         return prompt
     
     def _parse_llm_response(self, response: str) -> Dict[str, Any]:
-        """LLM 응답을 파싱하여 구조화된 데이터로 변환"""
-        try:
-            # JSON 블록 추출 (```json ... ``` 또는 {...} 형태)
-            response = response.strip()
-            
-            # Markdown 코드 블록 제거
-            if response.startswith("```"):
-                lines = response.split("\n")
-                response = "\n".join(lines[1:-1]) if len(lines) > 2 else response
-                if response.startswith("json"):
-                    response = response[4:].strip()
-            
-            data = json.loads(response)
-            
-            # 검증: 필수 필드 확인
-            if "template_type" not in data:
-                raise ValueError("template_type이 응답에 없습니다")
-            
-            # components가 없으면 기본값 제공
-            if "components" not in data:
-                data["components"] = self._get_default_components(data["template_type"])
-            
-            return data
-            
-        except json.JSONDecodeError as e:
+        """LLM 응답을 파싱하여 구조화된 데이터로 변환 (잘린 응답은 완결된 부분까지 복구)"""
+        parsed = parse_llm_json(response, ["template_type", "reason", "components"])
+        
+        if not parsed.data:
             # JSON 파싱 실패 시 기본값 반환
             return {
                 "template_type": "message_only",
@@ -134,6 +114,28 @@ class TemplateService:
                 "components": self._get_default_components("message_only"),
                 "alternative_templates": ["case_box", "step_flow"],
             }
+        
+        data = parsed.data
+        
+        # 검증: 필수 필드 확인
+        if "template_type" not in data:
+            raise ValueError("template_type이 응답에 없습니다")
+        
+        if "reason" not in data:
+            data["reason"] = "응답이 잘려 추천 이유를 확인하지 못했습니다."
+        
+        if not parsed.complete and "components" in data:
+            # 잘린 응답의 마지막 컴포넌트는 필드가 빠져 있을 수 있으므로 제외
+            data["components"] = [
+                component for component in data["components"]
+                if isinstance(component, dict) and "type" in component and "description" in component
+            ]
+        
+        # components가 없으면 기본값 제공
+        if not data.get("components"):
+            data["components"] = self._get_default_components(data["template_type"])
+        
+        return data
     
     def _get_default_components(self, template_type: str) -> List[Dict[str, Any]]:
         """템플릿 타입별 기본 컴포넌트"""
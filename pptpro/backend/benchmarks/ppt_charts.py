@@ -0,0 +1,98 @@
+"""
+네이티브 차트 벤치마크 - 데이터 크기/차트 종류별 계열 준비 시간, 차트 추가 시간, 차트 XML과 내장 워크북 크기
+
+다운샘플링한 결과와, --raw-limit 이하 크기에서는 다운샘플링 없이(한도를 데이터 크기로 올림) 만든 결과를 함께 출력한다.
+
+실행 (backend 디렉터리에서):
+    python -m benchmarks.ppt_charts --points 1000 100000 1000000 --raw-limit 10000
+"""
+import argparse
+import contextlib
+import sys
+import time
+from typing import Any, Dict, Iterator
+
+import numpy as np
+from pptx.opc.oxml import serialize_part_xml
+from pptx.util import Inches
+
+from app.core.config import settings
+from app.services.chart_data import add_chart, prepare_chart
+from app.services.presentation_cache import presentation_cache
+
+KINDS = ["line", "bar", "pie", "scatter"]
+
+
+def build_content(kind: str, points: int, seed: int = 0) -> Dict[str, Any]:
+    """업로드한 데이터처럼 JSON 리스트로 된 chart_data (line: 랜덤 워크, bar/pie: 항목별 값, scatter: 정규분포)"""
+    rng = np.random.default_rng(seed)
+    if kind == "scatter":
+        data = {"x": rng.normal(size=points).tolist(), "y": rng.normal(size=points).tolist()}
+    elif kind == "line":
+        data = {"labels": list(range(points)), "values": np.cumsum(rng.normal(size=points)).tolist()}
+    else:
+        data = {"labels": [f"항목 {i}" for i in range(points)], "values": rng.pareto(2.0, size=points).tolist()}
+    return {"chart_type": kind, "chart_data": data}
+
+
+@contextlib.contextmanager
+def chart_limits(points: int) -> Iterator[None]:
+    """다운샘플링 한도를 points로 올림 (다운샘플링 없는 비교용)"""
+    names = ["PPT_CHART_MAX_POINTS", "PPT_CHART_MAX_CATEGORIES", "PPT_CHART_PIE_SLICES"]
+    previous = {name: getattr(settings, name) for name in names}
+    for name in names:
+        setattr(settings, name, points)
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            setattr(settings, name, value)
+
+
+def measure(content: Dict[str, Any]) -> Dict[str, float]:
+    started = time.perf_counter()
+    prepared = prepare_chart(content)
+    prepared_at = time.perf_counter()
+
+    prs = presentation_cache.copy()
+    slide = prs.slides.add_slide(prs.slide_layouts[5])
+    chart = add_chart(slide, prepared, Inches(0.5), Inches(2), Inches(5), Inches(4)).chart
+    added_at = time.perf_counter()
+    return {
+        "points": prepared.points,
+        "prep_ms": (prepared_at - started) * 1000,
+        "chart_ms": (added_at - prepared_at) * 1000,
+        "xml_kb": len(serialize_part_xml(chart.part._element)) / 1024,
+        "xlsx_kb": len(chart.part.chart_workbook.xlsx_part.blob) / 1024,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--points", type=int, nargs="+", default=[1000, 100000, 1000000], help="데이터 점 수")
+    parser.add_argument("--raw-limit", type=int, default=10000, help="이 크기까지 다운샘플링 없는 결과도 측정")
+    args = parser.parse_args()
+
+    measure(build_content("line", 2000))  # import 등 1회성 비용 제외
+    print(
+        f"{'종류':<8} {'입력 점':>9} | {'방식':<6} {'남은 점':>7} | {'준비 ms':>8} {'차트 ms':>9} | "
+        f"{'차트 XML KB':>11} {'워크북 KB':>10}"
+    )
+    for kind in KINDS:
+        for points in args.points:
+            content = build_content(kind, points)
+            modes = [("다운샘플", contextlib.nullcontext())]
+            if points <= args.raw_limit:
+                modes.append(("원본", chart_limits(points)))
+            for label, limits in modes:
+                with limits:
+                    result = measure(content)
+                print(
+                    f"{kind:<8} {points:>9} | {label:<6} {result['points']:>7} | {result['prep_ms']:8.1f} "
+                    f"{result['chart_ms']:9.1f} | {result['xml_kb']:11.1f} {result['xlsx_kb']:10.1f}"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
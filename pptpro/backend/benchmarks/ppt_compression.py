@@ -0,0 +1,94 @@
+"""
+zip 압축 프로필 벤치마크 - 프로필별(store, fast, default, max) 저장 시간과 파일 크기, 압축 스레드 수별 저장 시간
+
+렌더링이 끝난 같은 프레젠테이션을 저장만 반복해 잰다. default는 python-pptx(prs.save)와 같은 결과인지 함께 확인한다.
+
+실행 (backend 디렉터리에서):
+    python -m benchmarks.ppt_compression --slides 200 --threads 0 2 4 --repeat 5
+"""
+import argparse
+import io
+import os
+import sys
+import time
+import zipfile
+from typing import Optional
+
+from pptx import Presentation
+
+from app.db.memory_store import Project
+from app.infrastructure.render_pool import CompressionPool
+from app.infrastructure.zip_package import COMPRESSION_PROFILES
+from app.services.ppt_generation import PPTGenerationService
+
+from benchmarks.ppt_reexport import package_contents
+from benchmarks.ppt_render import build_slides
+
+
+def save(prs: Presentation, profile: str, pool: Optional[CompressionPool] = None) -> bytes:
+    buffer = io.BytesIO()
+    PPTGenerationService(slide_cache=None, compression=profile, deflate_pool=pool)._save(prs, buffer)
+    return buffer.getvalue()
+
+
+def check_parity(prs: Presentation) -> bool:
+    """default 프로필 결과가 prs.save와 내용, 항목 순서, 항목별 압축 크기까지 같은지"""
+    expected = io.BytesIO()
+    prs.save(expected)
+    data = save(prs, "default")
+    with zipfile.ZipFile(expected) as a, zipfile.ZipFile(io.BytesIO(data)) as b:
+        layout_a = [(info.filename, info.CRC, info.compress_size) for info in a.infolist()]
+        layout_b = [(info.filename, info.CRC, info.compress_size) for info in b.infolist()]
+    return layout_a == layout_b and package_contents(expected.getvalue()) == package_contents(data)
+
+
+def best_of(
+    repeat: int, prs: Presentation, profile: Optional[str], pool: Optional[CompressionPool] = None
+) -> float:
+    """저장 시간(ms) 최솟값 - profile이 None이면 prs.save"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        if profile is None:
+            prs.save(io.BytesIO())
+        else:
+            save(prs, profile, pool)
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--slides", type=int, default=200, help="콘텐츠 슬라이드 수")
+    parser.add_argument("--threads", type=int, nargs="+", default=[0, 2, 4], help="비교할 압축 스레드 수 (0: 차례로 압축)")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    project = Project("bench", "압축 벤치마크", "주제", "대상", "목표")
+    slides = build_slides(project, args.slides)
+    prs = PPTGenerationService(slide_cache=None)._render(project, slides)
+
+    print(f"=== 결과 비교 ({len(slides)}개 슬라이드) ===")
+    if not check_parity(prs):
+        print("❌ default 프로필 결과가 prs.save와 다름")
+        return 1
+    print("✅ default 프로필 결과가 prs.save와 같음")
+
+    print(f"\n=== 프로필별 저장 시간 ({args.repeat}회 중 최솟값, CPU {os.cpu_count()}개) ===")
+    baseline_ms = best_of(args.repeat, prs, None)
+    print(f"  prs.save           {baseline_ms:8.1f} ms | {len(save(prs, 'default')) / 1024:8.1f} KB")
+    for profile in COMPRESSION_PROFILES:
+        size_kb = len(save(prs, profile)) / 1024
+        timings = []
+        for threads in args.threads:
+            pool = CompressionPool(threads)
+            try:
+                timings.append(f"스레드 {threads} {best_of(args.repeat, prs, profile, pool):7.1f} ms")
+            finally:
+                pool.shutdown()
+        print(f"  {profile:<8} {size_kb:8.1f} KB | " + " | ".join(timings))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
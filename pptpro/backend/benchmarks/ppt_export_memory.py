@@ -0,0 +1,83 @@
+"""
+PPT 내보내기 메모리 벤치마크 - 전체 트리를 만든 뒤 저장하는 방식, BytesIO 버퍼 방식, 임시 파일 저장 방식의 최대 RSS 증가량 비교
+
+buffer/spool은 슬라이드를 렌더링하는 즉시 zip에 쓰므로 슬라이드 트리만큼의 증가량이 없어야 한다
+(남는 증가량은 슬라이드 목록/관계/zip 디렉터리 항목).
+측정마다 새 프로세스를 띄워 슬라이드를 만든 뒤의 최대 RSS를 기준으로 내보내기 중 증가량을 잰다.
+
+실행 (backend 디렉터리에서):
+    python -m benchmarks.ppt_export_memory --slides 50 400 1600
+"""
+import argparse
+import io
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict
+
+MODES = ["tree", "buffer", "spool"]
+
+
+def _peak_rss_kb() -> int:
+    # Linux에서 ru_maxrss 단위는 KB
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def measure(mode: str, count: int) -> Dict[str, float]:
+    """새 프로세스에서 count개 슬라이드 덱을 내보내며 최대 RSS 증가량(MB)과 파일 크기(MB) 측정"""
+    from app.db.memory_store import Project
+    from app.services.ppt_generation import PPTGenerationService
+    from benchmarks.ppt_render import build_slides
+
+    project = Project("bench", "메모리 벤치마크", "주제", "대상", "목표")
+    service = PPTGenerationService(slide_cache=None)
+    # import, 기본 프레젠테이션 캐시 등 1회성 비용은 기준값에 포함
+    service.generate_ppt(project, build_slides(project, 6))
+    slides = build_slides(project, count)
+    baseline = _peak_rss_kb()
+
+    if mode == "tree":
+        # 이전 방식: 모든 슬라이드 트리를 메모리에 만든 뒤 저장
+        output = io.BytesIO()
+        service._save(service._render(project, slides), output)
+        size = output.tell()
+    elif mode == "buffer":
+        # 기존 다운로드 경로: BytesIO에 저장 후 getvalue()로 응답 본문 생성
+        data = service.generate_ppt(project, slides).getvalue()
+        size = len(data)
+    else:
+        fd, path = tempfile.mkstemp(suffix=".pptx")
+        os.close(fd)
+        try:
+            service.save_ppt(project, slides, path)
+            size = os.path.getsize(path)
+        finally:
+            os.unlink(path)
+
+    return {"peak_mb": (_peak_rss_kb() - baseline) / 1024, "file_mb": size / 1024 / 1024}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--slides", type=int, nargs="+", default=[50, 200, 800], help="덱 크기 (슬라이드 수)")
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    print(f"{'슬라이드':>8} | {'파일 MB':>7} | " + " | ".join(f"{mode} RSS 증가 MB" for mode in MODES))
+    for count in args.slides:
+        results = {}
+        for mode in MODES:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                results[mode] = pool.submit(measure, mode, count).result()
+        print(
+            f"{count:>8} | {results['spool']['file_mb']:7.2f} | "
+            + " | ".join(f"{results[mode]['peak_mb']:18.1f}" for mode in MODES)
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
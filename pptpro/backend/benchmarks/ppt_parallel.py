@@ -0,0 +1,67 @@
+"""
+구간 병렬 렌더링 벤치마크 - 큰 덱을 프로세스 풀로 나눠 렌더링할 때 결과 일치 여부와 워커 수별 내보내기 시간
+
+실행 (backend 디렉터리에서):
+    python -m benchmarks.ppt_parallel --slides 500 --workers 1 2 4 --repeat 3
+"""
+import argparse
+import io
+import os
+import sys
+import time
+from typing import List, Optional
+
+from app.db.memory_store import Project, Slide
+from app.infrastructure.render_pool import SlideRenderPool
+from app.services.ppt_generation import PPTGenerationService
+
+from benchmarks.ppt_reexport import package_contents
+from benchmarks.ppt_render import build_slides
+
+
+def export(project: Project, slides: List[Slide], pool: Optional[SlideRenderPool]) -> bytes:
+    """pool이 없으면 한 프로세스에서 렌더링"""
+    service = PPTGenerationService(slide_cache=None, slide_pool=pool, parallel_min_slides=1 if pool else 0)
+    return service.generate_ppt(project, slides).getvalue()
+
+
+def best_of(repeat: int, project: Project, slides: List[Slide], pool: Optional[SlideRenderPool]) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        export(project, slides, pool)
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--slides", type=int, default=500, help="콘텐츠 슬라이드 수")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="비교할 워커 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    project = Project("bench", "병렬 렌더링 벤치마크", "주제", "대상", "목표")
+    slides = build_slides(project, args.slides)
+
+    print(f"=== 결과 비교 ({len(slides)}개 슬라이드) ===")
+    expected = package_contents(export(project, slides, None))
+    with SlideRenderPool(max(args.workers)) as pool:
+        if package_contents(export(project, slides, pool)) != expected:
+            print("❌ 병렬 렌더링 결과가 다름")
+            return 1
+    print("✅ 병렬 렌더링 결과 일치")
+
+    print(f"\n=== 내보내기 시간 ({args.repeat}회 중 최솟값, CPU {os.cpu_count()}개) ===")
+    serial_ms = best_of(args.repeat, project, slides, None)
+    print(f"  단일 프로세스   {serial_ms:8.1f} ms")
+    for workers in args.workers:
+        with SlideRenderPool(workers) as pool:
+            export(project, slides[:workers * 2], pool)  # 워커 프로세스 기동 비용 제외
+            elapsed_ms = best_of(args.repeat, project, slides, pool)
+        print(f"  워커 {workers:2d}개       {elapsed_ms:8.1f} ms ({serial_ms / elapsed_ms:.2f}배)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
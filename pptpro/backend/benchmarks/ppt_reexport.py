@@ -0,0 +1,116 @@
+"""
+증분 재내보내기 벤치마크 - 슬라이드 캐시 사용 시, 이전 파일 패치 시 수정한 슬라이드 수에 따른 재내보내기 시간 측정
+
+실행 (backend 디렉터리에서):
+    python -m benchmarks.ppt_reexport --slides 40 --repeat 5
+"""
+import argparse
+import copy
+import io
+import os
+import sys
+import tempfile
+import time
+import zipfile
+from typing import Dict, List, Optional
+
+from app.db.memory_store import Project, Slide
+from app.services.ppt_generation import ExportManifest, PPTGenerationService
+from app.services.slide_part_cache import SlidePartCache
+
+from benchmarks.ppt_render import build_slides
+
+
+def edit_slides(slides: List[Slide], edits: int, revision: int) -> List[Slide]:
+    """앞에서부터 edits개 슬라이드의 제목 문구를 바꾼 사본"""
+    edited = copy.deepcopy(slides)
+    for slide in edited[:edits]:
+        content = slide.content.get("ppt_payload") or slide.content
+        for key in ("main_message", "chart_title", "central_concept"):
+            if key in content:
+                content[key] = f"{content[key]} (수정 {revision})"
+                break
+        else:
+            content["main_message"] = f"수정 {revision}"
+    return edited
+
+
+def package_contents(data: bytes) -> Dict[str, bytes]:
+    with zipfile.ZipFile(io.BytesIO(data)) as package:
+        return {name: package.read(name) for name in package.namelist() if name != "docProps/core.xml"}
+
+
+def check_parity(project: Project, slides: List[Slide]) -> bool:
+    """캐시/패치를 거친 재내보내기 결과가 캐시 없이 렌더링한 결과와 같은지 확인 (docProps/core.xml 제외)"""
+    cached = PPTGenerationService(slide_cache=SlidePartCache(64 * 1024 * 1024))
+    previous = cached.generate_ppt(project, slides).getvalue()
+    edited = edit_slides(slides, 3, 0)
+    expected = package_contents(PPTGenerationService(slide_cache=None).generate_ppt(project, edited).getvalue())
+    if package_contents(cached.generate_ppt(project, edited).getvalue()) != expected:
+        return False
+    patched = patch(project, previous, slides, edited)
+    return patched is None or package_contents(patched) == expected
+
+
+def patch(project: Project, previous: bytes, slides: List[Slide], edited: List[Slide]) -> Optional[bytes]:
+    """이전 파일에서 바뀐 슬라이드만 교체한 결과 (바뀐 슬라이드에 차트 등 다른 파트가 있으면 None)"""
+    changed = ExportManifest.build("", project, slides).changed_slide_ids(ExportManifest.build("", project, edited))
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "patched.pptx")
+        if not PPTGenerationService(slide_cache=None).patch_ppt(previous, edited, changed, path):
+            return None
+        with open(path, "rb") as f:
+            return f.read()
+
+
+def measure(service: PPTGenerationService, project: Project, slides: List[Slide]) -> Dict[str, float]:
+    """렌더링(저장 전)과 저장 포함 시간"""
+    started = time.perf_counter()
+    prs = service._render(project, slides)
+    rendered = time.perf_counter()
+    prs.save(io.BytesIO())
+    return {"render_ms": (rendered - started) * 1000, "total_ms": (time.perf_counter() - started) * 1000}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--slides", type=int, default=40, help="콘텐츠 슬라이드 수")
+    parser.add_argument("--repeat", type=int, default=5, help="수정 수별 반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    project = Project("bench", "재내보내기 벤치마크", "주제", "대상", "목표")
+    slides = build_slides(project, args.slides)[:args.slides]
+
+    print(f"=== 결과 비교 ({len(slides)}개 슬라이드) ===")
+    if not check_parity(project, slides):
+        print("❌ 캐시/패치 사용 결과가 다름")
+        return 1
+    print("✅ 캐시/패치 사용 결과 일치")
+
+    print(f"\n=== 재내보내기 시간 ({args.repeat}회 중 최솟값) ===")
+    uncached = PPTGenerationService(slide_cache=None)
+    baseline = min((measure(uncached, project, slides) for _ in range(args.repeat)), key=lambda r: r["total_ms"])
+    print(f"  캐시 없음        렌더링 {baseline['render_ms']:7.1f} ms | 저장 포함 {baseline['total_ms']:7.1f} ms")
+
+    previous = uncached.generate_ppt(project, slides).getvalue()
+    for edits in sorted({0, 1, 5, args.slides}):
+        timings, patch_timings = [], []
+        for revision in range(args.repeat):
+            service = PPTGenerationService(slide_cache=SlidePartCache(64 * 1024 * 1024))
+            service._render(project, slides)  # 첫 내보내기로 캐시 채움
+            edited = edit_slides(slides, edits, revision)
+            timings.append(measure(service, project, edited))
+            started = time.perf_counter()
+            if patch(project, previous, slides, edited) is not None:
+                patch_timings.append((time.perf_counter() - started) * 1000)
+        best = min(timings, key=lambda r: r["total_ms"])
+        patch_text = f"{min(patch_timings):7.1f} ms" if patch_timings else "불가 (차트 슬라이드 수정)"
+        print(
+            f"  수정 {edits:3d}개 재내보내기 렌더링 {best['render_ms']:7.1f} ms | 저장 포함 {best['total_ms']:7.1f} ms"
+            f" | 이전 파일 패치 {patch_text}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
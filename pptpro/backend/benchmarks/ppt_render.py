@@ -0,0 +1,151 @@
+"""
+PPT 렌더링 엔진 비교 - XMLTemplateRenderer와 PPTTemplateRenderer의 결과 XML 일치 여부 확인 후 속도 측정
+
+실행 (backend 디렉터리에서):
+    python -m benchmarks.ppt_render --slides 120 --repeat 5
+"""
+import argparse
+import io
+import sys
+import time
+import zipfile
+from typing import Dict, List
+
+from lxml import etree
+
+from app.db.memory_store import Project, Slide
+from app.infrastructure.llm_cassette import SyntheticResponder
+from app.services.content_generation import ContentGenerationService
+from app.services.ppt_generation import PPTGenerationService
+from app.services.presentation_cache import presentation_cache
+
+TEMPLATE_TYPES = ["message_only", "asis_tobe", "case_box", "step_flow", "chart_insight", "node_map"]
+ENGINES = ["pptx", "xml"]
+
+# 이스케이프, 줄바꿈, 제어 문자, 빈 값, 개수 제한 등 경계 사례
+EDGE_CASE_CONTENTS = [
+    ("message_only", {
+        "main_message": "A & B < C > D \"인용\" 'q'\n두 번째 문단\v줄바꿈\x01",
+        "supporting_points": ["첫째\n줄바꿈", "", "tab\there", "\v앞 줄바꿈"],
+        "call_to_action": "\n",
+    }),
+    ("message_only", {"main_message": "", "supporting_points": [], "call_to_action": ""}),
+    ("asis_tobe", {"as_is_points": ["하나"], "to_be_points": [], "transition_method": "A→B & C"}),
+    ("case_box", {"cases": [{"title": "단일"}]}),
+    ("case_box", {"cases": [{"title": f"케이스 {i}", "description": "설명\n둘째 줄"} for i in range(6)]}),
+    ("case_box", {"cases": []}),
+    ("step_flow", {"steps": [{"order": i, "title": f"단계 {i}"} for i in range(1, 9)]}),
+    ("step_flow", {"steps": [{}]}),
+    ("chart_insight", {"chart_type": "bar", "key_insights": []}),
+    ("chart_insight", {"chart_title": "차트\n제목", "data_source": "출처 & 기준", "key_insights": ["x\x1b"]}),
+    ("chart_insight", {"chart_type": "line", "key_insights": ["계열 2개"], "chart_data": {
+        "labels": ["1월", "2월", "3월 & 4월"],
+        "series": [{"name": "매출", "values": [1, "2,000", None]}, {"name": "목표", "values": ["USER_NEEDED", 3, 4]}],
+    }}),
+    ("node_map", {"central_concept": "중심", "primary_nodes": [f"노드 {i}" for i in range(9)]}),
+    ("node_map", {}),
+]
+
+
+def build_slides(project: Project, count: int) -> List[Slide]:
+    """합성 콘텐츠 슬라이드 count개 + 경계 사례 슬라이드"""
+    responder = SyntheticResponder()
+    content_service = ContentGenerationService.__new__(ContentGenerationService)
+    slides = []
+    for index in range(count):
+        template_type = TEMPLATE_TYPES[index % len(TEMPLATE_TYPES)]
+        slide = Slide(project.id, index + 1, f"슬라이드 {index + 1}", template_type)
+        schema = content_service._get_template_schema(template_type)
+        slide.content = responder.structured(f"bench-{index}", schema)["content"]
+        slides.append(slide)
+    for offset, (template_type, content) in enumerate(EDGE_CASE_CONTENTS, start=count + 1):
+        slide = Slide(project.id, offset, f"경계 사례 {offset}", template_type)
+        slide.content = content or {"_": ""}
+        slides.append(slide)
+    return slides
+
+
+def render_slides(engine: str, project: Project, slides: List[Slide]):
+    """저장 전 단계까지 렌더링 (PPTGenerationService.generate_ppt와 같은 순서)"""
+    service = PPTGenerationService(engine=engine, slide_cache=None)
+    prs = presentation_cache.copy()
+    service._add_title_slide(prs, project)
+    renderer = service.renderer_class(prs)
+    for slide_data in sorted(slides, key=lambda x: x.order):
+        if slide_data.content:
+            service._add_content_slide(prs, slide_data, renderer)
+    service._add_closing_slide(prs, project)
+    return prs
+
+
+def check_parity(project: Project, slides: List[Slide]) -> int:
+    """두 엔진의 슬라이드 XML과 저장 결과(docProps/core.xml 제외)를 비교해 다른 슬라이드 수 반환"""
+    results = {engine: render_slides(engine, project, slides) for engine in ENGINES}
+    mismatches = 0
+    for index, (expected, actual) in enumerate(zip(*(results[e].slides for e in ENGINES)), start=1):
+        expected_xml = etree.tostring(expected._element, encoding="unicode")
+        actual_xml = etree.tostring(actual._element, encoding="unicode")
+        if expected_xml != actual_xml:
+            mismatches += 1
+            print(f"  슬라이드 {index} XML 불일치")
+            print(f"    pptx: {expected_xml[:400]}")
+            print(f"    xml : {actual_xml[:400]}")
+
+    packages: Dict[str, Dict[str, bytes]] = {}
+    for engine in ENGINES:
+        buffer = io.BytesIO()
+        results[engine].save(buffer)
+        with zipfile.ZipFile(buffer) as package:
+            packages[engine] = {
+                name: package.read(name) for name in package.namelist() if name != "docProps/core.xml"
+            }
+    if packages["pptx"] != packages["xml"]:
+        mismatches += 1
+        print("  저장된 파일 내용 불일치")
+    return mismatches
+
+
+def benchmark(project: Project, slides: List[Slide], repeat: int) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for engine in ENGINES:
+        render_times, total_times = [], []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            prs = render_slides(engine, project, slides)
+            rendered = time.perf_counter()
+            prs.save(io.BytesIO())
+            render_times.append(rendered - started)
+            total_times.append(time.perf_counter() - started)
+        results[engine] = {"render_ms": min(render_times) * 1000, "total_ms": min(total_times) * 1000}
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--slides", type=int, default=120, help="합성 콘텐츠 슬라이드 수")
+    parser.add_argument("--repeat", type=int, default=5, help="엔진별 반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    project = Project("bench", "렌더링 벤치마크", "주제", "대상", "목표")
+    slides = build_slides(project, args.slides)
+
+    print(f"=== 결과 비교 ({len(slides)}개 슬라이드) ===")
+    mismatches = check_parity(project, slides)
+    if mismatches:
+        print(f"❌ 불일치 {mismatches}건")
+        return 1
+    print("✅ 모든 슬라이드 XML 일치")
+
+    print(f"\n=== 속도 ({args.repeat}회 중 최솟값) ===")
+    results = benchmark(project, slides, args.repeat)
+    for engine, timing in results.items():
+        print(f"  {engine:5s} 렌더링 {timing['render_ms']:8.1f} ms | 저장 포함 {timing['total_ms']:8.1f} ms")
+    print(
+        f"  렌더링 {results['pptx']['render_ms'] / results['xml']['render_ms']:.1f}배, "
+        f"저장 포함 {results['pptx']['total_ms'] / results['xml']['total_ms']:.1f}배 빠름"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,8 @@
+import pytest
+
+from app.db.memory_store import Project
+
+
+@pytest.fixture
+def project() -> Project:
+    return Project("test", "테스트 프로젝트", "주제", "대상", "목표")
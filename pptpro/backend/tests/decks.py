@@ -0,0 +1,91 @@
+"""
+테스트용 슬라이드 덱 - 템플릿별 합성 콘텐츠와 경계 사례, 렌더링/패키지 비교 도우미
+"""
+import copy
+import io
+import zipfile
+from typing import Dict, List
+
+from app.db.memory_store import Project, Slide
+from app.infrastructure.llm_cassette import SyntheticResponder
+from app.services.content_generation import ContentGenerationService
+from app.services.ppt_generation import PPTGenerationService
+from app.services.presentation_cache import presentation_cache
+
+TEMPLATE_TYPES = ["message_only", "asis_tobe", "case_box", "step_flow", "chart_insight", "node_map"]
+ENGINES = ["pptx", "xml"]
+
+# 이스케이프, 줄바꿈, 제어 문자, 빈 값, 개수 제한, 텍스트가 섞인 차트 값 등
+EDGE_CASE_CONTENTS = [
+    ("message_only", {
+        "main_message": "A & B < C > D \"인용\" 'q'\n두 번째 문단\v줄바꿈\x01",
+        "supporting_points": ["첫째\n줄바꿈", "", "tab\there", "\v앞 줄바꿈"],
+        "call_to_action": "\n",
+    }),
+    ("message_only", {"main_message": "", "supporting_points": [], "call_to_action": ""}),
+    ("asis_tobe", {"as_is_points": ["하나"], "to_be_points": [], "transition_method": "A→B & C"}),
+    ("case_box", {"cases": [{"title": "단일"}]}),
+    ("case_box", {"cases": [{"title": f"케이스 {i}", "description": "설명\n둘째 줄"} for i in range(6)]}),
+    ("case_box", {"cases": []}),
+    ("step_flow", {"steps": [{"order": i, "title": f"단계 {i}"} for i in range(1, 9)]}),
+    ("step_flow", {"steps": [{}]}),
+    ("chart_insight", {"chart_type": "bar", "key_insights": []}),
+    ("chart_insight", {"chart_title": "차트\n제목", "data_source": "출처 & 기준", "key_insights": ["x\x1b"]}),
+    ("chart_insight", {"chart_type": "line", "key_insights": ["계열 2개"], "chart_data": {
+        "labels": ["1월", "2월", "3월 & 4월"],
+        "series": [{"name": "매출", "values": [1, "2,000", None]}, {"name": "목표", "values": ["USER_NEEDED", 3, 4]}],
+    }}),
+    ("node_map", {"central_concept": "중심", "primary_nodes": [f"노드 {i}" for i in range(9)]}),
+    ("node_map", {}),
+]
+
+
+def build_slides(project: Project, count: int) -> List[Slide]:
+    """템플릿을 돌아가며 합성 콘텐츠 슬라이드 count개 + 경계 사례 슬라이드"""
+    responder = SyntheticResponder()
+    content_service = ContentGenerationService.__new__(ContentGenerationService)
+    slides = []
+    for index in range(count):
+        template_type = TEMPLATE_TYPES[index % len(TEMPLATE_TYPES)]
+        slide = Slide(project.id, index + 1, f"슬라이드 {index + 1}", template_type)
+        schema = content_service._get_template_schema(template_type)
+        slide.content = responder.structured(f"test-{index}", schema)["content"]
+        slides.append(slide)
+    for offset, (template_type, content) in enumerate(EDGE_CASE_CONTENTS, start=count + 1):
+        slide = Slide(project.id, offset, f"경계 사례 {offset}", template_type)
+        slide.content = copy.deepcopy(content) or {"_": ""}
+        slides.append(slide)
+    return slides
+
+
+def render_slides(engine: str, project: Project, slides: List[Slide]):
+    """저장 전 단계까지 렌더링 (PPTGenerationService._render와 같은 순서, 병렬/캐시 없음)"""
+    service = PPTGenerationService(engine=engine, slide_cache=None)
+    prs = presentation_cache.copy()
+    service._add_title_slide(prs, project)
+    renderer = service.renderer_class(prs)
+    for slide_data in sorted(slides, key=lambda x: x.order):
+        if slide_data.content:
+            service._add_content_slide(prs, slide_data, renderer)
+    service._add_closing_slide(prs, project)
+    return prs
+
+
+def package_contents(data: bytes) -> Dict[str, bytes]:
+    """zip 항목별 내용 (생성 시각이 들어가는 docProps/core.xml 제외)"""
+    with zipfile.ZipFile(io.BytesIO(data)) as package:
+        return {name: package.read(name) for name in package.namelist() if name != "docProps/core.xml"}
+
+
+def edit_slides(slides: List[Slide], edits: int, revision: int = 1) -> List[Slide]:
+    """앞에서부터 edits개 슬라이드의 제목 문구를 바꾼 사본"""
+    edited = copy.deepcopy(slides)
+    for slide in edited[:edits]:
+        content = slide.content.get("ppt_payload") or slide.content
+        for key in ("main_message", "chart_title", "central_concept"):
+            if key in content:
+                content[key] = f"{content[key]} (수정 {revision})"
+                break
+        else:
+            content["main_message"] = f"수정 {revision}"
+    return edited
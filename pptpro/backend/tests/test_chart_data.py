@@ -0,0 +1,113 @@
+"""
+차트 데이터 준비 - 입력 형식 정규화, 다운샘플링(LTTB, 상위 N개, 격자), 실패 시 자리표시자
+"""
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from app.core.config import settings
+from app.services import chart_data
+from app.services.chart_data import (
+    OTHER_LABEL,
+    grid_thin_indices,
+    lttb_indices,
+    prepare_chart,
+    top_n,
+)
+from tests.decks import ENGINES, build_slides, render_slides
+
+
+def test_lttb_keeps_endpoints_and_peaks():
+    x = np.arange(10_000, dtype=np.float64)
+    y = np.sin(x / 500)
+    y[4321] = 50.0
+    indices = lttb_indices(x, y, 200)
+    assert len(indices) == 200
+    assert indices[0] == 0 and indices[-1] == len(y) - 1
+    assert np.all(np.diff(indices) > 0)
+    assert 4321 in indices
+
+
+@pytest.mark.parametrize("threshold", [2, 10, 20])
+def test_lttb_returns_all_points_when_small(threshold):
+    indices = lttb_indices(np.arange(10), np.arange(10), threshold)
+    assert indices.tolist() == list(range(10))
+
+
+def test_top_n_keeps_order_and_sums_rest():
+    categories = np.array(list("abcdef"), dtype=object)
+    matrix = np.array([[1.0, 9.0, 2.0, 8.0, 3.0, 7.0]])
+    kept, values = top_n(categories, matrix, 4)
+    assert kept.tolist() == ["b", "d", "f", OTHER_LABEL]
+    assert values.tolist() == [[9.0, 8.0, 7.0, 6.0]]
+    kept, values = top_n(categories, matrix, 4, sort=True)
+    assert kept.tolist() == ["b", "d", "f", OTHER_LABEL]
+    assert top_n(categories, matrix, 10)[0] is categories
+
+
+def test_grid_thin_drops_non_finite_points():
+    rng = np.random.default_rng(0)
+    x, y = rng.normal(size=5000), rng.normal(size=5000)
+    x[:10] = np.nan
+    indices = grid_thin_indices(x, y, 100)
+    assert len(indices) <= 100
+    assert np.isfinite(x[indices]).all()
+    assert grid_thin_indices(x[:20], y[:20], 100).tolist() == list(range(10, 20))
+
+
+def test_line_budget_is_shared_by_series():
+    rng = np.random.default_rng(1)
+    series = [{"name": f"계열 {i}", "values": np.cumsum(rng.normal(size=5000)).tolist()} for i in range(4)]
+    prepared = prepare_chart({"chart_type": "line", "chart_data": {"labels": list(range(5000)), "series": series}})
+    assert prepared.source_points == 20_000
+    assert prepared.points <= settings.PPT_CHART_MAX_POINTS
+    # 계열 수의 제곱으로 나누지 않음 - 예산 대부분을 사용
+    assert prepared.points > settings.PPT_CHART_MAX_POINTS // 2
+    assert len(prepared.categories) == prepared.points // 4
+
+
+def test_category_formats_and_text_values():
+    prepared = prepare_chart({"chart_type": "pie", "chart_data": {"가": "1,000", "나": "20%", "다": "USER_NEEDED"}})
+    assert prepared.kind == "pie"
+    assert prepared.categories == ["가", "나", "다"]
+    assert prepared.series[0][1].tolist() == [1000.0, 20.0, 0.0]
+
+    prepared = prepare_chart({"chart_data": [{"label": "a", "value": 3}, {"label": "b", "value": None}]})
+    assert prepared.kind == "bar"
+    assert prepared.categories == ["a", "b"]
+    assert prepared.series[0][1][0] == 3.0 and np.isnan(prepared.series[0][1][1])
+
+
+@pytest.mark.parametrize("value", [float("inf"), "Infinity", "-inf", "1e999", 10 ** 400])
+def test_infinite_values_become_empty(value):
+    prepared = prepare_chart({"chart_type": "bar", "chart_data": {"labels": ["a", "b"], "values": [1, value]}})
+    assert prepared.series[0][1][0] == 1.0
+    assert np.isnan(prepared.series[0][1][1])
+
+
+@pytest.mark.parametrize("data", [{"x": 5, "y": [1, 2]}, {"x": [1, 2], "y": "3"}, {"points": [1, 2, 3]}])
+def test_malformed_scatter_is_skipped(data):
+    assert prepare_chart({"chart_type": "scatter", "chart_data": data}) is None
+
+
+def test_scatter_drops_non_finite_points():
+    prepared = prepare_chart({"chart_type": "scatter", "chart_data": {"x": [1, 2, 3], "y": [1, "Infinity", 3]}})
+    assert prepared.series[0][1].tolist() == [[1.0, 1.0], [3.0, 3.0]]
+
+
+@pytest.mark.parametrize("data", [None, {}, {"values": ["USER_NEEDED"]}, {"labels": ["a"], "values": []}])
+def test_no_numbers(data):
+    assert prepare_chart({"chart_data": data}) is None
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_chart_failure_falls_back_to_placeholder(project, engine):
+    chart_slides = [slide for slide in build_slides(project, 0) if slide.content.get("chart_data")]
+    assert chart_slides
+    with mock.patch.object(chart_data, "build_chart_data", side_effect=RuntimeError("차트 실패")):
+        prs = render_slides(engine, project, chart_slides)
+    slide = prs.slides[1]
+    assert not any(shape.has_chart for shape in slide.shapes)
+    assert "차트 영역" in slide.shapes[1].text_frame.text
+    assert list(slide.part.rels.keys()) == ["rId1"]
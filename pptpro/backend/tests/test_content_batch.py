@@ -0,0 +1,71 @@
+"""
+배치 콘텐츠 생성 - 빠진 슬라이드만 나눠 재시도하고, 호출 실패는 단건 생성으로 한 번만 대체하는지
+"""
+import asyncio
+from typing import Any, Dict, List
+
+from app.db.memory_store import Slide
+from app.infrastructure.llm_cassette import SyntheticResponder
+from app.services.content_generation import ContentGenerationService
+from tests.decks import TEMPLATE_TYPES
+
+
+class FakeProvider:
+    """호출 횟수를 세고, fail이면 예외, 아니면 drop 개수만큼 뒤쪽 슬라이드를 뺀 응답"""
+
+    def __init__(self, fail: bool = False, drop: int = 0):
+        self.fail = fail
+        self.drop = drop
+        self.calls: List[Dict[str, Any]] = []
+        self.responder = SyntheticResponder()
+
+    async def generate_structured(self, prompt: str, schema: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        self.calls.append(schema)
+        if self.fail:
+            raise RuntimeError("upstream 503")
+        data = self.responder.structured(f"call-{len(self.calls)}", schema)
+        keys = list(schema)
+        if len(keys) > 1:
+            for key in keys[len(keys) - self.drop:]:
+                data.pop(key, None)
+        return data
+
+
+def make_service(provider: FakeProvider) -> ContentGenerationService:
+    service = ContentGenerationService.__new__(ContentGenerationService)
+    service.llm_provider = provider
+    return service
+
+
+def make_slides(project, count: int, template_types: List[str] = TEMPLATE_TYPES) -> List[Slide]:
+    return [
+        Slide(project.id, index + 1, f"슬라이드 {index + 1}", template_types[index % len(template_types)])
+        for index in range(count)
+    ]
+
+
+def test_failing_provider_falls_back_to_single_calls_once(project):
+    slides = make_slides(project, 12)
+    provider = FakeProvider(fail=True)
+    service = make_service(provider)
+    batches = service._plan_batches(slides, {})
+    assert len(batches) > 1
+
+    results = asyncio.run(service.generate_slides_content(slides, {}))
+    assert set(results) == {slide.id for slide in slides}
+    # 배치마다 한 번 + 슬라이드마다 한 번 (나눠서 다시 요청하지 않음)
+    assert len(provider.calls) == len(batches) + len(slides)
+
+
+def test_missing_entries_are_split_and_retried(project):
+    slides = make_slides(project, 5, ["message_only"])
+    provider = FakeProvider(drop=1)
+    service = make_service(provider)
+    assert len(service._plan_batches(slides, {})) == 1
+
+    results = asyncio.run(service.generate_slides_content(slides, {}))
+    assert set(results) == {slide.id for slide in slides}
+    fallback = service._get_fallback_content(slides[0]).generation_notes
+    assert all(result.generation_notes != fallback for result in results.values())
+    # 5장 배치 -> 빠진 1장만 다시 요청
+    assert len(provider.calls) == 2
@@ -0,0 +1,129 @@
+"""
+비동기 작업 큐 - 실행/취소/long-poll, 재시작 복구, 보관 기간 정리
+"""
+import asyncio
+import os
+from datetime import datetime, timedelta
+
+from app.infrastructure.jobs import JobManager, JobRecord, JobStore
+
+
+def make_manager(directory, **kwargs) -> JobManager:
+    manager = JobManager(JobStore(str(directory)), workers=2, **kwargs)
+
+    @manager.handler("echo")
+    async def echo(ctx):
+        ctx.update_progress(step="start")
+        await asyncio.sleep(ctx.payload.get("delay", 0))
+        return {"value": ctx.payload["value"]}
+
+    @manager.handler("fail")
+    async def fail(ctx):
+        raise RuntimeError("실패")
+
+    @manager.handler("artifact", resumable=False)
+    async def artifact(ctx):
+        return {"artifact": await ctx.save_artifact("out.bin", b"data")}
+
+    return manager
+
+
+async def wait_finished(manager: JobManager, job_id: str) -> JobRecord:
+    job = manager.get(job_id)
+    while not job.finished:
+        job = await manager.wait(job_id, job.version, timeout=1.0)
+    return job
+
+
+def test_jobs_run_and_persist(tmp_path):
+    async def main():
+        manager = make_manager(tmp_path)
+        ok = manager.submit("echo", "user", {"value": 1})
+        failed = manager.submit("fail", "user", {})
+        assert (await wait_finished(manager, ok.id)).result == {"value": 1}
+        job = await wait_finished(manager, failed.id)
+        assert job.state == "failed"
+        assert job.error == "실패"
+        await manager.aclose()
+
+        reloaded = JobStore(str(tmp_path))
+        states = {job.id: job.state for job in reloaded.load()}
+        assert states == {ok.id: "succeeded", failed.id: "failed"}
+
+    asyncio.run(main())
+
+
+def test_cancel_running_job(tmp_path):
+    async def main():
+        manager = make_manager(tmp_path)
+        job = manager.submit("echo", "user", {"value": 1, "delay": 10})
+        while manager.get(job.id).state != "running":
+            await asyncio.sleep(0.001)
+        manager.cancel(job.id)
+        assert (await wait_finished(manager, job.id)).state == "cancelled"
+        await manager.aclose()
+
+    asyncio.run(main())
+
+
+def test_long_poll_times_out_without_changes(tmp_path):
+    async def main():
+        manager = make_manager(tmp_path)
+        job = manager.submit("echo", "user", {"value": 1})
+        finished = await wait_finished(manager, job.id)
+        same = await manager.wait(job.id, finished.version, timeout=0.01)
+        assert same.version == finished.version
+        await manager.aclose()
+
+    asyncio.run(main())
+
+
+def test_recover_after_restart(tmp_path):
+    store = JobStore(str(tmp_path))
+    running = JobRecord(kind="echo", user_id="user", payload={"value": 1}, state="running")
+    queued = JobRecord(kind="echo", user_id="user", payload={"value": 2})
+    not_resumable = JobRecord(kind="artifact", user_id="user", payload={})
+    for job in (running, queued, not_resumable):
+        store.save(job)
+
+    async def main():
+        manager = make_manager(tmp_path)
+        manager.start()
+        assert manager.get(running.id).state == "failed"
+        assert manager.get(not_resumable.id).state == "failed"
+        assert (await wait_finished(manager, queued.id)).result == {"value": 2}
+        await manager.aclose()
+
+    asyncio.run(main())
+
+
+def test_cleanup_removes_expired_jobs_and_artifacts(tmp_path):
+    async def main():
+        manager = make_manager(tmp_path, retention_seconds=3600)
+        job = manager.submit("artifact", "user", {})
+        job = await wait_finished(manager, job.id)
+        artifact = manager.store.artifact_path(job.id, "out.bin")
+        assert os.path.exists(artifact)
+
+        assert manager.cleanup() == 0
+        job.finished_at = (datetime.utcnow() - timedelta(hours=2)).isoformat()
+        assert manager.cleanup() == 1
+        assert manager.get(job.id) is None
+        await manager.aclose()
+        assert not os.path.exists(artifact)
+        assert not os.path.exists(os.path.join(tmp_path, f"{job.id}.json"))
+
+    asyncio.run(main())
+
+
+def test_store_writes_latest_record_only(tmp_path):
+    async def main():
+        store = JobStore(str(tmp_path))
+        job = JobRecord(kind="echo", user_id="user", payload={})
+        for version in range(20):
+            job.version = version
+            store.save(job)
+        await store.flush()
+        assert JobStore(str(tmp_path)).load()[0].version == 19
+
+    asyncio.run(main())
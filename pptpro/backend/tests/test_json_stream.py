@@ -0,0 +1,76 @@
+"""
+LLM JSON 응답 파서 - 코드 블록 제거, 증분 파싱, 잘린 JSON 복구
+"""
+import json
+
+import pytest
+
+from app.infrastructure.json_stream import (
+    IncrementalJSONParser,
+    format_path,
+    parse_llm_json,
+    parse_path,
+    schema_fields,
+    strip_code_fence,
+)
+
+DOCUMENT = {
+    "title": "제목 \"인용\"",
+    "outline": [{"order": 1, "title": "하나"}, {"order": 2, "title": "둘", "tags": ["a", "b"]}],
+    "components": {"main_message": "메시지", "count": 3, "ok": True, "missing": None},
+}
+
+
+def test_strip_code_fence():
+    assert strip_code_fence('```json\n{"a": 1}\n```') == '{"a": 1}'
+    assert strip_code_fence('```json\n{"a": 1}') == '{"a": 1}'
+    assert strip_code_fence('  {"a": 1}  ') == '{"a": 1}'
+
+
+@pytest.mark.parametrize("path", [("outline", 0, "title"), ("components",), ("cases", 12, "description")])
+def test_path_round_trip(path):
+    assert parse_path(format_path(path)) == path
+
+
+def test_schema_fields():
+    assert schema_fields({"a": "string", "b": {"c": "int"}}) == ["a", "b.c"]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 17, 10_000])
+def test_incremental_events_match_document(chunk_size):
+    text = "설명 문장\n```json\n" + json.dumps(DOCUMENT, ensure_ascii=False) + "\n```"
+    parser = IncrementalJSONParser()
+    events = []
+    for start in range(0, len(text), chunk_size):
+        events.extend(parser.feed(text[start:start + chunk_size]))
+    assert parser.done
+    assert parser.finish() == (DOCUMENT, True)
+    values = dict(events)
+    assert values[("title",)] == DOCUMENT["title"]
+    assert values[("outline", 1)] == DOCUMENT["outline"][1]
+    assert values[("components", "count")] == 3
+    assert values[("components", "missing")] is None
+
+
+def test_truncated_stream_is_salvaged():
+    text = json.dumps(DOCUMENT, ensure_ascii=False)
+    cut = text.index('"둘"')
+    result = parse_llm_json(text[:cut], ["title", "outline", "components.main_message"])
+    assert not result.complete
+    assert result.data["title"] == DOCUMENT["title"]
+    assert result.data["outline"][0] == DOCUMENT["outline"][0]
+    assert "components.main_message" in result.missing_fields
+    assert "outline" in result.missing_fields
+
+
+def test_complete_response_reports_missing_fields():
+    result = parse_llm_json('```json\n{"title": "t"}\n```', ["title", "outline"])
+    assert result.complete
+    assert result.data == {"title": "t"}
+    assert result.missing_fields == ["outline"]
+
+
+def test_non_object_root():
+    result = parse_llm_json("[1, 2]", ["title"])
+    assert result.data == {}
+    assert not result.complete
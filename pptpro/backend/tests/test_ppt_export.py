@@ -0,0 +1,63 @@
+"""
+PPT 내보내기 저장 - 슬라이드를 렌더링하는 즉시 zip에 쓰는 경로가 python-pptx 저장 결과와 같은지
+"""
+import io
+import zipfile
+
+import pytest
+from pptx import Presentation
+
+from app.infrastructure.render_pool import SlideRenderPool
+from app.infrastructure.zip_package import ParallelZipWriter
+from app.services.ppt_generation import PPTGenerationService, _SlideSpooler
+from app.services.slide_part_cache import SlidePartCache
+from tests.decks import build_slides, package_contents
+
+
+def public_save(service: PPTGenerationService, project, slides) -> bytes:
+    """spooler 없이 렌더링해 python-pptx 공개 저장 경로(prs.save)로 저장"""
+    buffer = io.BytesIO()
+    service._render(project, slides).save(buffer)
+    return buffer.getvalue()
+
+
+def assert_valid_package(data: bytes) -> None:
+    with zipfile.ZipFile(io.BytesIO(data)) as package:
+        names = package.namelist()
+        assert package.testzip() is None
+        assert all(package.read(name) for name in names if name.startswith("ppt/slides/slide"))
+    assert len(names) == len(set(names))
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_streamed_package_matches_public_save(project, parallel):
+    slides = build_slides(project, 30)
+    with SlideRenderPool(1) as pool:
+        service = PPTGenerationService(
+            slide_cache=None, slide_pool=pool, parallel_min_slides=1 if parallel else 0, compression="default"
+        )
+        streamed = service.generate_ppt(project, slides).getvalue()
+        assert pool.stats()["started"] is parallel
+    assert_valid_package(streamed)
+    assert package_contents(streamed) == package_contents(public_save(service, project, slides))
+    assert len(Presentation(io.BytesIO(streamed)).slides) == len(slides) + 2
+
+
+def test_cached_slides_are_written_once(project):
+    """캐시한 슬라이드 XML을 붙여 넣어도 슬라이드/차트 파트가 두 번 기록되지 않음"""
+    slides = build_slides(project, 12)
+    service = PPTGenerationService(slide_cache=SlidePartCache(64 * 1024 * 1024))
+    first = service.generate_ppt(project, slides).getvalue()
+    second = service.generate_ppt(project, slides).getvalue()
+    assert_valid_package(second)
+    assert package_contents(first) == package_contents(second)
+
+
+def test_spooled_presentation_refuses_public_save(project):
+    """이미 zip에 쓴 슬라이드는 내용이 없으므로 prs.save로 빈 파트를 쓰지 않고 실패"""
+    service = PPTGenerationService(slide_cache=None)
+    with ParallelZipWriter(io.BytesIO()) as zip_writer:
+        prs = service._render(project, build_slides(project, 3), spooler=_SlideSpooler(zip_writer))
+        service._write_package(prs, zip_writer)
+    with pytest.raises(RuntimeError):
+        prs.save(io.BytesIO())
@@ -0,0 +1,41 @@
+"""
+이전 파일 패치 - 바뀐 슬라이드 XML만 교체한 결과가 전체 렌더링 결과와 같은지
+"""
+import os
+
+from app.services.ppt_generation import ExportManifest, PPTGenerationService
+from tests.decks import build_slides, edit_slides, package_contents
+
+
+def test_patch_matches_full_render(project, tmp_path):
+    # 차트 슬라이드는 다른 파트를 참조해 XML만 교체할 수 없으므로 제외
+    slides = [slide for slide in build_slides(project, 12) if slide.template_type != "chart_insight"]
+    service = PPTGenerationService(slide_cache=None)
+    previous = service.generate_ppt(project, slides).getvalue()
+    edited = edit_slides(slides, 2)
+    changed = ExportManifest.build("", project, slides).changed_slide_ids(ExportManifest.build("", project, edited))
+    assert changed == {slide.id for slide in edited[:2]}
+
+    path = os.path.join(tmp_path, "patched.pptx")
+    assert service.patch_ppt(previous, edited, changed, path)
+    with open(path, "rb") as f:
+        patched = f.read()
+    assert package_contents(patched) == package_contents(service.generate_ppt(project, edited).getvalue())
+
+
+def test_manifest_rejects_structure_changes(project):
+    slides = build_slides(project, 6)
+    manifest = ExportManifest.build("", project, slides)
+    assert manifest.changed_slide_ids(ExportManifest.build("", project, slides)) == set()
+    assert manifest.changed_slide_ids(ExportManifest.build("", project, slides[:-1])) is None
+    assert manifest.changed_slide_ids(ExportManifest.build("", project, slides, "store")) is None
+
+
+def test_changed_chart_slide_needs_full_render(project, tmp_path):
+    slides = build_slides(project, 6)
+    service = PPTGenerationService(slide_cache=None)
+    previous = service.generate_ppt(project, slides).getvalue()
+    chart_slide = next(slide for slide in slides if slide.template_type == "chart_insight")
+    path = os.path.join(tmp_path, "patched.pptx")
+    assert not service.patch_ppt(previous, slides, {chart_slide.id}, path)
+    assert not os.path.exists(path)
@@ -0,0 +1,33 @@
+"""
+XML 직접 렌더러 - python-pptx 렌더러(PPTTemplateRenderer)와 슬라이드 XML/저장 결과가 같은지
+"""
+import io
+
+import pytest
+from lxml import etree
+
+from tests.decks import EDGE_CASE_CONTENTS, TEMPLATE_TYPES, build_slides, package_contents, render_slides
+
+
+def save(prs) -> bytes:
+    buffer = io.BytesIO()
+    prs.save(buffer)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def rendered(project):
+    # 템플릿 6종을 두 번씩 + 경계 사례
+    slides = build_slides(project, 2 * len(TEMPLATE_TYPES))
+    return {engine: render_slides(engine, project, slides) for engine in ("pptx", "xml")}
+
+
+def test_slide_xml_matches(rendered):
+    expected, actual = rendered["pptx"].slides, rendered["xml"].slides
+    assert len(expected) == len(actual) == 2 * len(TEMPLATE_TYPES) + len(EDGE_CASE_CONTENTS) + 2
+    for index, (expected_slide, actual_slide) in enumerate(zip(expected, actual), start=1):
+        assert etree.tostring(actual_slide._element) == etree.tostring(expected_slide._element), f"슬라이드 {index}"
+
+
+def test_saved_package_matches(rendered):
+    assert package_contents(save(rendered["xml"])) == package_contents(save(rendered["pptx"]))
@@ -0,0 +1,54 @@
+"""
+python-pptx 내부 API 확인 - presentation_cache와 ppt_generation이 쓰는 비공개 속성/메서드가 그대로인지
+
+python-pptx 버전을 올려 여기가 실패하면 해당 코드를 새 버전에 맞게 고친 뒤 pyproject의 버전 고정을 바꾼다.
+"""
+import inspect
+
+import pptx
+from pptx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
+from pptx.opc.package import Part, XmlPart, _Relationship, _Relationships
+from pptx.opc.serialized import PackageWriter
+
+from app.services.presentation_cache import presentation_cache
+
+
+def parameters(function) -> list:
+    return list(inspect.signature(function).parameters)
+
+
+def test_tested_version():
+    assert pptx.__version__.startswith("1.0."), pptx.__version__
+
+
+def test_part_constructors():
+    # presentation_cache._rebuild, _SpooledPart
+    assert parameters(XmlPart.__init__) == ["self", "partname", "content_type", "package", "element"]
+    assert parameters(Part.__init__) == ["self", "partname", "content_type", "package", "blob"]
+
+
+def test_relationships():
+    # presentation_cache._copy_rels, _SlideSpooler, _add_slide_xmls
+    assert parameters(_Relationship.__init__) == ["self", "base_uri", "rId", "reltype", "target_mode", "target"]
+    prs = presentation_cache.copy()
+    rels = prs.part.rels
+    assert isinstance(rels, _Relationships)
+    assert isinstance(rels._rels, dict)
+    assert isinstance(prs.part.package._rels, _Relationships)
+    assert all(rel._target_mode in (RTM.INTERNAL, RTM.EXTERNAL) for rel in rels.values())
+    assert parameters(rels._add_relationship)[:2] == ["reltype", "target"]
+
+
+def test_slide_id_list():
+    # _add_slide_xmls
+    sld_id_lst = presentation_cache.copy().slides._sldIdLst
+    assert isinstance(sld_id_lst._next_id, int)
+    sld_id = sld_id_lst._add_sldId(id=sld_id_lst._next_id, rId="rId99")
+    assert sld_id.rId == "rId99"
+
+
+def test_package_writer_steps():
+    # PPTGenerationService._write_package
+    assert parameters(PackageWriter.__init__) == ["self", "pkg_file", "pkg_rels", "parts"]
+    for name in ("_write_content_types_stream", "_write_pkg_rels", "_write_parts"):
+        assert parameters(getattr(PackageWriter, name)) == ["self", "phys_writer"], name
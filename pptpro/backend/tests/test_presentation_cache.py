@@ -0,0 +1,21 @@
+"""
+기본 Presentation 캐시 - 내보내기마다 건네는 사본이 서로, 그리고 원본과 독립적인지
+"""
+from app.services.presentation_cache import presentation_cache
+
+
+def test_copies_are_independent():
+    first, second = presentation_cache.copy(), presentation_cache.copy()
+    first.slides.add_slide(first.slide_layouts[5])
+    assert len(first.slides) == 1
+    assert len(second.slides) == 0
+    assert len(presentation_cache.copy().slides) == 0
+
+
+def test_only_masters_and_layouts_are_shared():
+    first, second = presentation_cache.copy(), presentation_cache.copy()
+    assert first.part._element is not second.part._element
+    first.core_properties.title = "변경"
+    assert second.core_properties.title != "변경"
+    # 렌더링 중 수정하지 않는 레이아웃은 원본 공유
+    assert first.slide_layouts[5].part is second.slide_layouts[5].part
@@ -0,0 +1,134 @@
+"""
+LLM 호출 속도 제한 - 토큰 버킷, AIMD 동시성 창, 우선순위 대기열
+"""
+import asyncio
+
+import pytest
+
+from app.infrastructure.rate_limiter import (
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    AdaptiveConcurrency,
+    LLMRateLimiter,
+    RateLimitTimeout,
+    TokenBucket,
+    llm_call_priority,
+)
+
+
+def make_limiter(concurrency: int = 1, rpm: int = 6000, tpm: int = 1_000_000, timeout: float = 1.0) -> LLMRateLimiter:
+    return LLMRateLimiter(rpm, tpm, AdaptiveConcurrency(concurrency, 1, concurrency), timeout)
+
+
+def test_token_bucket_delay():
+    bucket = TokenBucket(60)
+    assert bucket.delay(60) == 0
+    bucket.take(60)
+    assert bucket.delay(1) == pytest.approx(1.0, abs=0.05)
+    # 용량보다 큰 요청은 버킷이 가득 찼을 때 허용
+    assert bucket.delay(1000) == pytest.approx(60.0, abs=0.1)
+
+
+def test_aimd_window():
+    concurrency = AdaptiveConcurrency(4, 1, 8, cooldown_seconds=0)
+    concurrency.on_success(0.1)
+    assert concurrency.limit == pytest.approx(4.25)
+    concurrency.on_overload()
+    assert concurrency.limit == pytest.approx(2.125)
+    concurrency.on_success(10.0)  # 평소 지연의 2.5배 초과
+    assert concurrency.counters["latency_spikes"] == 1
+    assert concurrency.limit >= concurrency.minimum
+
+
+def test_latency_baseline_per_size():
+    concurrency = AdaptiveConcurrency(4, 1, 8, cooldown_seconds=0)
+    short, long = AdaptiveConcurrency.size_bucket(300), AdaptiveConcurrency.size_bucket(4000)
+    assert short != long
+    concurrency.on_success(0.5, short)
+    # 긴 응답은 짧은 응답의 평소 지연과 비교하지 않음
+    concurrency.on_success(5.0, long)
+    concurrency.on_success(5.5, long)
+    assert concurrency.counters["latency_spikes"] == 0
+    concurrency.on_success(2.0, short)
+    assert concurrency.counters["latency_spikes"] == 1
+
+
+def test_permit_records_latency_by_output_tokens():
+    async def main():
+        limiter = make_limiter()
+        async with limiter.acquire(1200, output_tokens=1000):
+            pass
+        assert list(limiter.stats()["baseline_latency_ms"]) == [1024]
+
+    asyncio.run(main())
+
+
+def test_permits_are_limited_and_released():
+    async def main():
+        limiter = make_limiter(concurrency=2)
+        active, peak = 0, 0
+
+        async def call():
+            nonlocal active, peak
+            async with limiter.acquire(10):
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(call() for _ in range(6)))
+        assert peak == 2
+        assert limiter.concurrency.in_flight == 0
+        assert limiter.stats()["admitted"] == 6
+
+    asyncio.run(main())
+
+
+def test_priority_order():
+    async def main():
+        limiter = make_limiter()
+        order = []
+
+        async def call(name, priority=None):
+            async with limiter.acquire(1, priority=priority):
+                order.append(name)
+                await asyncio.sleep(0.005)
+
+        holder = asyncio.ensure_future(call("first"))
+        await asyncio.sleep(0)
+        with llm_call_priority(PRIORITY_LOW):
+            low = asyncio.ensure_future(call("low"))
+        await asyncio.sleep(0)
+        high = asyncio.ensure_future(call("high", PRIORITY_HIGH))
+        await asyncio.gather(holder, low, high)
+        assert order == ["first", "high", "low"]
+
+    asyncio.run(main())
+
+
+def test_queue_timeout():
+    async def main():
+        limiter = make_limiter(timeout=0.02)
+        async with limiter.acquire(1):
+            with pytest.raises(RateLimitTimeout):
+                async with limiter.acquire(1):
+                    pass
+        assert limiter.stats()["timeouts"] == 1
+        assert limiter.stats()["waiting"] == 0
+        # 시간 초과한 대기자가 대기열에 남지 않음
+        async with limiter.acquire(1):
+            pass
+
+    asyncio.run(main())
+
+
+def test_tokens_per_minute_delay():
+    async def main():
+        limiter = make_limiter(tpm=60 * 100, timeout=0.05)
+        async with limiter.acquire(6000) as permit:
+            permit.record_tokens(6000)
+        with pytest.raises(RateLimitTimeout):
+            async with limiter.acquire(500):
+                pass
+
+    asyncio.run(main())
@@ -0,0 +1,82 @@
+"""
+Single-flight - 같은 키의 동시 요청을 하나의 실행으로 합치기
+"""
+import asyncio
+
+import pytest
+
+from app.infrastructure.single_flight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    async def main():
+        flight = SingleFlight()
+        calls = []
+
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "결과"
+
+        results = await asyncio.gather(*(flight.do("key", work) for _ in range(5)))
+        assert results == ["결과"] * 5
+        assert calls == [1]
+        assert flight.stats() == {"executions": 1, "coalesced": 4, "in_flight": 0}
+
+        # 끝난 뒤에는 다시 실행
+        assert await flight.do("key", work) == "결과"
+        assert len(calls) == 2
+
+    asyncio.run(main())
+
+
+def test_cancelled_caller_does_not_cancel_others():
+    async def main():
+        flight = SingleFlight()
+        started = asyncio.Event()
+
+        async def work():
+            started.set()
+            await asyncio.sleep(0.02)
+            return 42
+
+        first = asyncio.ensure_future(flight.do("key", work))
+        await started.wait()
+        second = asyncio.ensure_future(flight.do("key", work))
+        first.cancel()
+        assert await second == 42
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    asyncio.run(main())
+
+
+def test_submit_claims_key_before_awaiting():
+    async def main():
+        flight = SingleFlight()
+
+        async def work():
+            return "값"
+
+        task = flight.submit("key", work)
+        assert flight.in_flight("key")
+        assert flight.submit("key", work) is task
+        assert await asyncio.shield(task) == "값"
+        assert not flight.in_flight("key")
+
+    asyncio.run(main())
+
+
+def test_errors_reach_every_caller():
+    async def main():
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0)
+            raise ValueError("실패")
+
+        results = await asyncio.gather(flight.do("key", work), flight.do("key", work), return_exceptions=True)
+        assert all(isinstance(result, ValueError) for result in results)
+        assert not flight.in_flight("key")
+
+    asyncio.run(main())
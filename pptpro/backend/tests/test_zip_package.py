@@ -0,0 +1,70 @@
+"""
+zip 패키지 쓰기 - 병렬 압축 기록, 압축된 항목 그대로 복사
+"""
+import io
+import os
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.infrastructure.zip_package import COMPRESSION_PROFILES, ParallelZipWriter, copy_member_raw
+
+# 작은 XML과 스레드 풀로 넘어가는 큰 항목을 섞음
+MEMBERS = [
+    (f"ppt/slides/slide{i}.xml", (b"<p:sld>%d</p:sld>" % i) * (1 + (i % 7) * 20000)) for i in range(24)
+] + [("ppt/media/image1.bin", os.urandom(200_000))]
+
+
+@pytest.mark.parametrize("profile", sorted(COMPRESSION_PROFILES))
+@pytest.mark.parametrize("threads", [0, 3])
+def test_members_are_written_in_order(profile, threads):
+    buffer = io.BytesIO()
+    executor = ThreadPoolExecutor(threads) if threads else None
+    try:
+        with ParallelZipWriter(buffer, profile, executor, window=4) as writer:
+            for name, data in MEMBERS:
+                writer.write(name, data)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    with zipfile.ZipFile(buffer) as package:
+        assert package.testzip() is None
+        assert [(name, package.read(name)) for name in package.namelist()] == MEMBERS
+        assert {info.compress_type for info in package.infolist()} == {COMPRESSION_PROFILES[profile][0]}
+
+
+def test_unknown_profile():
+    with pytest.raises(ValueError):
+        ParallelZipWriter(io.BytesIO(), "bogus")
+
+
+def test_error_discards_pending_members():
+    buffer = io.BytesIO()
+    with ThreadPoolExecutor(2) as executor:
+        with pytest.raises(RuntimeError):
+            with ParallelZipWriter(buffer, "default", executor, min_parallel_bytes=0) as writer:
+                writer.write("first.xml", b"a" * 1000)
+                writer.write("second.xml", b"b" * 1000)
+                raise RuntimeError("중단")
+    with zipfile.ZipFile(buffer) as package:
+        assert package.testzip() is None
+
+
+def test_copy_member_raw():
+    source_buffer = io.BytesIO()
+    with ParallelZipWriter(source_buffer, "max") as writer:
+        for name, data in MEMBERS[:3]:
+            writer.write(name, data)
+    target_buffer = io.BytesIO()
+    with zipfile.ZipFile(source_buffer) as source, ParallelZipWriter(target_buffer, "store") as writer:
+        writer.write("first.xml", b"first")
+        for info in source.infolist():
+            copy_member_raw(source, writer._zip, info)
+        writer.write("last.xml", b"last")
+    with zipfile.ZipFile(target_buffer) as package:
+        assert package.testzip() is None
+        assert package.namelist() == ["first.xml"] + [name for name, _ in MEMBERS[:3]] + ["last.xml"]
+        assert package.read(MEMBERS[1][0]) == MEMBERS[1][1]
+        # 복사한 항목은 원래 압축 방식 유지
+        assert package.getinfo(MEMBERS[1][0]).compress_type == zipfile.ZIP_DEFLATED